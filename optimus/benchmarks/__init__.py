@@ -0,0 +1 @@
+from optimus.benchmarks.benchmark import Benchmark, compare
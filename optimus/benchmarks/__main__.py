@@ -0,0 +1,51 @@
+"""
+Run the benchmarks and save the results in a json file:
+    python -m optimus.benchmarks run results.json --engines pandas dask --rows 100000
+
+Compare the results of two commits:
+    python -m optimus.benchmarks compare baseline.json results.json
+"""
+import argparse
+import sys
+
+from optimus.benchmarks.benchmark import Benchmark, compare
+from optimus.benchmarks.datasets import DATASETS
+from optimus.benchmarks.scenarios import SCENARIOS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m optimus.benchmarks")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("output", help="Json file where the results will be saved")
+    run_parser.add_argument("--engines", nargs="+", default=["pandas", "dask", "polars"])
+    run_parser.add_argument("--n-partitions", type=int, default=4, help="Partitions used by distributed engines")
+    run_parser.add_argument("--datasets", nargs="+", choices=DATASETS)
+    run_parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS.keys()))
+    run_parser.add_argument("--rows", type=int)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--path", help="Folder where the datasets are generated")
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=1.2)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        configs = [{"engine": engine, "n_partitions": args.n_partitions} if engine.startswith("dask")
+                   else {"engine": engine} for engine in args.engines]
+        Benchmark(configs, args.datasets, args.scenarios, args.rows, args.repeat, args.path).run(args.output)
+
+    elif args.command == "compare":
+        regressions = compare(args.baseline, args.current, args.threshold)
+        for r in regressions:
+            print(f"{r['engine']} {r['dataset']} {r['scenario']}: "
+                  f"{r['baseline']:.4f}s -> {r['current']:.4f}s ({r['ratio']:.2f}x)")
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+import datetime
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import timeit
+
+from optimus.benchmarks.datasets import DATASETS, generate
+from optimus.benchmarks.scenarios import SCENARIOS
+from optimus.helpers.decorators import uniques_cache
+from optimus.helpers.json import json_converter
+from optimus.helpers.logger import logger
+
+DEFAULT_CONFIGS = [{"engine": "pandas"}, {"engine": "dask", "n_partitions": 4}, {"engine": "polars"}]
+
+
+class Benchmark:
+
+    def __init__(self, configs=None, datasets=None, scenarios=None, rows=None, repeat=3, path=None):
+        """
+        Time the core Optimus operations over synthetic datasets.
+        :param configs: Array of dictionaries with:
+            engine: Engine to use.
+            n_partitions: Number of partitions of loaded dataframes (if supported)
+        :param datasets: Name or list of names from optimus.benchmarks.datasets.DATASETS
+        :param scenarios: Name or list of names from optimus.benchmarks.scenarios.SCENARIOS
+        :param rows: Number of rows of every dataset. Uses the dataset default if None.
+        :param repeat: Number of times every scenario is timed.
+        :param path: Folder where the datasets and the temporary outputs are saved.
+        """
+        self.configs = configs or DEFAULT_CONFIGS
+        self.datasets = [datasets] if isinstance(datasets, str) else datasets or DATASETS
+        self.scenarios = [scenarios] if isinstance(scenarios, str) else scenarios or list(SCENARIOS.keys())
+        self.rows = rows
+        self.repeat = repeat
+        self.path = path or os.path.join(tempfile.gettempdir(), "optimus_benchmarks")
+
+    @staticmethod
+    def _commit():
+        try:
+            return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                           stderr=subprocess.DEVNULL).decode().strip()
+        except Exception:
+            return None
+
+    def _time(self, func, op, load, paths):
+        """
+        Time 'func' 'repeat' times. Every run gets a dataframe loaded again and an empty uniques cache, so the
+        inferred types, profiler metadata and cached values of a run do not make the next ones faster.
+        :param func: Scenario function which receives op, df and paths.
+        :param load: Function returning a new dataframe. It is not timed.
+        """
+        timings = []
+        for _ in range(self.repeat):
+            df = load()
+            uniques_cache.clear()
+            start_time = timeit.default_timer()
+            func(op, df, paths)
+            timings.append(timeit.default_timer() - start_time)
+
+        return {"min": min(timings), "mean": sum(timings) / len(timings), "repeat": len(timings)}
+
+    def run(self, output=None) -> dict:
+        """
+        Run every scenario for every engine and dataset.
+        :param output: Path to a json file where the results will be saved.
+        :return: dict with the form {engine: {dataset: {scenario: {"min": ..., "mean": ..., "repeat": ...}}}}
+        """
+        from optimus import Optimus
+        from optimus._version import __version__
+
+        results = {}
+
+        for config in self.configs:
+            engine = config["engine"]
+            n_partitions = config.get("n_partitions")
+            name = engine if n_partitions is None else f"{engine}_{n_partitions}"
+
+            try:
+                op = Optimus(engine)
+            except Exception as e:
+                logger.print(f"Skipping {name}: {e}")
+                results[name] = {"error": str(e)}
+                continue
+
+            results[name] = {}
+
+            for dataset in self.datasets:
+                kwargs = {} if n_partitions is None else {"n_partitions": n_partitions}
+                paths = {"csv": generate(dataset, self.path, self.rows), "output": os.path.join(self.path, name),
+                         "load_kwargs": kwargs}
+                os.makedirs(paths["output"], exist_ok=True)
+
+                def load():
+                    return op.load.csv(paths["csv"], **kwargs)
+
+                results[name][dataset] = {}
+
+                for scenario in self.scenarios:
+                    logger.print(f"{name} {dataset} {scenario}")
+                    try:
+                        result = self._time(SCENARIOS[scenario], op, load, paths)
+                    except Exception as e:
+                        result = {"error": f"{type(e).__name__}: {e}"}
+                    results[name][dataset][scenario] = result
+
+        results = {
+            "commit": self._commit(),
+            "date": datetime.datetime.now().isoformat(),
+            "version": __version__,
+            "python": platform.python_version(),
+            "rows": self.rows,
+            "repeat": self.repeat,
+            "results": results
+        }
+
+        if output:
+            with open(output, "w") as f:
+                json.dump(results, f, indent=2, default=json_converter)
+
+        return results
+
+
+def compare(baseline, current, threshold=1.2) -> list:
+    """
+    Compare two benchmark results and return the scenarios that are slower in the current results.
+    :param baseline: Path to a json file or dict returned by Benchmark.run.
+    :param current: Path to a json file or dict returned by Benchmark.run.
+    :param threshold: Ratio between the current and the baseline time to consider a scenario a regression.
+    :return: List of dicts with the engine, dataset, scenario, both times and the ratio between them.
+    """
+    if isinstance(baseline, str):
+        with open(baseline) as f:
+            baseline = json.load(f)
+
+    if isinstance(current, str):
+        with open(current) as f:
+            current = json.load(f)
+
+    regressions = []
+
+    for engine, datasets in current["results"].items():
+        for dataset, scenarios in datasets.items():
+            if not isinstance(scenarios, dict):
+                continue
+            for scenario, result in scenarios.items():
+                before = baseline["results"].get(engine, {}).get(dataset, {}).get(scenario, {})
+                if "min" not in result or "min" not in before or not before["min"]:
+                    continue
+                ratio = result["min"] / before["min"]
+                if ratio >= threshold:
+                    regressions.append({"engine": engine, "dataset": dataset, "scenario": scenario,
+                                        "baseline": before["min"], "current": result["min"], "ratio": ratio})
+
+    return regressions
@@ -0,0 +1,112 @@
+import os
+import string
+
+import numpy as np
+import pandas as pd
+
+DATASETS = ["tall", "wide", "high_cardinality", "dirty"]
+
+
+def _words(rng, n, cardinality, length=8):
+    letters = np.array(list(string.ascii_lowercase))
+    vocabulary = ["".join(word) for word in rng.choice(letters, size=(cardinality, length))]
+    return rng.choice(vocabulary, size=n)
+
+
+def tall(rows=1_000_000, seed=0) -> pd.DataFrame:
+    """
+    Few columns and a lot of rows.
+    :param rows: Number of rows.
+    :param seed: Random seed.
+    :return: pandas DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "price": rng.normal(100, 25, rows).round(2),
+        "quantity": rng.integers(0, 1000, rows),
+        "category": _words(rng, rows, 20),
+        "name": _words(rng, rows, 5000)
+    })
+
+
+def wide(rows=10_000, cols=500, seed=0) -> pd.DataFrame:
+    """
+    A lot of columns mixing numeric and string data types.
+    :param rows: Number of rows.
+    :param cols: Number of columns.
+    :param seed: Random seed.
+    :return: pandas DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(cols):
+        if i % 2:
+            data[f"string_{i}"] = _words(rng, rows, 100, 6)
+        else:
+            data[f"number_{i}"] = rng.normal(0, 1, rows).round(4)
+    return pd.DataFrame(data)
+
+
+def high_cardinality(rows=200_000, seed=0) -> pd.DataFrame:
+    """
+    String columns where most of the values are unique.
+    :param rows: Number of rows.
+    :param seed: Random seed.
+    :return: pandas DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "id": np.arange(rows),
+        "email": [f"{word}@{domain}.com" for word, domain in zip(_words(rng, rows, rows, 10),
+                                                                 _words(rng, rows, 50, 5))],
+        "name": _words(rng, rows, rows // 2, 12),
+        "code": _words(rng, rows, rows, 16)
+    })
+
+
+def dirty(rows=200_000, seed=0) -> pd.DataFrame:
+    """
+    Columns mixing numbers, dates, strings, nulls and extra spaces like most real world files.
+    :param rows: Number of rows.
+    :param seed: Random seed.
+    :return: pandas DataFrame
+    """
+    rng = np.random.default_rng(seed)
+    numbers = rng.normal(0, 1000, rows).round(2).astype(object)
+    numbers[rng.random(rows) < 0.1] = "n/a"
+    numbers[rng.random(rows) < 0.05] = None
+
+    dates = pd.date_range("2000-01-01", periods=rows, freq="h").strftime("%Y-%m-%d").values.astype(object)
+    dates[rng.random(rows) < 0.1] = "not a date"
+
+    names = _words(rng, rows, 1000).astype(object)
+    spaces = rng.random(rows) < 0.2
+    names[spaces] = [f"  {name.upper()} " for name in names[spaces]]
+
+    return pd.DataFrame({"number": numbers, "date": dates, "name": names,
+                         "zip": rng.integers(10000, 99999, rows).astype(str)})
+
+
+def generate(name, path, rows=None, seed=0) -> str:
+    """
+    Write a synthetic dataset to a csv file if it does not exist.
+    :param name: One of "tall", "wide", "high_cardinality" or "dirty".
+    :param path: Folder where the file will be saved.
+    :param rows: Number of rows. Uses the dataset default if None.
+    :param seed: Random seed.
+    :return: Path to the csv file.
+    """
+    if name not in DATASETS:
+        raise ValueError(f"'{name}' is not a valid dataset, use one of {DATASETS}")
+
+    filename = os.path.join(path, f"{name}_{rows or 'default'}_{seed}.csv")
+
+    if not os.path.exists(filename):
+        os.makedirs(path, exist_ok=True)
+        kwargs = {"seed": seed}
+        if rows is not None:
+            kwargs["rows"] = rows
+        globals()[name](**kwargs).to_csv(filename, index=False)
+
+    return filename
@@ -0,0 +1,62 @@
+import os
+
+# Every scenario receives the engine instance, a loaded dataframe and a dict with the paths used by the benchmark and
+# the keyword arguments used to load the dataset, like the number of partitions, in "load_kwargs".
+# Scenarios must return computed values, operations that return dataframes call compute() so lazy engines like Dask
+# run the whole graph inside the timed block.
+
+
+def load_csv(op, df, paths):
+    return op.load.csv(paths["csv"], **paths.get("load_kwargs", {})).compute()
+
+
+def profile(op, df, paths):
+    return df.profile("*", flush=True)
+
+
+def infer_type(op, df, paths):
+    return df.cols.infer_type("*", tidy=False)
+
+
+def frequency(op, df, paths):
+    return df.cols.frequency(df.cols.names("*", data_types=df.constants.STRING_TYPES), n=10)
+
+
+def hist(op, df, paths):
+    return df.cols.hist(df.cols.names("*", data_types=df.constants.NUMERIC_INTERNAL_TYPES), buckets=20)
+
+
+def pattern_counts(op, df, paths):
+    return df.cols.pattern_counts(df.cols.names("*", data_types=df.constants.STRING_TYPES), n=10, flush=True)
+
+
+def string_clustering(op, df, paths):
+    cols = df.cols.names("*", data_types=df.constants.STRING_TYPES)
+    return df.string_clustering(cols[0], algorithm="fingerprint")
+
+
+def rows_sort(op, df, paths):
+    return df.rows.sort(df.cols.names()[0]).compute()
+
+
+def cols_replace(op, df, paths):
+    cols = df.cols.names("*", data_types=df.constants.STRING_TYPES)
+    return df.cols.replace(cols, search=["a", "e"], replace_by="_", search_by="chars").compute()
+
+
+def save_parquet(op, df, paths):
+    return df.save.parquet(os.path.join(paths["output"], "benchmark.parquet"))
+
+
+SCENARIOS = {
+    "load.csv": load_csv,
+    "profile": profile,
+    "infer_type": infer_type,
+    "frequency": frequency,
+    "hist": hist,
+    "pattern_counts": pattern_counts,
+    "string_clustering": string_clustering,
+    "rows.sort": rows_sort,
+    "cols.replace": cols_replace,
+    "save.parquet": save_parquet
+}
@@ -13,18 +13,58 @@ from optimus.engines.base.io.save import *
 from optimus.engines.base.mask import Mask
 from optimus.engines.base.ml.encoding import BaseEncoding
 from optimus.engines.base.ml.models import BaseML
+from optimus.engines.base import sample
+from optimus.engines.base.plan import Plan
 from optimus.engines.base.rows import *
 from optimus.helpers.check import is_notebook
 from optimus.helpers.constants import RELATIVE_ERROR
-from optimus.helpers.functions import df_dicts_equal, absolute_path, reduce_mem_usage
+from optimus.helpers.functions import df_dicts_equal, absolute_path, random_int, reduce_mem_usage
 from optimus.helpers.json import json_converter
 from optimus.helpers.output import print_html
+from optimus.helpers.raiseit import RaiseIt
+from optimus.infer import is_int
 from optimus.outliers.outliers import Outliers
-from optimus.plots.functions import plot_hist, plot_frequency
 from optimus.plots.plots import Plot
+from optimus.plots.render import render_base64
 from optimus.profiler.constants import MAX_BUCKETS
 from optimus.profiler.templates.html import HEADER, FOOTER
 
+MOMENTS_AGGREGATIONS = ["sum", "mean", "var", "std"]
+
+
+def _from_moments(aggregation, count, total, m2):
+    """
+    Calculate the sum, mean, unbiased variance or standard deviation from the count, sum and sum of squared
+    deviations from the mean of a series
+    :param aggregation: "sum", "mean", "var" or "std"
+    :return:
+    """
+    if aggregation == "sum":
+        return float(total)
+
+    if aggregation == "mean":
+        return float(total / count) if count else np.nan
+
+    if count < 2:
+        return np.nan
+
+    var = float(m2 / (count - 1))
+    return var if aggregation == "var" else float(np.sqrt(var))
+
+
+class _PlanData:
+    """
+    Data of a dataframe with a logical plan, the pending transformations are executed when it is read. Dataframes
+    without a plan keep their data in the instance, so reading it is a plain attribute access.
+    """
+
+    def __get__(self, df, owner=None):
+        if df is None:
+            return self
+        if df.plan is not None and df.plan.pending:
+            df._data = df.plan.execute(df)
+        return df._data
+
 
 class BaseDataFrame(ABC):
     """
@@ -34,6 +74,7 @@ class BaseDataFrame(ABC):
     def __init__(self, data: 'InternalDataFrameType', op: 'EngineType', label_encoder=None):
 
         data = self._compatible_data(data)
+        self.plan = None
         self.data = data
         self.cache = {}
         self.updated = None
@@ -52,9 +93,40 @@ class BaseDataFrame(ABC):
         return data
 
     def __del__(self):
-        del self.data
+        del self._data
         del self.le
 
+    data = _PlanData()
+
+    def __setattr__(self, name, value):
+        if name == "data":
+            self._data = value
+            # cached results like the preview window belong to the replaced data
+            self.cache = {}
+            if self.plan is not None:
+                # pending transformations and column names belong to the replaced data
+                self.plan = Plan(actions=self.plan.actions)
+            else:
+                self.__dict__["data"] = value
+        else:
+            object.__setattr__(self, name, value)
+            if name == "plan":
+                if value is None:
+                    self.__dict__["data"] = self.__dict__.get("_data")
+                else:
+                    # reading the data has to execute the plan
+                    self.__dict__.pop("data", None)
+
+    @property
+    def meta(self) -> dict:
+        if self.plan is not None and self.plan.actions:
+            self._meta = self.plan.flush_actions(self._meta)
+        return self._meta
+
+    @meta.setter
+    def meta(self, value):
+        self._meta = value
+
     @property
     def root(self) -> 'DataFrameType':
         return self
@@ -94,10 +166,27 @@ class BaseDataFrame(ABC):
         df = self.__class__(dfd, op=self.op)
         if meta is not None:
             df.meta = meta
+        if self.plan is not None:
+            df.plan = Plan()
         import copy
         df.le = copy.deepcopy(self.le)
         return df
 
+    def lazy(self, lazy=True) -> 'DataFrameType':
+        """
+        Return a dataframe where the element-wise transformations are stored in a logical plan instead of being
+        executed. Transformations on the same column are fused and executed in one pass when the data is requested,
+        for example using execute(), compute(), to_dict() or save.
+        :param lazy: Set to False to get a dataframe which executes every transformation eagerly.
+        :return:
+        """
+        df = self.new(self.data, meta=self.meta)
+        if lazy:
+            df.plan = Plan()
+        else:
+            df.plan = None
+        return df
+
     def copy(self) -> 'DataFrameType':
         """
         Return a copy of a dataframe
@@ -398,6 +487,8 @@ class BaseDataFrame(ABC):
         raise NotImplementedError(f"\"visualize\" is not available using {type(self).__name__}")
 
     def execute(self) -> 'DataFrameType':
+        if self.plan is not None:
+            self._data = self.data
         return self
 
     def compute(self) -> 'InternalDataFrameType':
@@ -441,10 +532,24 @@ class BaseDataFrame(ABC):
         if n == "all":
             dfd = self.cols.select(cols).to_pandas()
         else:
-            dfd = self.cols.select(cols).iloc(0, n).to_pandas()
+            dfd = self._window(0, n)[parse_columns(self, cols)]
 
         return dfd.to_dict(orient)
 
+    def _window(self, lower_bound, upper_bound):
+        """
+        Rows of a window as a pandas DataFrame. The last window is cached so previews of the same dataframe, like
+        the ones requested by a UI, are computed only once.
+        :param lower_bound:
+        :param upper_bound:
+        :return: pandas DataFrame
+        """
+        window = self.cache.get("window")
+        if window is None or window[:2] != (lower_bound, upper_bound):
+            window = (lower_bound, upper_bound, self.iloc(lower_bound, upper_bound).to_pandas())
+            self.cache["window"] = window
+        return window[2]
+
     def columns_sample(self, cols="*") -> dict:
         """
         Return a dict of the sample of a Dataframe
@@ -461,14 +566,49 @@ class BaseDataFrame(ABC):
     def to_pandas(self):
         pass
 
-    def stratified_sample(self, col_name, seed: int = 1) -> 'DataFrameType':
+    def _sample(self, n=10, seed=0) -> 'InternalDataFrameType':
+        return sample.reservoir(self.root, n, seed).reset_index(drop=True)
+
+    def sample(self, n=10, random=False, method="reservoir") -> 'DataFrameType':
         """
-        Stratified Sampling
-        :param col_name:
-        :param seed:
+        Return a n number of sample from a dataFrame. Every row gets a random key from its index label and the seed,
+        so the same seed gives the same sample no matter the engine or the number of partitions.
+        :param n: Number of samples
+        :param random: if true get a semi random sample. An integer is used as seed
+        :param method: 'reservoir' to get a uniform sample reading every row once or 'block' to read only the
+        partitions needed
         :return:
         """
-        raise NotImplementedError(f"\"stratified_sample\" is not available using {type(self).__name__}")
+        if not is_int(n):
+            RaiseIt.type_error(n, ["int"])
+
+        if random is True:
+            seed = int(random_int())
+        elif random is False:
+            seed = 0
+        elif is_int(random):
+            seed = random
+        else:
+            RaiseIt.type_error(random, ["bool", "int"])
+
+        if method == "reservoir":
+            dfd = self._sample(n, seed)
+        elif method == "block":
+            dfd = sample.block(self.root, n, seed).reset_index(drop=True)
+        else:
+            RaiseIt.value_error(method, ["reservoir", "block"])
+
+        return self.root.new(dfd)
+
+    def stratified_sample(self, col_name, n=2, seed: int = 1) -> 'DataFrameType':
+        """
+        Stratified Sampling. Get up to n rows for every value of a column
+        :param col_name: Column with the strata
+        :param n: Number of rows for every value
+        :param seed: Integer seed
+        :return:
+        """
+        return self.root.new(sample.stratified(self.root, col_name, n, seed).reset_index(drop=True))
 
     @abstractmethod
     def _iloc(self, lower_bound, upper_bound, copy=True) -> 'DataFrameType':
@@ -500,9 +640,17 @@ class BaseDataFrame(ABC):
 
         return result
 
-    def optimize(self, categorical_threshold=50, verbose=False):
+    def optimize(self, categorical_threshold=50, verbose=False, categorical=True) -> 'DataFrameType':
+        """
+        Convert every column to the smallest data type that can hold its values, see reduce_mem_usage.
+        :param categorical_threshold: Max number of distinct values to consider a column categorical
+        :param verbose: Print the bytes saved by every column
+        :param categorical: Convert text columns with few distinct values to category
+        :return:
+        """
         df = self
-        return reduce_mem_usage(df, categorical_threshold=categorical_threshold, verbose=verbose)
+        return reduce_mem_usage(df, categorical=categorical, categorical_threshold=categorical_threshold,
+                                verbose=verbose)
 
     def run(self):
         """
@@ -926,12 +1074,32 @@ class BaseDataFrame(ABC):
 
         else:
             result = {}
+            moments = {}
+            from_moments = {}
 
+            # Every aggregation is computed in the same graph. Sum, mean, variance and standard deviation of a column
+            # are calculated from the same count, sum and sum of squared deviations
             for column, aggregations_set in aggregations:
                 aggregations_set = val_to_list(aggregations_set)
                 for aggregation in aggregations_set:
-                    result[column + "_" + aggregation] = getattr(
-                        df.cols, aggregation)(column, tidy=True)
+                    key = column + "_" + aggregation
+                    if aggregation in MOMENTS_AGGREGATIONS:
+                        if column not in moments:
+                            moments[column] = df.functions.moments(dfd[column])
+                        from_moments[key] = (aggregation, column)
+                        result[key] = None
+                    else:
+                        result[key] = getattr(df.cols, aggregation)(column, tidy=True, compute=False)
+
+            computed, moments = df.functions.compute({k: v for k, v in result.items() if k not in from_moments},
+                                                     moments)
+
+            for key in result:
+                if key in from_moments:
+                    aggregation, column = from_moments[key]
+                    result[key] = _from_moments(aggregation, *moments[column])
+                else:
+                    result[key] = computed[key]
 
             if output == "dataframe":
                 result = self.op.create.dataframe({k: [v] for k, v in result.items()})
@@ -971,36 +1139,34 @@ class BaseDataFrame(ABC):
         html = html + general_template.render(data=output)
 
         template = template_env.get_template("one_column.html")
-        # Create every column stats
-        for col_name in cols:
-            hist_pic = None
-            freq_pic = None
 
+        # Render the images of every column together from their stats
+        jobs = {}
+        for col_name in cols:
             col = output["columns"][col_name]
             if "hist" in col["stats"]:
                 hist_dict = col["stats"]["hist"]
 
                 if col["column_data_type"] == "date":
-                    hist_year = plot_hist(
-                        {col_name: hist_dict["years"]}, "base64", "years")
-                    hist_month = plot_hist(
-                        {col_name: hist_dict["months"]}, "base64", "months")
-                    hist_weekday = plot_hist(
-                        {col_name: hist_dict["weekdays"]}, "base64", "weekdays")
-                    hist_hour = plot_hist(
-                        {col_name: hist_dict["hours"]}, "base64", "hours")
-                    hist_minute = plot_hist(
-                        {col_name: hist_dict["minutes"]}, "base64", "minutes")
-                    hist_pic = {"hist_years": hist_year, "hist_months": hist_month, "hist_weekdays": hist_weekday,
-                                "hist_hours": hist_hour, "hist_minutes": hist_minute}
+                    for unit in ["years", "months", "weekdays", "hours", "minutes"]:
+                        jobs[(col_name, "hist_" + unit)] = ("hist", {col_name: hist_dict[unit]}, {"sub_title": unit})
 
                 elif col["column_data_type"] == "int" or col["column_data_type"] == "string" or col[
                     "column_data_type"] == "float":
-                    hist = plot_hist({col_name: hist_dict}, output="base64")
-                    hist_pic = {"hist_numeric_string": hist}
+                    jobs[(col_name, "hist_numeric_string")] = ("hist", {col_name: hist_dict}, {})
             if "frequency" in col:
-                freq_pic = plot_frequency(
-                    {col_name: col["frequency"]}, output="base64")
+                jobs[(col_name, "frequency")] = ("frequency", {col_name: col["frequency"]}, {})
+
+        pictures = {}
+        for (col_name, key), image in render_base64(jobs).items():
+            pictures.setdefault(col_name, {})[key] = image
+
+        # Create every column stats
+        for col_name in cols:
+            col = output["columns"][col_name]
+            hist_pic = pictures.get(col_name, {})
+            freq_pic = hist_pic.pop("frequency", None)
+            hist_pic = hist_pic or None
 
             html = html + \
                    template.render(data=col, freq_pic=freq_pic, hist_pic=hist_pic)
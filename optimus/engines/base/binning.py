@@ -0,0 +1,95 @@
+import functools
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+
+def _values(series):
+    if hasattr(series, "values_host"):
+        return series.values_host
+    return series.to_numpy()
+
+
+def _edges(_min, _max, bins):
+    """
+    Edges of one axis, the same np.histogram2d would use for values in [_min, _max]
+    """
+    if np.isnan(_min) or np.isnan(_max):
+        _min, _max = 0.0, 1.0
+    elif _min == _max:
+        _min, _max = _min - 0.5, _max + 0.5
+    return np.linspace(_min, _max, bins + 1)
+
+
+def _histogram2d(pdf, x_edges, y_edges):
+    return np.histogram2d(_values(pdf["x"]), _values(pdf["y"]), bins=[x_edges, y_edges])[0]
+
+
+def _with_edges(counts, x_edges, y_edges):
+    return counts, x_edges, y_edges
+
+
+def heatmap(df, col_x, col_y, bins_x=10, bins_y=10):
+    """
+    2-D histogram of two columns. The edges are taken from the minimum and maximum of both columns, computed
+    together, then every partition is binned on its own and the counts are added, so no task holds more than one
+    partition.
+    :param df: Optimus DataFrame
+    :param col_x: Column name of the x axis
+    :param col_y: Column name of the y axis
+    :param bins_x: Number of bins of the x axis
+    :param bins_y: Number of bins of the y axis
+    :return: Delayed tuple with the counts, the x edges and the y edges
+    """
+    F = df.functions
+    dfd = df.data
+
+    heatmap_df = F.to_float(dfd[col_x]).rename("x").to_frame()
+    heatmap_df["y"] = F.to_float(dfd[col_y])
+    heatmap_df = heatmap_df.dropna()
+
+    x_min, x_max, y_min, y_max = F.compute(heatmap_df["x"].min(), heatmap_df["x"].max(),
+                                           heatmap_df["y"].min(), heatmap_df["y"].max())
+    x_edges = _edges(float(x_min), float(x_max), bins_x)
+    y_edges = _edges(float(y_min), float(y_max), bins_y)
+
+    counts = [F.delayed(_histogram2d)(partition, x_edges, y_edges) for partition in F.to_delayed(heatmap_df)]
+    counts = F.delayed(functools.reduce)(np.add, counts)
+    return F.delayed(_with_edges)(counts, x_edges, y_edges)
+
+
+def _pair_counts(pdf, col_x, col_y):
+    counts = pdf[[col_x, col_y]].groupby([col_x, col_y]).size()
+    if hasattr(counts, "to_pandas"):
+        counts = counts.to_pandas()
+    return Counter(counts.to_dict())
+
+
+def _merge_pair_counts(left, right):
+    left.update(right)
+    return left
+
+
+def _to_crosstab(counts, col_x, col_y):
+    if not counts:
+        return pd.DataFrame(index=pd.Index([], name=col_x), columns=pd.Index([], name=col_y), dtype="int64")
+
+    result = pd.Series(counts, dtype="int64")
+    result.index.names = [col_x, col_y]
+    return result.unstack(fill_value=0).sort_index().sort_index(axis=1)
+
+
+def crosstab(df, col_x, col_y):
+    """
+    Cross tabulation of two columns. Every partition counts its pairs of values and only the counts of the pairs
+    found are merged, so no task holds more than one partition.
+    :param df: Optimus DataFrame
+    :param col_x: Column name of the rows
+    :param col_y: Column name of the columns
+    :return: Delayed pandas DataFrame like the one returned by pandas.crosstab
+    """
+    F = df.functions
+    counts = [F.delayed(_pair_counts)(partition, col_x, col_y) for partition in F.to_delayed(df.data)]
+    counts = F.delayed(functools.reduce)(_merge_pair_counts, counts)
+    return F.delayed(_to_crosstab)(counts, col_x, col_y)
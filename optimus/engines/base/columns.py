@@ -12,14 +12,15 @@ import numpy as np
 import pandas as pd
 from fast_histogram import histogram1d
 from glom import glom
-from nltk import LancasterStemmer, ngrams
+from nltk import LancasterStemmer
 from nltk.corpus import stopwords
 from nltk.stem import PorterStemmer
 from nltk.stem import SnowballStemmer
 from num2words import num2words
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 
+from optimus.engines.base import binning, correlation
 from optimus.engines.base.meta import Meta
+from optimus.engines.base.ml.text import vectorize
 from optimus.engines.base.stringclustering import Clusters
 from optimus.helpers.check import is_dask_dataframe
 from optimus.helpers.columns import parse_columns, check_column_numbers, prepare_columns, get_output_cols, \
@@ -29,15 +30,17 @@ from optimus.helpers.constants import Actions, CONTRACTIONS, PROFILER_CATEGORICA
     RELATIVE_ERROR, UNKNOWN_THRESHOLD, INDEX_TO_DATA_TYPE_FUNC, ProfilerDataTypesNumeric
 from optimus.helpers.converter import convert_numpy, format_dict
 from optimus.helpers.core import unzip, val_to_list, one_list_to_val
+from optimus.helpers.decorators import evaluate_on_uniques
 from optimus.helpers.functions import transform_date_format
 from optimus.helpers.logger import logger
 from optimus.helpers.raiseit import RaiseIt
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import *
 from optimus.infer import is_dict, is_int_like, is_list_of_list, is_numeric, is_numeric_like, is_str, is_list_value, \
     is_one_element, \
     is_list_of_tuples, is_int, is_list_of_str, is_tuple, is_null, is_list, str_to_int
 from optimus.optimus import Engine, EnginePretty
-from optimus.profiler.constants import MAX_BUCKETS
+from optimus.profiler.constants import MAX_BUCKETS, FLIERS_LIMIT
 # from optimus.engines.dask.functions import DaskFunctions as F
 from optimus.profiler.functions import sample_size
 
@@ -46,10 +49,14 @@ CATEGORICAL_RELATIVE_THRESHOLD = 0.10
 CATEGORICAL_THRESHOLD = 50
 ZIPCODE_THRESHOLD = 0.80
 INFER_PROFILER_ROWS = 200
+TYPE_PRESERVING_ACTIONS = [Actions.RENAME.value, Actions.SELECT_ROW.value, Actions.SORT_ROW.value,
+                           Actions.DROP_ROW.value]
+"""Actions that do not change the values of the columns, so the inferred data types are still valid"""
 
 
-class BaseColumns(ABC):
+class BaseColumns(Timed, ABC):
     """Base class for all Cols implementations"""
+    _timed_name = "cols"
 
     def __init__(self, root: 'DataFrameType'):
         self.root = root
@@ -81,16 +88,32 @@ class BaseColumns(ABC):
         :param args:
         :return:
         """
-        return df[input_col].apply(func, args=(*args,)).rename(output_col)
+        series = df[input_col]
+        result = evaluate_on_uniques(series, lambda _series: _series.apply(func, args=(*args,)))
+        if result is None:
+            result = series.apply(func, args=(*args,))
+        return result.rename(output_col)
+
+    def _parallel(self, series, func, *args):
+        """
+        Apply a function which runs Python code for every value using every core available. Distributed engines
+        already run every partition in parallel so by default the function is applied as in vectorized mode.
+        :param series:
+        :param func:
+        :param args:
+        :return:
+        """
+        return func(series, *args)
 
     @abstractmethod
     def _names(self):
         pass
 
-    def _transformed(self, updated=None):
+    def _transformed(self, updated=None, ignore=None):
         """
 
         :param updated:
+        :param ignore: Names of the actions that do not transform the columns
         :return:
         """
         if updated is None:
@@ -103,7 +126,7 @@ class BaseColumns(ABC):
             action_cols = action.get("columns", None)
             action_stats = action.get("updated_stats", [])
 
-            if not action_cols:
+            if not action_cols or action.get("name") in (ignore or []):
                 continue
 
             if is_tuple(action_cols):
@@ -212,7 +235,10 @@ class BaseColumns(ABC):
         dfd = df.data
         if cols is not None:
             dfd = self._select(cols)
-        return self.root.new(dfd, meta=meta)
+        df = self.root.new(dfd, meta=meta)
+        # the selected columns have the same values, the types inferred from any of both dataframes are shared
+        df.cache["inferred_types"] = self.root.cache.setdefault("inferred_types", {})
+        return df
 
     def copy(self, cols="*", output_cols=None, columns=None) -> 'DataFrameType':
         """
@@ -339,7 +365,7 @@ class BaseColumns(ABC):
     def apply(self, cols="*", func=None, func_return_type=None, args=None, func_type=None, where=None,
               filter_col_by_data_types=None, output_cols=None, skip_output_cols_processing=False,
               meta_action=Actions.APPLY_COLS.value, mode="vectorized", set_index=False, default=None,
-              **kwargs) -> 'DataFrameType':
+              batch=False, **kwargs) -> 'DataFrameType':
         """
 
         :param cols: "*", column name or list of column names to be processed.
@@ -352,17 +378,24 @@ class BaseColumns(ABC):
         :param output_cols: Column name or list of column names where the transformed data will be saved.
         :param skip_output_cols_processing:
         :param meta_action:
-        :param mode:
+        :param mode: "vectorized", "partitioned", "map" or "parallel". "parallel" splits the column between processes
+        on engines that run on a single core.
         :param set_index:
         :param default:
+        :param batch: Apply 'func' once to every block of columns with the same data type. Only used in vectorized
+        mode and only valid for element-wise functions.
         :param kwargs:
         :return:
         """
         columns = prepare_columns(self.root, cols, output_cols, filter_by_column_types=filter_col_by_data_types,
                                   accepts_missing_cols=True, default=default)
 
+        if self.root.plan is not None and mode == "vectorized" and not set_index:
+            return self._apply_lazy(columns, func, args, meta_action)
+
         kw_columns = {}
         output_ordered_columns = self.names()
+        current_names = set(output_ordered_columns)
 
         if args is None:
             args = []
@@ -381,8 +414,13 @@ class BaseColumns(ABC):
             else:
                 func = _func
 
+        if batch and mode == "vectorized":
+            columns = list(columns)
+            kw_columns = self._apply_batch(dfd, columns, func, args)
+
+        actions = []
         for input_col, output_col in columns:
-            if mode == "vectorized":
+            if mode == "vectorized" and not (batch and output_col in kw_columns):
                 # kw_columns[output_col] = self.F.delayed(func)(part, *args)
                 kw_columns[output_col] = func(dfd[input_col], *args)
 
@@ -397,12 +435,18 @@ class BaseColumns(ABC):
                 kw_columns[output_col] = self._map(
                     dfd, input_col, str(output_col), func, *args)
 
+            elif mode == "parallel":
+                kw_columns[output_col] = self._parallel(dfd[input_col], func, *args)
+
             # Preserve column order
-            if output_col not in self.names():
+            if output_col not in current_names:
                 col_index = output_ordered_columns.index(input_col) + 1
                 output_ordered_columns[col_index:col_index] = [output_col]
+                current_names.add(output_col)
 
-            meta = Meta.action(meta, meta_action, output_col)
+            actions.append((meta_action, output_col))
+
+        meta = Meta.actions(meta, actions)
 
         if set_index is True and mode != "partitioned":
             dfd = dfd.reset_index()
@@ -417,6 +461,61 @@ class BaseColumns(ABC):
 
         return df
 
+    def _apply_batch(self, dfd, columns, func, args) -> dict:
+        """
+        Apply a function to blocks of columns. Engines that can stack columns in one call should override this.
+
+        :param dfd: Internal dataframe.
+        :param columns: List of input and output columns returned by prepare_columns.
+        :param func: Element-wise function which receives a series.
+        :param args: Arguments passed to 'func'.
+        :return: Dict with the form {output_col: series}
+        """
+        return {output_col: func(dfd[input_col], *args) for input_col, output_col in columns}
+
+    def _apply_lazy(self, columns, func, args, meta_action) -> 'DataFrameType':
+        """
+        Append the transformation to the plan of a lazy dataframe instead of executing it.
+
+        :param columns: Iterator of input and output columns returned by prepare_columns.
+        :param func: Function or function name from df.functions.
+        :param args:
+        :param meta_action:
+        :return:
+        """
+        df = self.root
+
+        if args is None:
+            args = []
+        elif not is_tuple(args, ):
+            args = (args,)
+
+        if is_str(func):
+            _func = getattr(df.functions, func, False)
+
+            if not _func:
+                raise NotImplementedError(f"\"{func}\" is not available using {type(df).__name__}")
+            else:
+                func = _func
+
+        plan = df.plan
+
+        if plan.names is None:
+            plan.names = self._names()
+
+        output_cols = []
+        for input_col, output_col in columns:
+            plan = plan.add(input_col, output_col, func, args, meta_action)
+            output_cols.append(output_col)
+
+        # Same actions the eager path saves when the columns are assigned
+        plan.actions.extend((Actions.SET.value, output_col) for output_col in output_cols)
+
+        # Only the plan and the column names are touched, the data is not read until the plan is executed
+        new_df = df.new(df._data, meta=df._meta)
+        new_df.plan = plan
+        return new_df
+
     def apply_by_data_types(self, cols="*", func=None, args=None, data_type=None) -> 'DataFrameType':
         """
         Apply a function using pandas udf or udf if apache arrow is not available.
@@ -584,6 +683,7 @@ class BaseColumns(ABC):
 
         dfd = df.data
         meta = df.meta
+        renamed = {}
 
         for old_col_name, new_col_name in zip(cols, names):
 
@@ -597,8 +697,15 @@ class BaseColumns(ABC):
                 dfd = dfd.rename(columns={old_col_name: new_col_name})
                 meta = Meta.action(meta, Actions.RENAME.value,
                                    (old_col_name, new_col_name))
+                renamed[old_col_name] = new_col_name
 
-        return self.root.new(dfd, meta=meta)
+        meta = Meta.rename_columns(meta, renamed)
+        inferred_types = df.cache.get("inferred_types", {})
+        df = self.root.new(dfd, meta=meta)
+        df.cache["inferred_types"] = {renamed.get(col_name, col_name): value
+                                      for col_name, value in inferred_types.items()
+                                      if col_name in renamed or col_name not in renamed.values()}
+        return df
 
     def parse_inferred_types(self, col_data_type):
         """
@@ -1014,6 +1121,8 @@ class BaseColumns(ABC):
             and returning a float. Note that the returned matrix from corr will have 1 along the diagonals and will be
             symmetric regardless of the callable’s behavior.
 
+        On distributed engines pearson is computed in one pass. Spearman ranks the values using a sketch of every
+        column, exact for columns with up to SKETCH_SIZE values, and kendall compares pairs of rows of a sample.
         :param compute: Compute the result or return a delayed function.
         :param tidy: The result format. If True it will return a value if you
         process a column or column name and value if not. If False it will return the functions name, the column name
@@ -1024,7 +1133,10 @@ class BaseColumns(ABC):
         dfd = self.root.data
         cols = parse_columns(df, cols)
 
-        if df.op.engine in [Engine.DASK.value] and method != "pearson":
+        if df.op.engine in [Engine.DASK.value, Engine.DASK_CUDF.value] and method in ["pearson", "spearman",
+                                                                                   "kendall"]:
+            result = correlation.matrix(df, cols, method)
+        elif df.op.engine in [Engine.DASK.value] and method != "pearson":
 
             logger.warn(f"'method' argument does not support '{method}' "
                         f"on {EnginePretty.DASK.value}.\n"
@@ -1064,9 +1176,7 @@ class BaseColumns(ABC):
         if output not in ["dict", "dataframe"]:
             RaiseIt.value_error(output, ["dict", "dataframe"])
 
-        dfd = self.root.data
-
-        result = self.F.delayed(self.F.crosstab)(dfd[col_x], dfd[col_y])
+        result = binning.crosstab(self.root, col_x, col_y)
 
         @self.F.delayed
         def format_crosstab(_r):
@@ -1882,7 +1992,7 @@ class BaseColumns(ABC):
         """
         df = self.root
         return df.cols.apply(cols, self.F.round, output_cols=output_cols, meta_action=Actions.MATH.value,
-                             mode="vectorized", args=decimals)
+                             mode="vectorized", args=decimals, batch=True)
 
     def floor(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2183,7 +2293,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.to_float, func_return_type=float,
-                          output_cols=output_cols, meta_action=Actions.TO_FLOAT.value, mode="vectorized")
+                          output_cols=output_cols, meta_action=Actions.TO_FLOAT.value, mode="vectorized", batch=True)
 
     def to_numeric(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2246,8 +2356,10 @@ class BaseColumns(ABC):
         :param output_cols: Column name or list of column names where the transformed data will be saved.
         :return: BaseDataFrame
         """
+        # On distributed engines "parallel" maps the values of every partition like "partitioned" did, without
+        # losing the divisions of the dataframe
         return self.apply(cols, self.F.date_formats, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.INFER.value, mode="partitioned", func_type="column_expr")
+                          meta_action=Actions.INFER.value, mode="parallel", func_type="column_expr")
 
     def lower(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2258,7 +2370,7 @@ class BaseColumns(ABC):
         :return: BaseDataFrame
         """
         return self.apply(cols, self.F.lower, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.LOWER.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.LOWER.value, mode="vectorized", func_type="column_expr", batch=True)
 
     def upper(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2269,7 +2381,7 @@ class BaseColumns(ABC):
        :return: BaseDataFrame
        """
         return self.apply(cols, self.F.upper, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.UPPER.value, mode="vectorized", func_type="vectorized")
+                          meta_action=Actions.UPPER.value, mode="vectorized", func_type="vectorized", batch=True)
 
     def title(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -2329,7 +2441,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.trim, func_return_type=str,
-                          output_cols=output_cols, meta_action=Actions.TRIM.value, mode="vectorized")
+                          output_cols=output_cols, meta_action=Actions.TRIM.value, mode="vectorized", batch=True)
 
     def strip(self, cols="*", chars=None, side="both", output_cols=None) -> 'DataFrameType':
         """
@@ -2403,7 +2515,7 @@ class BaseColumns(ABC):
         """
 
         return self.apply(cols, self.F.word_tokenize, func_return_type=object, output_cols=output_cols,
-                          meta_action=Actions.WORD_TOKENIZE.value, mode="vectorized")
+                          meta_action=Actions.WORD_TOKENIZE.value, mode="parallel")
 
     def word_count(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -3016,7 +3128,7 @@ class BaseColumns(ABC):
         :param output_cols: Column name or list of column names where the transformed data will be saved.
         :return:
         """
-        return self.apply(cols, self.F.lemmatize_verbs, output_cols=output_cols, mode="vectorized")
+        return self.apply(cols, self.F.lemmatize_verbs, output_cols=output_cols, mode="parallel")
 
     def stem_verbs(self, cols="*", stemmer: str = "porter", language: str = "english",
                    output_cols=None) -> 'DataFrameType':
@@ -3475,8 +3587,6 @@ class BaseColumns(ABC):
         :param compute:
         :return:
         """
-        dfd = self.root.data
-
         @self.F.delayed
         def format_heatmap(data):
             heatmap, xedges, yedges = data
@@ -3484,12 +3594,7 @@ class BaseColumns(ABC):
             return {"x": {"name": col_x, "edges": extent[0:2]}, "y": {"name": col_y, "edges": extent[2:4]},
                     "values": heatmap.T.tolist()}
 
-        heatmap_df = self.F.to_float(dfd[col_x]).rename('x').to_frame()
-        heatmap_df['y'] = self.F.to_float(dfd[col_y])
-
-        heatmap_df = heatmap_df.dropna()
-
-        result = self.F.delayed(self.F.heatmap)(heatmap_df, (bins_x, bins_y))
+        result = binning.heatmap(self.root, col_x, col_y, bins_x, bins_y)
         result = format_heatmap(result)
 
         if compute:
@@ -3589,8 +3694,8 @@ class BaseColumns(ABC):
         {'col_name': {'mismatch': 0, 'missing': 9, 'match': 0, 'inferred_data_type': 'object'}}
 
         :param cols: "*", column name or list of column names to be processed.
-        :param flush:
-        :param compute:
+        :param flush: Ignore the quality saved in the meta data.
+        :param compute: Compute the result or return a delayed function.
         :return: dict in the format {'col_name': {'mismatch': 0, 'missing': 9, 'match': 0, 'inferred_data_type': 'object'}}
         """
 
@@ -3604,11 +3709,12 @@ class BaseColumns(ABC):
             cols_types = self.root.cols.inferred_data_type(cols, calculate=True, tidy=False)["inferred_data_type"]
 
         result = {}
+        to_compute = {}
 
         quality_props = ["match", "missing", "mismatch"]
 
         transformed = self._transformed(quality_props)
-        # print("cols_types",cols_types)
+
         for col_name, props in cols_types.items():
 
             # Gets cached quality
@@ -3620,39 +3726,49 @@ class BaseColumns(ABC):
                                         "mismatch": cached_props.get("mismatch")}
                     continue
             dtype = props if is_str(props) else props["data_type"]
+            to_compute[col_name] = df.constants.INTERNAL_TO_OPTIMUS.get(dtype, dtype)
 
-            dtype = df.constants.INTERNAL_TO_OPTIMUS.get(dtype, dtype)
+        # Build every mask lazily and reduce all of them in a single computation
+        counts = {}
+        for i, (col_name, dtype) in enumerate(to_compute.items()):
+            counts[f"__missing_{i}"] = df.mask.null(col_name).data[col_name].sum()
+            if dtype != ProfilerDataTypes.UNKNOWN.value:
+                mask = getattr(df[col_name].mask, dtype)(col_name).data[col_name]
+                counts[f"__match_{i}"] = (mask == True).sum()
+                counts[f"__no_match_{i}"] = (mask == False).sum()
 
-            if dtype!=ProfilerDataTypes.UNKNOWN.value:
-                matches_mismatches = getattr(df[col_name].mask, dtype)(col_name).cols.frequency()
-                missing = df.mask.null(col_name).cols.sum()
-                values = {list(j.values())[0]: list(j.values())[1] for j in
-                          matches_mismatches["frequency"][col_name]["values"]}
-                matches = values.get(True)
-                mismatches = values.get(False, missing) - missing
+        rows_count = df.rows.count(compute=False)
 
-                # Ensure that value are not None
-                matches = 0 if matches is None else int(matches)
-                mismatches = 0 if mismatches is None else int(mismatches)
-                missing = 0 if missing is None else int(missing)
-            else:
-                missing = df.mask.null(col_name).cols.sum()
-                missing = 0 if missing is None else int(missing)
+        @self.F.delayed
+        def compute_quality(_cached, _counts, _rows_count):
+            _result = {**_cached}
+            for i, (col_name, dtype) in enumerate(to_compute.items()):
+                missing = int(_counts[f"__missing_{i}"])
+                if dtype != ProfilerDataTypes.UNKNOWN.value:
+                    matches = int(_counts[f"__match_{i}"])
+                    mismatches = int(_counts[f"__no_match_{i}"])
+                    mismatches = mismatches - missing if mismatches else 0
+                else:
+                    matches = 0
+                    mismatches = _rows_count - missing
 
-                matches = 0
-                mismatches =  self.root.rows.count()- missing
+                _result[col_name] = {"match": matches, "missing": missing, "mismatch": mismatches}
 
+            for col_name in cols_types.keys():
+                _result[col_name].update({"inferred_data_type": cols_types[col_name]})
 
-            result[col_name] = {"match": matches,
-                                "missing": missing, "mismatch": mismatches}
+            return _result
+
+        result = compute_quality(result, counts, rows_count)
 
-        for col_name in cols_types.keys():
-            result[col_name].update({"inferred_data_type": cols_types[col_name]})
+        if compute:
+            result = self.F.compute(result)
 
-        for col in result:
-            self.root.meta = Meta.set(self.root.meta, f"profile.columns.{col}.stats", result[col])
+            for col in result:
+                self.root.meta = Meta.set(self.root.meta, f"profile.columns.{col}.stats", result[col])
 
-        self._set_transformed_stat(list(result.keys()), ["match", "missing", "mismatch"])
+            # Only mark the stats as updated when they are saved
+            self._set_transformed_stat(list(cols_types.keys()), ["match", "missing", "mismatch"])
 
         return result
 
@@ -3672,6 +3788,44 @@ class BaseColumns(ABC):
 
         df = self.root
         cols = parse_columns(df, cols)
+
+        # Types inferred before for the same data are reused, from the cache of the dataframe or from the meta data
+        # if the column was not transformed after that
+        inferred_types = df.cache.setdefault("inferred_types", {})
+        transformed = self._transformed("inferred_data_type", ignore=TYPE_PRESERVING_ACTIONS)
+
+        cols_and_inferred_dtype = {}
+        for col_name in cols:
+            inferred = inferred_types.get(col_name, {})
+            if "data_type" not in inferred and col_name not in transformed:
+                inferred = Meta.get(df.meta, f"profile.columns.{col_name}.stats.inferred_data_type") or {}
+            if "data_type" in inferred and "categorical" in inferred:
+                cols_and_inferred_dtype[col_name] = inferred
+
+        infer_cols = [col_name for col_name in cols if col_name not in cols_and_inferred_dtype]
+
+        if infer_cols:
+            cols_and_inferred_dtype.update(self._infer_type(infer_cols, sample_count))
+
+        for col in cols_and_inferred_dtype:
+            self.root.meta = Meta.set(self.root.meta, f"profile.columns.{col}.stats.inferred_data_type",
+                                      cols_and_inferred_dtype[col])
+            inferred_types[col] = {**inferred_types.get(col, {}), **cols_and_inferred_dtype[col]}
+        if infer_cols:
+            self._set_transformed_stat(infer_cols, ["inferred_data_type"])
+
+        result = {"infer_type": {col_name: cols_and_inferred_dtype[col_name] for col_name in cols}}
+
+        return format_dict(result, tidy=tidy)
+
+    def _infer_type(self, cols, sample_count=None) -> dict:
+        """
+        Infer the data types of the columns from a sample
+        :param cols: List of column names
+        :param sample_count: number of rows to sample.
+        :return: dict with the form {col_name: {"data_type": ..., "categorical": ...}}
+        """
+        df = self.root
         if sample_count is None:
             sample_count = sample_size(df.rows.count(), 95, 5)
 
@@ -3738,13 +3892,7 @@ class BaseColumns(ABC):
                 if _format:
                     cols_and_inferred_dtype[col_name].update({"format": _format})
 
-        for col in cols_and_inferred_dtype:
-            self.root.meta = Meta.set(self.root.meta, f"profile.columns.{col}.stats.inferred_data_type",
-                                      cols_and_inferred_dtype[col])
-
-        result = {"infer_type": cols_and_inferred_dtype}
-
-        return format_dict(result, tidy=tidy)
+        return cols_and_inferred_dtype
 
     def infer_date_formats(self, cols="*", sample=INFER_PROFILER_ROWS, tidy=True) -> dict:
         """
@@ -3758,19 +3906,38 @@ class BaseColumns(ABC):
 
         cols = parse_columns(df, cols)
 
-        sample_df = df.cols.select(cols).rows.limit(sample).to_optimus_pandas()
-        sample_formats = sample_df.cols.date_formats().cols.frequency()
+        # Formats inferred before for the same data are reused like in infer_type
+        inferred_types = df.cache.setdefault("inferred_types", {})
+        transformed = self._transformed("date_format", ignore=TYPE_PRESERVING_ACTIONS)
 
         result = {}
         for col_name in cols:
-            infer_value_counts = sample_formats["frequency"][col_name]["values"]
-            # Common datatype in a column
-            date_format = infer_value_counts[0]["value"]
+            inferred = inferred_types.get(col_name, {})
+            if "format" not in inferred and col_name not in transformed:
+                inferred = Meta.get(df.meta, f"profile.columns.{col_name}.stats.inferred_data_type") or {}
+            if "format" in inferred:
+                result[col_name] = inferred["format"]
+
+        infer_cols = [col_name for col_name in cols if col_name not in result]
+
+        if infer_cols:
+            sample_df = df.cols.select(infer_cols).sample(sample).to_optimus_pandas()
+            sample_formats = sample_df.cols.date_formats().cols.frequency()
+
+            for col_name in infer_cols:
+                infer_value_counts = sample_formats["frequency"][col_name]["values"]
+                # Common datatype in a column
+                result[col_name] = infer_value_counts[0]["value"]
+
+        for col_name in cols:
             self.root.meta = Meta.set(df.meta, f"profile.columns.{col_name}.stats.inferred_data_type.format",
-                                      date_format)
-            result.update({col_name: date_format})
+                                      result[col_name])
+            inferred_types[col_name] = {**inferred_types.get(col_name, {}), "format": result[col_name]}
 
-        return format_dict(result, tidy)
+        if infer_cols:
+            self._set_transformed_stat(infer_cols, ["date_format"])
+
+        return format_dict({col_name: result[col_name] for col_name in cols}, tidy)
 
     def frequency(self, cols="*", n=MAX_BUCKETS, percentage=False, total_rows=None, count_uniques=False,
                   compute=True, tidy=False) -> dict:
@@ -3807,8 +3974,7 @@ class BaseColumns(ABC):
         to_items = self.F.to_items
 
         @self.F.delayed
-        def calculate_n_largest(_series, include_uniques):
-            _value_counts = _series.value_counts()
+        def calculate_n_largest(_value_counts, include_uniques):
             if n is not None:
                 _n_largest = _value_counts.nlargest(n)
             else:
@@ -3855,14 +4021,15 @@ class BaseColumns(ABC):
 
             return _value_counts
 
-        n_largest = [calculate_n_largest(df.data[col], count_uniques) for col in cols]
+        # distributed engines count every partition and only send the counts, instead of the whole column
+        n_largest = [calculate_n_largest(self.F.value_counts(df.data[col]), count_uniques) for col in cols]
 
         b = [series_to_dict(_n_largest, _cols) for _n_largest, _cols in zip(n_largest, cols)]
 
         c = flat_dict(b)
 
         if percentage is True:
-            c = freq_percentage(c, self.F.delayed(len)(df.data))
+            c = freq_percentage(c, df.data.shape[0])
 
         if compute is True:
             result = self.F.compute(c)
@@ -3874,34 +4041,59 @@ class BaseColumns(ABC):
 
         return result
 
-    def boxplot(self, cols="*") -> dict:
+    def boxplot(self, cols="*", fliers_limit=FLIERS_LIMIT) -> dict:
         """
         Return the boxplot data in python dict format.
 
         :param cols: "*", column name or list of column names to be processed.
+        :param fliers_limit: Max number of fliers returned for every column.
         :return: dict with box plot data.
         """
         df = self.root
         cols = parse_columns(df, cols)
+
+        # Quartiles and means of every column in one computation
+        quartiles, means = self.F.compute(
+            df.cols.percentile(cols, [0.25, 0.5, 0.75], estimate=False, tidy=False, compute=False),
+            df.cols.mean(cols, tidy=False, compute=False))
+        quartiles, means = quartiles["percentile"], means["mean"]
+
         stats = {}
+        whiskers = {}
 
         for col_name in cols:
-            iqr = df.cols.iqr(col_name, more=True, estimate=False)
-            if not is_dict(iqr):
+            if not is_dict(quartiles[col_name]):
                 stats[col_name] = np.nan
                 continue
-            lb = iqr["q1"] - (iqr["iqr"] * 1.5)
-            ub = iqr["q3"] + (iqr["iqr"] * 1.5)
+            q1, q2, q3 = quartiles[col_name][0.25], quartiles[col_name][0.5], quartiles[col_name][0.75]
+            iqr = q3 - q1
+            whiskers[col_name] = (q1 - (iqr * 1.5), q3 + (iqr * 1.5))
+            stats[col_name] = {'mean': means[col_name], 'median': q2, 'q1': q1, 'q3': q3,
+                               'whisker_low': whiskers[col_name][0], 'whisker_high': whiskers[col_name][1],
+                               'label': col_name}
+
+        def _fliers(pdf, numeric_pdf):
+            if hasattr(pdf, "to_pandas"):
+                pdf, numeric_pdf = pdf.to_pandas(), numeric_pdf.to_pandas()
+            result = {}
+            for col_name, (lb, ub) in whiskers.items():
+                query = (numeric_pdf[col_name] < lb) | (numeric_pdf[col_name] > ub)
+                result[col_name] = pdf.loc[query, col_name].head(fliers_limit).tolist()
+            return result
+
+        def _merge_fliers(left, right):
+            return {col_name: (left[col_name] + right[col_name])[:fliers_limit] for col_name in left}
 
-            _mean = df.cols.mean(cols)
+        # Fliers are outliers points, taken for every column in one pass
+        if whiskers:
+            dfd = df.cols.select(list(whiskers)).data
+            dfn = df.cols.select(list(whiskers)).cols.to_float().data
+            fliers = [self.F.delayed(_fliers)(partition, numeric_partition)
+                      for partition, numeric_partition in zip(self.F.to_delayed(dfd), self.F.to_delayed(dfn))]
+            fliers = self.F.compute(self.F.delayed(reduce)(_merge_fliers, fliers))
 
-            query = ((df[col_name] < lb) | (df[col_name] > ub))
-            # Fliers are outliers points
-            fliers = df.rows.select(query).cols.select(
-                col_name).rows.limit(1000).to_dict()
-            stats[col_name] = {'mean': _mean, 'median': iqr["q2"], 'q1': iqr["q1"], 'q3': iqr["q3"], 'whisker_low': lb,
-                               'whisker_high': ub,
-                               'fliers': fliers[col_name], 'label': one_list_to_val(col_name)}
+            for col_name in whiskers:
+                stats[col_name]['fliers'] = fliers[col_name]
 
         return stats
 
@@ -5145,45 +5337,15 @@ class BaseColumns(ABC):
 
     def fingerprint(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
-        Create the fingerprint for a column
+        Create the fingerprint for a column: the distinct words of the lower case value without punctuation or
+        diacritics, sorted and joined by a space.
 
         :param cols: '*', list of columns names or a single column name.
         :param output_cols: Column name or list of column names where the transformed data will be saved.
         :return:
         """
-
-        df = self.root
-
-        # https://github.com/OpenRefine/OpenRefine/blob/master/main/src/com/google/refine/clustering/binning/FingerprintKeyer.java#L56
-        def _split_sort_remove_join(value):
-            """
-            Helper function to split, remove duplicate, sort and join back together
-            """
-            # Split into whitespace-separated token
-            # print("value", type(value), value)
-            split_key = value.split()
-
-            # Sort and remove duplicated items
-            split_key = sorted(set(split_key))
-
-            # join the tokens back together
-            return " ".join(split_key)
-
-        cols = parse_columns(df, cols)
-        output_cols = get_output_cols(cols, output_cols)
-
-        for input_col, output_col in zip(cols, output_cols):
-            df = (df
-                  .cols.trim(input_col, output_col)
-                  .cols.lower(output_col)
-                  .cols.remove_special_chars(output_col)
-                  .cols.normalize_chars(output_col)
-                  .cols.apply(output_col, _split_sort_remove_join, "string", mode="map")
-                  )
-
-        df.meta = Meta.action(df.meta, Actions.FINGERPRINT.value, output_cols)
-
-        return df
+        return self.apply(cols, self.F.fingerprint, func_return_type=str, output_cols=output_cols,
+                          meta_action=Actions.FINGERPRINT.value, mode="parallel", func_type="column_expr")
 
     def pos(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -5227,10 +5389,10 @@ class BaseColumns(ABC):
         output_cols = get_output_cols(cols, output_cols)
 
         def calculate_ngrams(value):
-            return list(map("".join, list(ngrams(value, n_size))))
+            return [value[i:i + n_size] for i in range(len(value) - n_size + 1)]
 
         for input_col, output_col in zip(cols, output_cols):
-            df = df.cols.apply(output_col, calculate_ngrams,
+            df = df.cols.apply(input_col, calculate_ngrams,
                                "string", output_cols=output_col, mode="map")
 
         df.meta = Meta.action(df.meta, Actions.NGRAMS.value, output_cols)
@@ -5246,34 +5408,9 @@ class BaseColumns(ABC):
         :param output_cols: Column name or list of column names where the transformed data will be saved.
         :return:
         """
-
-        df = self.root
-        from nltk import ngrams
-
-        def calculate_ngrams(value):
-            ngram = list(map("".join, list(ngrams(value, n_size))))
-            ngram = sorted(set(ngram))
-            _result = "".join(ngram)
-
-            return _result
-
-        cols = parse_columns(df, cols)
-        output_cols = get_output_cols(cols, output_cols)
-
-        for input_col, output_col in zip(cols, output_cols):
-            df = (df
-                  .cols.copy(input_col, output_col)
-                  .cols.lower(output_col)
-                  .cols.remove_white_spaces(output_col)
-                  .cols.remove_special_chars(output_col)
-                  .cols.normalize_chars(output_col)
-                  .cols.apply(output_col, calculate_ngrams, "string", output_cols=output_col, mode="map")
-                  )
-
-        df.meta = Meta.action(
-            df.meta, Actions.NGRAM_FINGERPRINT.value, output_cols)
-
-        return df
+        return self.apply(cols, self.F.ngram_fingerprint, args=(n_size,), func_return_type=str,
+                          output_cols=output_cols, meta_action=Actions.NGRAM_FINGERPRINT.value, mode="parallel",
+                          func_type="column_expr")
 
     def metaphone(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -5286,7 +5423,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.metaphone, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.METAPHONE.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.METAPHONE.value, mode="parallel", func_type="column_expr")
 
     def levenshtein(self, cols="*", other_cols=None, value=None, output_cols=None):
         """
@@ -5310,13 +5447,13 @@ class BaseColumns(ABC):
             for col, other_col in zip(cols, other_cols):
                 df = df.cols.apply(col, self.F.levenshtein, args=(df.data[other_col],), func_return_type=str,
                                    output_cols=output_cols,
-                                   meta_action=Actions.LEVENSHTEIN.value, mode="vectorized", func_type="column_expr")
+                                   meta_action=Actions.LEVENSHTEIN.value, mode="parallel", func_type="column_expr")
         else:
             value = val_to_list(value)
             for col, val in zip(cols, value):
                 df = df.cols.apply(col, "levenshtein", args=(val,), func_return_type=str,
                                    output_cols=output_cols,
-                                   meta_action=Actions.LEVENSHTEIN.value, mode="vectorized", func_type="column_expr")
+                                   meta_action=Actions.LEVENSHTEIN.value, mode="parallel", func_type="column_expr")
 
         return df
 
@@ -5330,7 +5467,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.nysiis, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.NYSIIS.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.NYSIIS.value, mode="parallel", func_type="column_expr")
 
     def match_rating_codex(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -5343,7 +5480,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.match_rating_codex, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.MATCH_RATING_CODEX.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.MATCH_RATING_CODEX.value, mode="parallel", func_type="column_expr")
 
     def double_metaphone(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -5356,7 +5493,7 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.double_metaphone, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.DOUBLE_METAPHONE.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.DOUBLE_METAPHONE.value, mode="parallel", func_type="column_expr")
 
     def soundex(self, cols="*", output_cols=None) -> 'DataFrameType':
         """
@@ -5370,31 +5507,36 @@ class BaseColumns(ABC):
         :return:
         """
         return self.apply(cols, self.F.soundex, func_return_type=str, output_cols=output_cols,
-                          meta_action=Actions.SOUNDEX.value, mode="vectorized", func_type="column_expr")
+                          meta_action=Actions.SOUNDEX.value, mode="parallel", func_type="column_expr")
 
-    def tf_idf(self, features) -> 'DataFrameType':
+    def tf_idf(self, features, hashing=False, n_features=2 ** 20, output="dataframe") -> 'DataFrameType':
         """
+        TF-IDF of the text of the columns as sparse features. On Dask every partition is fitted separately and the
+        vocabularies are merged.
 
-        :param features:
+        :param features: Column name or list of column names with the text. The text of a row is joined.
+        :param hashing: Hash the terms to n_features columns instead of building a vocabulary.
+        :param n_features: Number of columns using hashing. Only the columns found in the data are returned in the
+        dataframe.
+        :param output: 'dataframe' to get a dataframe with sparse columns or 'matrix' to get a scipy CSR matrix.
         :return:
         """
+        features = parse_columns(self.root, features)
+        return vectorize(self.root, features, tf_idf=True, hashing=hashing, n_features=n_features, output=output)
 
-        df = self.root
-        vectorizer = TfidfVectorizer()
-        X = df[features]._to_values().ravel()
-        vectors = vectorizer.fit_transform(X)
-
-        feature_names = vectorizer.get_feature_names()
-        dense = vectors.todense()
-        denselist = dense.tolist()
-        return self.root.new(pd.DataFrame(denselist, columns=feature_names))
-
-    def bag_of_words(self, features, analyzer="word", ngram_range=2) -> 'DataFrameType':
+    def bag_of_words(self, features, analyzer="word", ngram_range=2, hashing=False, n_features=2 ** 20,
+                     output="dataframe") -> 'DataFrameType':
         """
+        Count of the terms of the text of the columns as sparse features. Rows with missing values are dropped.
+        On Dask every partition is fitted separately and the vocabularies are merged.
 
-        :param analyzer:
-        :param features:
-        :param ngram_range:
+        :param analyzer: 'word', 'char' or 'char_wb'.
+        :param features: Column name or list of column names with the text. The text of a row is joined.
+        :param ngram_range: Size of the n-grams or a tuple with the min and max size.
+        :param hashing: Hash the terms to n_features columns instead of building a vocabulary.
+        :param n_features: Number of columns using hashing. Only the columns found in the data are returned in the
+        dataframe.
+        :param output: 'dataframe' to get a dataframe with sparse columns or 'matrix' to get a scipy CSR matrix.
         :return:
         """
 
@@ -5406,9 +5548,5 @@ class BaseColumns(ABC):
 
         df = df.cols.select(features).rows.drop_missings()
 
-        X = df[features]._to_values().ravel()
-        vectorizer = CountVectorizer(
-            ngram_range=ngram_range, analyzer=analyzer)
-        matrix = vectorizer.fit_transform(X)
-
-        return self.root.new(pd.DataFrame(matrix.toarray(), columns=vectorizer.get_feature_names()))
+        return vectorize(df, features, hashing=hashing, n_features=n_features, output=output,
+                         ngram_range=ngram_range, analyzer=analyzer)
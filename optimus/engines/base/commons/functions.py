@@ -19,6 +19,58 @@ def hist(series, bins, range):
     return np.histogram(series.to_float(), bins=bins, range=range)
 
 
+def apply_batch(df, dfd, columns, func, args):
+    """
+    Stack the columns with the same data type in one series so 'func' is called once per data type instead of
+    once per column. The result is split back using the position of every column in the stacked series.
+    :param df: Dataframe to be transformed
+    :param dfd: Internal dataframe.
+    :param columns: List of input and output columns returned by prepare_columns.
+    :param func: Element-wise function which receives a series.
+    :param args: Arguments passed to 'func'.
+    :return: Dict with the form {output_col: series}
+    """
+    blocks = {}
+    for input_col, output_col in columns:
+        dtype = str(dfd[input_col].dtype)
+        # categorical columns with different categories would be joined as object, they get a block each
+        key = (dtype, input_col) if dtype == "category" else dtype
+        blocks.setdefault(key, {}).setdefault(input_col, []).append(output_col)
+
+    kw_columns = {}
+    rows = len(dfd.index)
+
+    for block in blocks.values():
+        input_cols = list(block.keys())
+
+        if len(input_cols) == 1:
+            result = {input_cols[0]: func(dfd[input_cols[0]], *args)}
+        else:
+            stacked = df.functions._engine.concat([dfd[col] for col in input_cols], ignore_index=True)
+            stacked = func(stacked, *args)
+
+            if not hasattr(stacked, "iloc") or len(stacked) != rows * len(input_cols):
+                # the function does not return one value per element
+                result = {col: func(dfd[col], *args) for col in input_cols}
+            elif isinstance(stacked.dtype, np.dtype) and hasattr(stacked, "to_numpy"):
+                # Reshape the result in one block, the columns are views of it
+                values = stacked.to_numpy().reshape(len(input_cols), rows).T
+                values = dfd.__class__(values, index=dfd.index, columns=range(len(input_cols)))
+                result = {col: values[i] for i, col in enumerate(input_cols)}
+            else:
+                result = {}
+                for i, col in enumerate(input_cols):
+                    series = stacked.iloc[i * rows:(i + 1) * rows]
+                    series.index = dfd.index
+                    result[col] = series
+
+        for input_col, output_cols in block.items():
+            for output_col in output_cols:
+                kw_columns[output_col] = result[input_col]
+
+    return kw_columns
+
+
 def string_to_index(df, cols, output_cols=None, le=None, **kwargs):
     """_
     Maps a string column of labels to an ML column of label indices. If the input column is
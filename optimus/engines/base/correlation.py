@@ -0,0 +1,198 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+from optimus.engines.base import sample
+
+SKETCH_SIZE = 10000
+"""Values kept by the sketch of every column used to rank the values for spearman, exact below this count"""
+
+KENDALL_SAMPLE_ROWS = 1000
+"""Rows sampled to compute kendall"""
+
+KENDALL_PAIRS = 50000
+"""Pairs of sampled rows compared to compute kendall, every pair is compared when there are fewer"""
+
+KENDALL_CHUNK = 5000
+
+
+def _matrix(pdf, cols):
+    if hasattr(pdf, "to_pandas"):
+        pdf = pdf.to_pandas()
+    return pdf[cols].to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _divide(a, b):
+    return np.divide(a, b, out=np.zeros_like(a), where=b > 0)
+
+
+def _moments(values):
+    """
+    Co-moments of every pair of columns using the rows where both values are not null.
+    :param values: 2-D float array, nulls as nan
+    :return: tuple with matrices of the count, the means of the first and the second column of every pair, their
+    sums of squared deviations and the sum of the product of the deviations
+    """
+    mask = ~np.isnan(values)
+    counts = mask.sum(axis=0)
+    # Shifting every column by its mean keeps the sums small
+    shift = _divide(np.where(mask, values, 0).sum(axis=0), counts.astype("float64"))
+    z = np.where(mask, values - shift, 0)
+    m = mask.astype("float64")
+
+    n = m.T @ m
+    s = z.T @ m
+    q = (z * z).T @ m
+    p = z.T @ z
+
+    mean_x = _divide(s, n)
+    mean_y = mean_x.T
+    m2_x = q - mean_x * s
+    m2_y = m2_x.T
+    c = p - mean_x * s.T
+
+    return n, mean_x + shift[:, None], mean_y + shift[None, :], m2_x, m2_y, c
+
+
+def _merge_moments(left, right):
+    # Parallel algorithm of Chan et al. applied to every pair of columns
+    n_a, mean_x_a, mean_y_a, m2_x_a, m2_y_a, c_a = left
+    n_b, mean_x_b, mean_y_b, m2_x_b, m2_y_b, c_b = right
+
+    n = n_a + n_b
+    delta_x = mean_x_b - mean_x_a
+    delta_y = mean_y_b - mean_y_a
+    weight = _divide(n_a * n_b, n)
+
+    return (n, mean_x_a + delta_x * _divide(n_b, n), mean_y_a + delta_y * _divide(n_b, n),
+            m2_x_a + m2_x_b + delta_x * delta_x * weight, m2_y_a + m2_y_b + delta_y * delta_y * weight,
+            c_a + c_b + delta_x * delta_y * weight)
+
+
+def _pearson(moments):
+    n, _, _, m2_x, m2_y, c = moments
+    divisor = np.sqrt(m2_x * m2_y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where((n > 1) & (divisor > 0), c / divisor, np.nan)
+    return np.clip(result, -1, 1)
+
+
+def _sketch(values, size):
+    """
+    Sorted values of every column with their weights. Up to 'size' values are kept, evenly spaced by their
+    cumulative weight, so the sketch is exact for columns with fewer values.
+    """
+    result = []
+    for column in values.T:
+        column = np.sort(column[~np.isnan(column)])
+        result.append(_compress(column, np.ones(len(column)), size))
+    return result
+
+
+def _compress(values, weights, size):
+    if len(values) <= size:
+        return values, weights
+    cumulative = np.cumsum(weights)
+    positions = np.linspace(0, cumulative[-1], size + 1)[1:]
+    index = np.minimum(np.searchsorted(cumulative, positions), len(values) - 1)
+    return values[index], np.diff(np.concatenate([[0], cumulative[index]]))
+
+
+def _merge_sketches(left, right, size):
+    result = []
+    for (values_a, weights_a), (values_b, weights_b) in zip(left, right):
+        values = np.concatenate([values_a, values_b])
+        order = np.argsort(values, kind="stable")
+        result.append(_compress(values[order], np.concatenate([weights_a, weights_b])[order], size))
+    return result
+
+
+def _ranks(values, sketches):
+    """
+    Approximate rank of every value, the number of values below it plus the middle of its ties, like the average
+    rank of pandas.
+    """
+    result = np.full(values.shape, np.nan)
+    for i, (sketch_values, weights) in enumerate(sketches):
+        column = values[:, i]
+        mask = ~np.isnan(column)
+        cumulative = np.concatenate([[0], np.cumsum(weights)])
+        below = cumulative[np.searchsorted(sketch_values, column[mask], side="left")]
+        up_to = cumulative[np.searchsorted(sketch_values, column[mask], side="right")]
+        result[mask, i] = below + (up_to - below + 1) / 2
+    return result
+
+
+def _rank_moments(values, sketches):
+    return _moments(_ranks(values, sketches))
+
+
+def _kendall(values, pairs, seed):
+    """
+    Kendall tau-b of every pair of columns from pairs of rows where both values are not null. Every pair of rows
+    is compared when there are no more than 'pairs', otherwise 'pairs' random pairs are.
+    """
+    rows = len(values)
+    if rows * (rows - 1) // 2 <= pairs:
+        first, second = np.triu_indices(rows, 1)
+    else:
+        rng = np.random.default_rng(seed)
+        first = rng.integers(0, rows, pairs)
+        second = (first + rng.integers(1, rows, pairs)) % rows
+
+    k = values.shape[1]
+    concordance = np.zeros((k, k))
+    untied = np.zeros((k, k))
+
+    for start in range(0, len(first), KENDALL_CHUNK):
+        a, b = values[first[start:start + KENDALL_CHUNK]], values[second[start:start + KENDALL_CHUNK]]
+        valid = (~np.isnan(a) & ~np.isnan(b)).astype("float64")
+        # Ties and pairs with nulls have sign 0
+        signs = np.nan_to_num(np.sign(a - b))
+        concordance += signs.T @ signs
+        untied += (signs * signs).T @ valid
+
+    divisor = np.sqrt(untied * untied.T)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = np.where(divisor > 0, concordance / divisor, np.nan)
+    return np.clip(result, -1, 1)
+
+
+def _to_frame(matrix, cols):
+    return pd.DataFrame(matrix, index=cols, columns=cols)
+
+
+def matrix(df, cols, method="pearson", seed=1):
+    """
+    Correlation matrix of the numeric columns, using for every pair of columns the rows where both are not null.
+
+    Pearson comes from the co-moments of every partition merged in one pass. Spearman is the pearson correlation
+    of the ranks, approximated with a sketch of every column computed in a first pass. Kendall is computed from
+    pairs of rows of a sample.
+    :param df: Optimus DataFrame
+    :param cols: List of column names
+    :param method: 'pearson', 'spearman' or 'kendall'
+    :param seed: Seed used to sample the rows for kendall
+    :return: Delayed pandas DataFrame with the symmetric matrix
+    """
+    F = df.functions
+    dfd = df.data
+    cols = list(dfd[cols].select_dtypes(include=["number", "bool"]).columns)
+
+    if method == "kendall":
+        sampled = F.delayed(_matrix)(sample.reservoir(df.cols.select(cols), KENDALL_SAMPLE_ROWS, seed), cols)
+        return F.delayed(_to_frame)(F.delayed(_kendall)(sampled, KENDALL_PAIRS, seed), cols)
+
+    partitions = [F.delayed(_matrix)(partition, cols) for partition in F.to_delayed(dfd)]
+
+    if method == "spearman":
+        sketches = F.compute(F.delayed(functools.reduce)(functools.partial(_merge_sketches, size=SKETCH_SIZE),
+                                                         [F.delayed(_sketch)(values, SKETCH_SIZE)
+                                                          for values in partitions]))
+        moments = [F.delayed(_rank_moments)(values, sketches) for values in partitions]
+    else:
+        moments = [F.delayed(_moments)(values) for values in partitions]
+
+    moments = F.delayed(functools.reduce)(_merge_moments, moments)
+    return F.delayed(_to_frame)(F.delayed(_pearson)(moments), cols)
@@ -5,11 +5,14 @@ from abc import abstractmethod
 import pandas as pd
 
 from optimus.engines.base.meta import Meta
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import *
 from optimus.infer import is_dict, is_tuple
 
 
-class BaseCreate:
+class BaseCreate(Timed):
+    _timed_name = "create"
+
     def __init__(self, op: 'DataFrameType'):
         self.op = op
 
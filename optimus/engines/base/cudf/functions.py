@@ -57,6 +57,16 @@ class CUDFBaseFunctions(BaseFunctions, ABC):
     def to_string(series):
         return series.astype(str)
 
+    @staticmethod
+    def _sort_values(dfd, cols, ascending, key=None):
+        if key is None:
+            return dfd.sort_values(cols, ascending=ascending)
+
+        # cuDF does not support 'key', the sort values are saved in temporary columns
+        sort_cols = [f"__{col}_sort__" for col in cols]
+        dfd = dfd.assign(**{sort_col: key(dfd[col]) for col, sort_col in zip(cols, sort_cols)})
+        return dfd.sort_values(sort_cols, ascending=ascending).drop(columns=sort_cols)
+
     def _to_datetime(self, value, format):
         return cudf.to_datetime(value, format=format, errors="coerce")
 
@@ -1,11 +1,13 @@
 from abc import abstractmethod
 
+import dask
 import dask.array as da
 import dask.dataframe as dd
 import distributed
 import humanize
 import numpy as np
 import pandas as pd
+from dask.dataframe.methods import concat
 from dask.utils import parse_bytes
 
 from optimus.engines.base.basedataframe import BaseDataFrame
@@ -73,32 +75,45 @@ class DaskBaseDataFrame(DistributedBaseDataFrame):
         return display(self.data.visualize())
 
     def _iloc(self, lower_bound, upper_bound, copy=True):
-        def func(value):
-            if copy:
-                return value[lower_bound:upper_bound].reset_index(drop=True)
-            return value[lower_bound:upper_bound]
+        if upper_bound is None:
+            pdf = self.data.compute()[lower_bound:]
+        else:
+            pdf = self._head(upper_bound)[lower_bound:upper_bound]
 
-        return self.root.new(self.data.partitions[0].map_partitions(func), meta=self.root.meta)
+        if copy:
+            pdf = pdf.reset_index(drop=True)
 
-    def graph(self) -> dict:
+        return self.root.new(self.root._base_to_dfd(pdf, 1), meta=self.root.meta)
+
+    def _head(self, n):
         """
-        Return a dict the Dask tasks graph
+        First n rows as a pandas or cuDF DataFrame. Partitions are computed in batches that double their size until
+        there are enough rows, so a preview does not compute the whole dataframe.
+        :param n: Number of rows
         :return:
         """
-        return self.data.__dask_graph__().layers
+        dfd = self.data
+        heads = []
+        count = 0
+        start = 0
+        batch = 1
+
+        while start < dfd.npartitions and count < n:
+            stop = min(start + batch, dfd.npartitions)
+            for head in dask.compute(*[dfd.partitions[i].head(n - count, npartitions=1, compute=False)
+                                       for i in range(start, stop)]):
+                heads.append(head)
+                count += len(head)
+            start, batch = stop, batch * 2
+
+        return concat(heads)[:n] if heads else dfd._meta
 
-    def stratified_sample(self, col_name, seed: int = 1):
+    def graph(self) -> dict:
         """
-        Stratified Sampling
-        :param col_name:
-        :param seed:
+        Return a dict the Dask tasks graph
         :return:
         """
-        df = self.data
-        n = min(5, df[col_name].value_counts().min())
-        df = df.groupby(col_name).apply(lambda x: x.sample(2))
-        # df_.index = df_.index.droplevel(0)
-        return self.root.new(df)
+        return self.data.__dask_graph__().layers
 
     def pivot(self, col, groupby, agg=None, values=None):
         """
@@ -212,15 +227,6 @@ class DaskBaseDataFrame(DistributedBaseDataFrame):
         """
         raise NotImplementedError
 
-    def to_dict(self, cols="*", n=10, orient="list"):
-
-
-        if n == "all":
-            series = self.cols.select(cols).to_pandas()
-        else:
-            series = self.cols.select(cols).iloc(0, n).to_pandas()
-
-        return series.to_dict(orient)
 
     def to_pandas(self):
         return self.data.compute()
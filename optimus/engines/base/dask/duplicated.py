@@ -0,0 +1,142 @@
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+BLOOM_FILTER_BITS = None
+"""Size of the Bloom filters used to skip the rows that are unique across partitions before the global pass.
+None disables the pre-screen. Something like 8 bits per distinct value keeps the false positives low"""
+BLOOM_FILTER_HASHES = 3
+
+HASH_COLS = ["__hash_1__", "__hash_2__"]
+PARTITION_COL = "__partition__"
+ROW_COL = "__row__"
+
+# Different keys give two independent 64-bit hashes, used together as a 128-bit row hash
+_HASH_KEYS = ["0123456789123456", "6543219876543210"]
+
+
+def _hash_rows(pdf):
+    """
+    Stable 128-bit hash of every row of a pandas dataframe
+    :param pdf: pandas DataFrame
+    :return: pandas DataFrame with two uint64 columns
+    """
+    return pd.DataFrame({col: pd.util.hash_pandas_object(pdf, index=False, hash_key=key).values
+                         for col, key in zip(HASH_COLS, _HASH_KEYS)}, index=pdf.index)
+
+
+def _local_duplicated(pdf, keep, partition_info=None):
+    """
+    Mark the duplicates inside a partition and keep one candidate per distinct row for the global pass.
+    """
+    hashes = _hash_rows(pdf)
+    hashes[ROW_COL] = np.arange(len(hashes), dtype="int64")
+    hashes[PARTITION_COL] = (partition_info or {}).get("number", 0)
+    hashes["__duplicated__"] = hashes.duplicated(HASH_COLS, keep=keep)
+    return hashes
+
+
+def _candidates(hashes, keep):
+    """
+    One row per distinct hash in the partition. With keep='last' the last occurrence is kept.
+    """
+    return hashes.drop_duplicates(HASH_COLS, keep="last" if keep == "last" else "first")[
+        [*HASH_COLS, PARTITION_COL, ROW_COL]]
+
+
+def _bloom_positions(hashes, bits):
+    # Kirsch-Mitzenmacher: k positions from two hashes
+    h1 = hashes[HASH_COLS[0]].values
+    h2 = hashes[HASH_COLS[1]].values
+    return [(h1 + np.uint64(i) * h2) % np.uint64(bits) for i in range(BLOOM_FILTER_HASHES)]
+
+
+def _bloom_filter(candidates, bits):
+    """
+    Filters of one partition as (seen, seen twice). Candidates are unique inside the partition so nothing is
+    seen twice yet.
+    """
+    seen = np.zeros(bits, dtype=bool)
+    for positions in _bloom_positions(candidates, bits):
+        seen[positions] = True
+    seen = np.packbits(seen)
+    return seen, np.zeros_like(seen)
+
+
+def _merge_bloom_filters(left, right):
+    return left[0] | right[0], left[1] | right[1] | (left[0] & right[0])
+
+
+def _screen(candidates, bloom, bits):
+    """
+    Drop the candidates that are not in more than one partition for sure
+    """
+    twice = np.unpackbits(bloom[1])[:bits].astype(bool)
+    in_many = np.ones(len(candidates), dtype=bool)
+    for positions in _bloom_positions(candidates, bits):
+        in_many &= twice[positions]
+    return candidates[in_many]
+
+
+def _global_duplicated(candidates, keep):
+    """
+    Candidates that are duplicated across partitions. All the rows with the same hash are in the same partition.
+    """
+    candidates = candidates.sort_values([PARTITION_COL, ROW_COL])
+    return candidates.loc[candidates.duplicated(HASH_COLS, keep=keep), [PARTITION_COL, ROW_COL]]
+
+
+def _apply_global(hashes, duplicated_rows):
+    mask = hashes["__duplicated__"].values.copy()
+    mask[duplicated_rows[ROW_COL].values] = True
+    return pd.Series(mask, index=hashes.index)
+
+
+def duplicated(dfd, keep="first", subset=None):
+    """
+    Mark the duplicated rows of a Dask DataFrame without collecting it.
+
+    Every row is hashed with a stable 128-bit hash. Duplicates inside a partition are found locally, then one
+    candidate per distinct row in every partition is shuffled by hash to find the duplicates across partitions.
+    Partition and row ordinals are kept so 'first' and 'last' follow the order of the dataframe. Only the hashes
+    and ordinals are shuffled, not the data.
+    :param dfd: Dask DataFrame
+    :param keep: 'first', 'last' or False
+    :param subset: Columns used to find the duplicates
+    :return: Dask Series of booleans
+    """
+    if subset is not None:
+        dfd = dfd[subset]
+
+    npartitions = dfd.npartitions
+    meta = pd.DataFrame({**{col: pd.Series(dtype="uint64") for col in HASH_COLS},
+                         ROW_COL: pd.Series(dtype="int64"), PARTITION_COL: pd.Series(dtype="int64"),
+                         "__duplicated__": pd.Series(dtype=bool)})
+
+    hashes = dfd.map_partitions(_local_duplicated, keep, meta=meta)
+
+    if npartitions == 1:
+        return hashes["__duplicated__"]
+
+    candidates = hashes.map_partitions(_candidates, keep, meta=meta[[*HASH_COLS, PARTITION_COL, ROW_COL]])
+
+    if BLOOM_FILTER_BITS:
+        bits = int(BLOOM_FILTER_BITS)
+        filters = [dask.delayed(_bloom_filter)(partition, bits) for partition in candidates.to_delayed()]
+        # Tree reduction
+        while len(filters) > 1:
+            filters = [dask.delayed(_merge_bloom_filters)(*filters[i:i + 2]) if i + 1 < len(filters)
+                       else filters[i] for i in range(0, len(filters), 2)]
+        bloom = filters[0]
+        candidates = candidates.map_partitions(_screen, bloom, bits, meta=candidates._meta)
+
+    duplicated_rows = candidates.shuffle(HASH_COLS[0]).map_partitions(_global_duplicated, keep,
+                                                                      meta=meta[[PARTITION_COL, ROW_COL]])
+
+    # Send the duplicates back to the partition they came from, partition i is the division [i, i + 1)
+    divisions = [*range(npartitions), npartitions - 1]
+    duplicated_rows = duplicated_rows.set_index(PARTITION_COL, divisions=divisions)
+
+    return dd.map_partitions(_apply_global, hashes, duplicated_rows, align_dataframes=False,
+                             meta=pd.Series(dtype=bool))
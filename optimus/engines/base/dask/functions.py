@@ -5,11 +5,16 @@ import dask
 import dask.dataframe as dd
 import hiurlparser
 import numpy as np
+import pandas as pd
+from dask.dataframe.methods import concat
 from dask.delayed import delayed
 from dask_ml.preprocessing import MinMaxScaler, StandardScaler
 from sklearn.preprocessing import MaxAbsScaler
 from dask_ml.impute import SimpleImputer
+from optimus.engines.base.dask.duplicated import duplicated
+from optimus.engines.base.dask.sort import sort
 from optimus.engines.base.distributed.functions import DistributedBaseFunctions
+from optimus.engines.base.functions import merge_moments, partial_moments
 from optimus.helpers.core import one_tuple_to_val, val_to_list
 from optimus.infer import is_list
 
@@ -65,12 +70,8 @@ class DaskBaseFunctions(DistributedBaseFunctions):
     def dask_to_compatible(dfd):
         return dfd
 
-    def sort_df(self, dfd, cols, ascending):
-        for c, a in list(zip(cols, ascending))[::-1]:
-            dfd = dfd.sort_values(c)
-            if not a:
-                dfd = self.reverse_df(dfd)
-        return dfd.reset_index(drop=True)
+    def sort_df(self, dfd, cols, ascending, casts=None):
+        return sort(dfd, cols, ascending, casts)
 
     def reverse_df(self, dfd):
         @delayed
@@ -99,7 +100,30 @@ class DaskBaseFunctions(DistributedBaseFunctions):
         else:
             return self._to_float(series)
 
+    def moments(self, series):
+        # Moments of every partition merged in a tree
+        moments = [delayed(partial_moments)(partition) for partition in self.to_float(series).to_delayed()]
+        while len(moments) > 1:
+            moments = [delayed(merge_moments)(*moments[i:i + 2]) if i + 1 < len(moments) else moments[i]
+                       for i in range(0, len(moments), 2)]
+        return moments[0]
+
+    @staticmethod
+    def value_counts(series):
+        @delayed
+        def count(partition):
+            return partition.value_counts(sort=False)
+
+        @delayed
+        def merge(counts):
+            # Distinct values are kept in the order they first appear, like pandas, so ties are sorted the same way
+            return concat(counts).groupby(level=0, sort=False).sum().sort_values(ascending=False)
+
+        return merge([count(partition) for partition in series.to_delayed()])
+
     def duplicated(self, dfd, keep, subset):
+        if isinstance(dfd._meta, pd.DataFrame):
+            return duplicated(dfd, keep=keep, subset=subset)
         return self.from_dataframe(self.to_dataframe(dfd).duplicated(keep=keep, subset=subset))
 
     def impute(self, series, strategy, fill_value):
@@ -123,8 +147,8 @@ class DaskBaseFunctions(DistributedBaseFunctions):
 
         return wrapper
 
-    def from_delayed(self, delayed):
-        return dd.from_delayed(delayed)
+    def from_delayed(self, delayed, meta=None):
+        return dd.from_delayed(delayed, meta=meta)
 
     def to_delayed(self, value):
         return value.to_delayed()
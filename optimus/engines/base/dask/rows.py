@@ -1,5 +1,6 @@
 import functools
 import operator
+from optimus.engines.base.dask.sort import top
 from optimus.engines.base.distributed.rows import DistributedBaseRows
 
 from optimus.engines.base.meta import Meta
@@ -9,6 +10,24 @@ from optimus.helpers.constants import Actions
 
 class DaskBaseRows(DistributedBaseRows):
 
+    def sort(self, cols="*", order="desc", cast=True) -> 'DataFrameType':
+        """
+        Sort rows taking into account multiple columns
+        :param cols:
+        :param order:
+        :param cast: cast rows before sorting them.
+        """
+        cols, order, casts = self._sort_arguments(cols, order, cast)
+        dfd = self.root.data
+
+        sorted_dfd = self.root.functions.sort_df(dfd, cols, order, casts)
+        meta = Meta.action(self.root.meta, Actions.SORT_ROW.value, cols)
+
+        df = self.root.new(sorted_dfd, meta=meta)
+        # used by limit to get the first rows without sorting the whole dataframe
+        df.cache["sort"] = {"data": dfd, "sorted": sorted_dfd, "cols": cols, "order": order, "casts": casts}
+        return df
+
     def limit(self, count):
         """
         Limit the number of rows
@@ -21,31 +40,12 @@ class DaskBaseRows(DistributedBaseRows):
         if count is None:
             return df
 
-        return self.root.new(
-            self.root._base_to_dfd(
-                df.cols.select("*").data.head(count, npartitions=-1), df.partitions() if count > 100 else 1
-            )
-        )
-
-    def _drop_duplicated_builtin(self, cols):
-
-        df = self.root
-        dfd = df.data
-
-        dfd = dfd.drop_duplicates(subset=cols).reset_index(drop=True)
-
-        meta = self.root.meta
-        meta = Meta.action(meta, Actions.DROP_ROW.value, df.cols.names())
+        sort = df.cache.get("sort")
+        if sort is not None and sort["sorted"] is df.data:
+            pdf = top(sort["data"], sort["cols"], sort["order"], sort["casts"], int(count)).compute()
+            return self.root.new(self.root._base_to_dfd(pdf, df.partitions() if count > 100 else 1))
 
-        return self.root.new(dfd, meta=meta)
-                
-    def drop_duplicated(self, cols="*", keep="first", how="any"):
-        # not supported arguments on dask
-        if how == "all" and keep == "first":
-            df = self.root
-            cols = parse_columns(df, cols)
-            return self._drop_duplicated_builtin(cols)
-        return self._mask(cols, func=self.root.mask.duplicated, drop=True, keep=keep, how=how)
+        return self.root.new(self.root._base_to_dfd(df._head(int(count)), df.partitions() if count > 100 else 1))
 
     def between(self, columns, lower_bound=None, upper_bound=None, invert=False, equal=False,
                 bounds=None):
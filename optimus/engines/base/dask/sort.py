@@ -0,0 +1,119 @@
+import dask
+import numpy as np
+import pandas as pd
+from dask.dataframe.methods import concat
+
+SAMPLE_SIZE = 1000
+"""Values of the first sort column taken from every partition to find the bounds of the output partitions"""
+
+PARTITION_COL = "__partition__"
+
+
+def _functions(pdf):
+    if type(pdf).__module__.startswith("cudf"):
+        from optimus.engines.cudf.functions import CUDFFunctions
+        return CUDFFunctions()
+    from optimus.engines.pandas.functions import PandasFunctions
+    return PandasFunctions()
+
+
+def _keys(pdf, col, casts):
+    """
+    Values used to sort a column of a partition as a pandas Series
+    """
+    key = _functions(pdf).sort_key(casts)
+    values = pdf[col] if key is None else key(pdf[col])
+    return values.to_pandas() if hasattr(values, "to_pandas") else values
+
+
+def _sample(pdf, col, casts):
+    """
+    Evenly spaced sort keys of a partition, without nulls.
+    """
+    values = _keys(pdf, col, casts).dropna()
+    if len(values) > SAMPLE_SIZE:
+        values = values.iloc[np.linspace(0, len(values) - 1, SAMPLE_SIZE).astype(int)]
+    return values
+
+
+def _splitters(samples, npartitions):
+    """
+    n - 1 values that split the sampled keys in n ranges of the same size
+    """
+    samples = pd.concat(samples).sort_values().to_numpy()
+    if len(samples) == 0:
+        return samples
+    return samples[[(i * len(samples)) // npartitions for i in range(1, npartitions)]]
+
+
+def _assign_partition(pdf, col, ascending, casts, splitters, npartitions):
+    """
+    Save the output partition of every row. Rows with the same key go to the same partition and nulls go to the
+    last one like in pandas.
+    """
+    values = _keys(pdf, col, casts)
+    nulls = values.isna().values
+
+    partitions = np.full(len(values), npartitions - 1, dtype="int64")
+    positions = np.searchsorted(splitters, values[~nulls].to_numpy(), side="right")
+    partitions[~nulls] = positions if ascending else npartitions - 1 - positions
+    return pdf.assign(**{PARTITION_COL: partitions})
+
+
+def _sort_partition(pdf, cols, ascending, casts):
+    functions = _functions(pdf)
+    return functions._sort_values(pdf, cols, ascending, functions.sort_key(casts))
+
+
+def _top(pdf, cols, ascending, casts, n):
+    # nsmallest and nlargest only need to keep n rows, they can be used for numeric columns sorted in the same
+    # direction. Nulls are handled by sorting
+    if len(set(ascending)) == 1 and all(pdf[col].dtype.kind in "iuf" and (casts or {}).get(col, "float") == "float"
+                                        for col in cols) and not pdf[cols].isna().values.any():
+        return pdf.nsmallest(n, cols) if ascending[0] else pdf.nlargest(n, cols)
+
+    return _sort_partition(pdf, cols, ascending, casts).head(n)
+
+
+def _merge_tops(tops, cols, ascending, casts, n):
+    return _top(concat(tops), cols, ascending, casts, n).reset_index(drop=True)
+
+
+def sort(dfd, cols, ascending, casts=None):
+    """
+    Sort a Dask DataFrame using range partitioning.
+
+    The bounds of the output partitions are taken from a sample of the sort keys of the first column. Every row
+    is sent to the partition of its range and then every partition is sorted locally by all the columns, so there is
+    only one shuffle. The sample is computed when the result is computed.
+    :param dfd: Dask DataFrame
+    :param cols: Columns to sort by
+    :param ascending: List of booleans, one for every column
+    :param casts: Dict with the form {col_name: "float" or "str"} used to cast the values only to compare them.
+    :return: Dask DataFrame
+    """
+    npartitions = dfd.npartitions
+
+    if npartitions == 1:
+        return dfd.map_partitions(_sort_partition, cols, ascending, casts, meta=dfd._meta).reset_index(drop=True)
+
+    samples = [dask.delayed(_sample)(partition, cols[0], casts) for partition in dfd.to_delayed()]
+    splitters = dask.delayed(_splitters)(samples, npartitions)
+
+    meta = dfd._meta.assign(**{PARTITION_COL: pd.Series(dtype="int64")})
+    dfd = dfd.map_partitions(_assign_partition, cols[0], ascending[0], casts, splitters, npartitions, meta=meta)
+
+    # partition i is the division [i, i + 1)
+    dfd = dfd.set_index(PARTITION_COL, divisions=[*range(npartitions), npartitions - 1])
+
+    return dfd.map_partitions(_sort_partition, cols, ascending, casts, meta=dfd._meta).reset_index(drop=True)
+
+
+def top(dfd, cols, ascending, casts, n):
+    """
+    First n rows of the sorted dataframe without sorting it. Every partition keeps only its first n rows, using
+    nsmallest or nlargest when possible, and the results are merged.
+    :return: Delayed pandas or cuDF DataFrame
+    """
+    tops = [dask.delayed(_top)(partition, cols, ascending, casts, n) for partition in dfd.to_delayed()]
+    return dask.delayed(_merge_tops)(tops, cols, ascending, casts, n)
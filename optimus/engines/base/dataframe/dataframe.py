@@ -1,9 +1,7 @@
 from collections.abc import Iterable
 
 from optimus.engines.base.basedataframe import BaseDataFrame
-from optimus.helpers.functions import random_int
-from optimus.helpers.raiseit import RaiseIt
-from optimus.infer import is_int, is_list_value
+from optimus.infer import is_list_value
 
 
 class DataFrameBaseDataFrame(BaseDataFrame):
@@ -12,50 +10,6 @@ class DataFrameBaseDataFrame(BaseDataFrame):
         df = self.data
         return self.new(df, meta=self.meta)
 
-    def _sample(self, n=10, seed=False):
-        return self.root.data.sample(n=n, random_state=seed).reset_index(drop=True)
-
-    def sample(self, n=10, random=False):
-        """
-        Return a n number of sample from a dataFrame
-        :param n: Number of samples
-        :param random: if true get a semi random sample
-        :return:
-        """
-        if not is_int(n):
-            RaiseIt.type_error(n, ["int"])
-
-        if random is True:
-            seed = int(random_int())
-        elif random is False:
-            seed = 0
-        elif is_int(random):
-            seed = random
-        else:
-            RaiseIt.type_error(random, ["bool", "int"])
-
-        df = self.root
-        rows_count = df.rows.count()
-
-        if n > rows_count:
-            n = rows_count
-        dfd = self._sample(n, seed)
-
-        return self.root.new(dfd)
-
-    def stratified_sample(self, col_name, seed: int = 1):
-        """
-        Stratified Sampling
-        :param col_name:
-        :param seed:
-        :return:
-        """
-        df = self.data
-        n = min(5, df[col_name].value_counts().min())
-        df = df.groupby(col_name).apply(lambda x: x.sample(2))
-        # df_.index = df_.index.droplevel(0)
-        return self.root.new(df)
-
     def stack(self, index=None, col_name="variable", value_name="value"):
         """
         Return reshaped DataFrame organized by given index / column values.
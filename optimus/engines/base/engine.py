@@ -8,6 +8,7 @@ from optimus.engines.base.functions import BaseFunctions
 from optimus.engines.base.io.connect import Connect
 from optimus.engines.dask.io.jdbc import JDBC
 from optimus.helpers.logger import logger
+from optimus.helpers.timings import timings as _timings
 
 
 class BaseEngine:
@@ -22,6 +23,17 @@ class BaseEngine:
 
         logger.active(verbose)
 
+    @property
+    def timings(self):
+        """
+        Record the time, and optionally the memory, used by every cols, rows, mask, profile, create, load and save
+        operation.
+        Use it as a context manager 'with op.timings(callback) as events:' or call op.timings.start() and
+        op.timings.stop(). The event of the operation that created a dataframe is saved in df.meta["timings"].
+        :return: Timings
+        """
+        return _timings
+
     def __getstate__(self):
         return self.engine
 
@@ -11,9 +11,9 @@ from metaphone import doublemetaphone
 
 from optimus.helpers.constants import ProfilerDataTypes, ProfilerDataTypesNumeric
 from optimus.helpers.core import one_list_to_val, one_tuple_to_val, val_to_list
-from optimus.helpers.decorators import apply_to_categories
+from optimus.helpers.decorators import apply_to_categories, apply_to_uniques
 from optimus.helpers.logger import logger
-from optimus.infer import is_list, is_list_of_list, is_valid_datetime_format, \
+from optimus.infer import is_list, is_list_of_list, is_tuple, is_valid_datetime_format, \
     is_list_of_int, is_list_of_str, \
     regex_int_compiled, regex_decimal_compiled, regex_credit_card_compiled, regex_email_compiled, \
     regex_phone_number_compiled, regex_http_code_compiled, \
@@ -21,12 +21,42 @@ from optimus.infer import is_list, is_list_of_list, is_valid_datetime_format, \
     regex_ipv4_address_compiled, regex_boolean_compiled, regex_full_url_compiled, \
     regex_BAN_compiled, \
     regex_uuid_compiled, regex_ipv6_address_compiled, regex_mac_address_compiled, regex_address_compiled, \
-    regex_list_compiled, regex_dict_compiled, regex_tuple_compiled
+    regex_list_compiled, regex_dict_compiled, regex_tuple_compiled, multi_pattern_regex
 
+PUNCTUATION_REGEX = r"[^\w\s]"
+WHITESPACE_REGEX = r"\s+"
 
 # ^(?:(?P<protocol>[\w\d]+)(?:\:\/\/))?(?P<sub_domain>(?P<www>(?:www)?)(?:\.?)(?:(?:[\w\d-]+|\.)*?)?)(?:\.?)(?P<domain>[^./]+(?=\.))\.(?P<top_domain>com(?![^/|:?#]))?(?P<port>(:)(\d+))?(?P<path>(?P<dir>\/(?:[^/\r\n]+(?:/))+)?(?:\/?)(?P<file>[^?#\r\n]+)?)?(?:\#(?P<fragment>[^#?\r\n]*))?(?:\?(?P<query>.*(?=$)))*$
 
 
+def partial_moments(series):
+    """
+    Count, sum and sum of squared deviations from the mean (M2) of a series. Deviations are taken from the mean of
+    the series itself so the variance keeps its precision for large values with a small spread.
+    :param series: Numeric series
+    :return: tuple (count, sum, M2)
+    """
+    count = series.count()
+    total = series.sum()
+    if not count:
+        return 0, 0.0, 0.0
+    deviations = series - total / count
+    return count, total, (deviations * deviations).sum()
+
+
+def merge_moments(left, right):
+    """
+    Merge two (count, sum, M2) tuples using Chan's parallel formula.
+    """
+    count_left, total_left, m2_left = left
+    count_right, total_right, m2_right = right
+    count = count_left + count_right
+    if not count_left or not count_right:
+        return count, total_left + total_right, m2_left + m2_right
+    delta = total_right / count_right - total_left / count_left
+    return count, total_left + total_right, m2_left + m2_right + delta * delta * count_left * count_right / count
+
+
 class BaseFunctions(ABC):
     """
     Functions for internal use or to be called using 'F': `from optimus.functions import F`
@@ -114,11 +144,12 @@ class BaseFunctions(ABC):
         """
         return func
 
-    def from_delayed(self, delayed):
+    def from_delayed(self, delayed, meta=None):
         """
         Convert delayed objects to a DataFrame or Series (Dummy method on unsupported engines)
 
         :param delayed:
+        :param meta: Empty DataFrame or Series with the structure of the result
         :return:
         """
         return delayed[0]
@@ -173,17 +204,37 @@ class BaseFunctions(ABC):
         from optimus.engines.base.constants import BaseConstants
         return BaseConstants()
 
-    @staticmethod
-    def sort_df(dfd, cols, ascending):
+    def sort_df(self, dfd, cols, ascending, casts=None):
         """
-        Sort rows taking into account one column
+        Sort rows taking into account multiple columns
 
         :param dfd:
         :param cols:
         :param ascending:
+        :param casts: Dict with the form {col_name: "float" or "str"}. Values are cast only to compare them, the data
+        is not modified.
         :return:
         """
-        return dfd.sort_values(cols, ascending=ascending).reset_index(drop=True)
+        return self._sort_values(dfd, cols, ascending, self.sort_key(casts)).reset_index(drop=True)
+
+    def sort_key(self, casts):
+        """
+        Function that receives a series and returns the values used to sort it, see sort_df.
+        """
+        if not casts:
+            return None
+
+        funcs = {"float": self.to_float, "str": self.to_string}
+
+        def key(series):
+            cast = casts.get(series.name)
+            return series if cast is None else funcs[cast](series)
+
+        return key
+
+    @staticmethod
+    def _sort_values(dfd, cols, ascending, key=None):
+        return dfd.sort_values(cols, ascending=ascending, key=key)
 
     @staticmethod
     def reverse_df(dfd):
@@ -403,6 +454,20 @@ class BaseFunctions(ABC):
         """
         return self.to_float(series).std()
 
+    @staticmethod
+    def value_counts(series):
+        """
+        Count every distinct value of a series, sorted by count
+        """
+        return series.value_counts()
+
+    def moments(self, series):
+        """
+        Get the count, sum and sum of squared deviations from the mean of a series. The mean, variance and standard
+        deviation can be calculated from them without reading the series again.
+        """
+        return partial_moments(self.to_float(series))
+
     def sum(self, series):
         """
         Get the sum of a series
@@ -568,6 +633,7 @@ class BaseFunctions(ABC):
     def exp(self, series):
         return self.to_float(series).exp()
 
+    @apply_to_uniques
     def lemmatize_verbs(self, series):
         import nltk
         w_tokenizer = nltk.tokenize.WhitespaceTokenizer()
@@ -742,25 +808,48 @@ class BaseFunctions(ABC):
     def _replace_string(self, series, to_replace, value, regex):
         return series.replace(to_replace, value, regex=regex)
 
+    def _replace_multi(self, series, search, replace_by, mode, ignore_case, is_regex=False):
+        """
+        Replace every term in one pass using a single regex. Returns None when the terms can not be merged: a
+        replacement per term, empty terms or group references in the replacement of regular expressions.
+        """
+        if is_list(replace_by) or is_tuple(replace_by) or not is_list_of_str(search) or "" in search:
+            return None
+        if is_regex and "\\" in str(replace_by):
+            return None
+        regex = multi_pattern_regex(tuple(search), mode, bool(ignore_case), is_regex)
+        return self._replace_string(series, regex, replace_by, regex=True)
+
     def replace_chars(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
+        series = self.to_string(series)
+        result = self._replace_multi(series, search, replace_by, "chars", ignore_case)
+        if result is not None:
+            return result
         if ignore_case:
             str_regex = [r'(?i)%s' % re.escape(s) for s in search]
         else:
             str_regex = [r'%s' % re.escape(s) for s in search]
-        return self._replace_string(self.to_string(series), str_regex, replace_by, regex=True)
+        return self._replace_string(series, str_regex, replace_by, regex=True)
 
     def replace_words(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
+        series = self.to_string(series)
+        result = self._replace_multi(series, search, replace_by, "words", ignore_case)
+        if result is not None:
+            return result
         if ignore_case:
             str_regex = [r'(?i)\b%s\b' % re.escape(s) for s in search]
         else:
             str_regex = [r'\b%s\b' % re.escape(s) for s in search]
-        return self._replace_string(self.to_string(series), str_regex, replace_by, regex=True)
+        return self._replace_string(series, str_regex, replace_by, regex=True)
 
     def replace_full(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
         if ignore_case:
+            result = self._replace_multi(series, search, replace_by, "full", ignore_case)
+            if result is not None:
+                return result
             regex = True
             str_search = [r'(?i)^%s$' % re.escape(s) for s in search]
         else:
@@ -772,6 +861,9 @@ class BaseFunctions(ABC):
         search = val_to_list(search, convert_tuple=True)
 
         if ignore_case:
+            result = self._replace_multi(series, search, replace_by, "full", ignore_case)
+            if result is not None:
+                return result
             regex = True
             search = [(r'(?i)^%s$' % re.escape(s)) for s in search]
         else:
@@ -788,22 +880,33 @@ class BaseFunctions(ABC):
 
     def replace_regex_chars(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
+        series = self.to_string(series)
+        result = self._replace_multi(series, search, replace_by, "chars", ignore_case, is_regex=True)
+        if result is not None:
+            return result
         if ignore_case:
             str_regex = [r'(?i)%s' % s for s in search]
         else:
             str_regex = [r'%s' % s for s in search]
-        return self._replace_string(self.to_string(series), str_regex, replace_by, regex=True)
+        return self._replace_string(series, str_regex, replace_by, regex=True)
 
     def replace_regex_words(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
+        series = self.to_string(series)
+        result = self._replace_multi(series, search, replace_by, "words", ignore_case, is_regex=True)
+        if result is not None:
+            return result
         if ignore_case:
             str_regex = [r'(?i)\b%s\b' % s for s in search]
         else:
             str_regex = [r'\b%s\b' % s for s in search]
-        return self._replace_string(self.to_string(series), str_regex, replace_by, regex=True)
+        return self._replace_string(series, str_regex, replace_by, regex=True)
 
     def replace_regex_full(self, series, search, replace_by, ignore_case):
         search = val_to_list(search, convert_tuple=True)
+        result = self._replace_multi(series, search, replace_by, "full", ignore_case, is_regex=True)
+        if result is not None:
+            return result
         if ignore_case:
             str_regex = [r'(?i)^%s$' % s for s in search]
         else:
@@ -976,34 +1079,44 @@ class BaseFunctions(ABC):
         series = self.time_between(series, value, date_format)
         return series.dt.days * 86400 + series.dt.seconds
 
+    @apply_to_uniques
     def domain(self, series):
 
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["domain"], na_action=None)
 
+    @apply_to_uniques
     def top_domain(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["top_domain"], na_action=None)
 
+    @apply_to_uniques
     def sub_domain(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["sub_domain"], na_action=None)
 
+    @apply_to_uniques
     def url_scheme(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["protocol"], na_action=None)
 
+    @apply_to_uniques
     def url_path(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["path"], na_action=None)
 
+    @apply_to_uniques
     def url_file(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["file"], na_action=None)
 
+    @apply_to_uniques
     def url_query(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["query"], na_action=None)
 
+    @apply_to_uniques
     def url_fragment(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["fragment"], na_action=None)
 
+    @apply_to_uniques
     def host(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["host"], na_action=None)
 
+    @apply_to_uniques
     def port(self, series):
         return self.to_string(series).map(lambda v: hiurlparser.parse_url(v)["port"], na_action=None)
 
@@ -1091,21 +1204,44 @@ class BaseFunctions(ABC):
 
         return series_result
 
+    @apply_to_uniques
     def date_formats(self, series):
         return series.map(lambda v: hidateinfer.infer([v]))
 
+    def _normalize_key(self, series):
+        # trimmed, lower case, without punctuation or diacritics, in one pass over the values
+        series = self.to_string(series).str.strip().str.lower().str.replace(PUNCTUATION_REGEX, "", regex=True)
+        return self.normalize_chars(series)
+
+    @apply_to_uniques
+    def fingerprint(self, series):
+        # https://github.com/OpenRefine/OpenRefine/blob/master/main/src/com/google/refine/clustering/binning/FingerprintKeyer.java#L56
+        return self._normalize_key(series).map(lambda v: " ".join(sorted(set(v.split()))), na_action="ignore")
+
+    @apply_to_uniques
+    def ngram_fingerprint(self, series, n_size=2):
+        def _ngram_key(value):
+            return "".join(sorted({value[i:i + n_size] for i in range(len(value) - n_size + 1)}))
+
+        return self._normalize_key(self.to_string(series).str.replace(WHITESPACE_REGEX, "", regex=True)).map(_ngram_key, na_action="ignore")
+
+    @apply_to_uniques
     def metaphone(self, series):
         return self.to_string(series).map(jellyfish.metaphone, na_action='ignore')
 
+    @apply_to_uniques
     def double_metaphone(self, series):
         return self.to_string(series).map(doublemetaphone, na_action='ignore')
 
+    @apply_to_uniques
     def nysiis(self, series):
         return self.to_string(series).map(jellyfish.nysiis, na_action='ignore')
 
+    @apply_to_uniques
     def match_rating_codex(self, series):
         return self.to_string(series).map(jellyfish.match_rating_codex, na_action='ignore')
 
+    @apply_to_uniques
     def soundex(self, series):
         return self.to_string(series).map(jellyfish.soundex, na_action='ignore')
 
@@ -11,6 +11,7 @@ from optimus.helpers.core import val_to_list
 from optimus.helpers.functions import prepare_path, unquote_path
 from optimus.helpers.logger import logger
 from optimus.helpers.raiseit import RaiseIt
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import DataFrameType, InternalDataFrameType
 from optimus.infer import is_empty_function, is_list, is_str, is_url
 
@@ -19,7 +20,8 @@ JSON_THRESHOLD = 20
 BYTES_SIZE = 1310720
 
 
-class BaseLoad:
+class BaseLoad(Timed):
+    _timed_name = "load"
 
     def __init__(self, op):
         self.op = op
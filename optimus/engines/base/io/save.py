@@ -1,12 +1,15 @@
 import warnings
 
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import *
 
 DEFAULT_MODE = "w"
 DEFAULT_NUM_PARTITIONS = 1
 
 
-class BaseSave:
+class BaseSave(Timed):
+    _timed_name = "save"
+
     def __init__(self, root: 'DataFrameType'):
         self.root = root
 
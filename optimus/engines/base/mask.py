@@ -5,6 +5,7 @@ from optimus.helpers.constants import ProfilerDataTypes
 from optimus.helpers.core import val_to_list, one_list_to_val
 from optimus.helpers.functions import match_date
 from optimus.helpers.raiseit import RaiseIt
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import *
 from optimus.infer import is_dict, is_str, regex_http_code, regex_social_security_number, regex_phone_number, \
     regex_credit_card_number, regex_zip_code, regex_gender, regex_ipv4_address, regex_email, \
@@ -12,7 +13,9 @@ from optimus.infer import is_dict, is_str, regex_http_code, regex_social_securit
     regex_mac_address, regex_driver_license, regex_list, regex_dict, regex_tuple
 
 
-class Mask(ABC):
+class Mask(Timed, ABC):
+    _timed_name = "mask"
+
     def __init__(self, root: 'DataFrameType'):
         self.root = root
         self.F = root.functions
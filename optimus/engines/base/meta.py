@@ -115,6 +115,20 @@ class Meta:
             meta = Meta.update(meta, ACTIONS_PATH, {"name": name, "columns": v}, list)
         return meta
 
+    @staticmethod
+    def actions(meta, actions) -> dict:
+        """
+        Shortcut to add multiple actions to a dataframe copying the meta data only once
+        :param meta: Meta data to be modified
+        :param actions: List of tuples with the form [(name, value), ...]
+        :return: dict (Meta)
+        """
+        if not actions:
+            return meta
+        current_actions = [*(Meta.get(meta, ACTIONS_PATH) or []),
+                           *({"name": name, "columns": value} for name, value in actions)]
+        return Meta.set(meta or {}, ACTIONS_PATH, current_actions)
+
     @staticmethod
     def update(meta, path, value, default=list) -> dict:
         """
@@ -157,6 +171,23 @@ class Meta:
             meta = Meta.reset(meta, f'profile.columns.{col}')
         return meta
 
+    @staticmethod
+    def rename_columns(meta, names):
+        """
+        Move the data types, max cell length and profile of renamed columns to their new names
+        :param meta: Meta data to be modified
+        :param names: Dict with the form {old_name: new_name}
+        :return: dict (Meta)
+        """
+        for _cols in ['columns_data_types', 'max_cell_length', 'profile.columns']:
+            found = Meta.get(meta, _cols)
+            if not is_dict(found) or not any(col in found for col in names):
+                continue
+            found = {names.get(col, col): value for col, value in found.items()
+                     if col in names or col not in names.values()}
+            meta = Meta.set(meta, _cols, found)
+        return meta
+
     @staticmethod
     def select_columns(meta, cols):
         all_cols = []
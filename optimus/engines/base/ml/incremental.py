@@ -0,0 +1,131 @@
+import functools
+
+import numpy as np
+from sklearn.base import is_classifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from optimus.engines.base import sample
+
+
+def _values(pdf, features, target, test_size, seed, test=False, partition=0):
+    """
+    Features and target of the train or test rows of a partition. A row is a test row when its sampling key is in
+    the first 'test_size' fraction of the keys, so the split does not depend on the partitions.
+    """
+    if hasattr(pdf, "to_pandas"):
+        pdf = pdf.to_pandas()
+
+    limit = np.uint64(min(int(test_size * 2 ** 64), 2 ** 64 - 1))
+    mask = sample._keys(pdf, seed, partition) < limit
+    if not test:
+        mask = ~mask
+
+    X = pdf.loc[mask, features].to_numpy(dtype="float64")
+    y = pdf.loc[mask, target[0]].to_numpy() if target else None
+    return X, y
+
+
+def _fit_scaler(scaler, values):
+    X, _ = values
+    if len(X):
+        scaler.partial_fit(X)
+    return scaler
+
+
+def _partial_fit(estimator, scaler, values, kwargs):
+    X, y = values
+    if len(X):
+        if scaler is not None:
+            X = scaler.transform(X)
+        if y is None:
+            estimator.partial_fit(X, **kwargs)
+        else:
+            estimator.partial_fit(X, y, **kwargs)
+    return estimator
+
+
+def _metrics(model, values):
+    X, y = values
+    if not len(X):
+        return {"count": 0}
+
+    if y is None:
+        # k-means: the negative sum of the squared distances to the closest center
+        return {"count": len(X), "inertia": -model.score(X)}
+
+    y_pred = model.predict(X)
+    if is_classifier(model):
+        return {"count": len(X), "correct": int((y == y_pred).sum())}
+
+    errors = y - y_pred
+    return {"count": len(X), "sum": y.sum(), "sum_squares": (y * y).sum(), "squared_errors": (errors * errors).sum(),
+            "absolute_errors": np.abs(errors).sum()}
+
+
+def _merge_metrics(left, right):
+    return {key: left.get(key, 0) + right.get(key, 0) for key in set(left) | set(right)}
+
+
+def _format_metrics(metrics):
+    count = metrics.pop("count")
+    if not count:
+        return {}
+
+    if "inertia" in metrics:
+        return {"inertia": metrics["inertia"]}
+
+    if "correct" in metrics:
+        return {"accuracy": metrics["correct"] / count}
+
+    mse = metrics["squared_errors"] / count
+    total = metrics["sum_squares"] - metrics["sum"] ** 2 / count
+    return {"neg_mean_absolute_error": -metrics["absolute_errors"] / count, "neg_mean_squared_error": -mse,
+            "neg_root_mean_squared_error": -np.sqrt(mse),
+            "r2": 1 - metrics["squared_errors"] / total if total else np.nan}
+
+
+def fit(df, features, target, estimator, test_size=0.2, seed=0, epochs=1, scale=True, **kwargs):
+    """
+    Train an estimator with partial_fit one partition at a time, so the data is never collected.
+
+    Rows are split between train and test using a hash of their values. With 'scale' the features are standardized
+    with a scaler fitted in a first pass. Then every epoch passes every partition to partial_fit, the estimator
+    goes from a partition to the next one, and a last pass evaluates the model with the test rows.
+    :param df: Optimus DataFrame with numeric columns and no missing values
+    :param features: List of column names
+    :param target: List with the name of the target column, or an empty list
+    :param estimator: scikit-learn estimator with partial_fit
+    :param test_size: Fraction of the rows used to evaluate the model
+    :param seed: Seed of the split
+    :param epochs: Number of passes over the train rows
+    :param scale: Standardize the features
+    :param kwargs: Arguments passed to partial_fit
+    :return: tuple with the fitted model, a pipeline if the features are scaled, and the test metrics
+    """
+    F = df.functions
+    partitions = list(zip(F.to_delayed(df.data), sample._partitions(df.data)))
+
+    def train():
+        return [F.delayed(_values)(partition, features, target, test_size, seed, partition=i)
+                for partition, i in partitions]
+
+    scaler = None
+    if scale:
+        scaler = StandardScaler()
+        for values in train():
+            scaler = F.delayed(_fit_scaler)(scaler, values)
+        scaler = F.compute(scaler)
+
+    for _ in range(epochs):
+        for values in train():
+            estimator = F.delayed(_partial_fit)(estimator, scaler, values, kwargs)
+        estimator = F.compute(estimator)
+
+    model = estimator if scaler is None else make_pipeline(scaler, estimator)
+
+    metrics = [F.delayed(_metrics)(model, F.delayed(_values)(partition, features, target, test_size, seed, True, i))
+               for partition, i in partitions]
+    metrics = F.compute(F.delayed(functools.reduce)(_merge_metrics, metrics))
+
+    return model, _format_metrics(metrics)
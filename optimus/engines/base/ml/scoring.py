@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+
+CHUNK_SIZE = 100000
+"""Rows of a partition converted to a feature matrix and predicted at a time"""
+
+
+def _model(model):
+    return model
+
+
+def _features(pdf, features):
+    """
+    Float matrix of the feature columns, values that are not numbers as nan.
+    """
+    if hasattr(pdf, "to_pandas"):
+        pdf = pdf.to_pandas()
+    pdf = pdf[features]
+    numeric = pdf.select_dtypes(include=["number", "bool"]).columns
+    if len(numeric) < len(features):
+        pdf = pdf.apply(pd.to_numeric, errors="coerce")
+    return pdf.to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _output_cols(model, method, output_col, n_features):
+    """
+    Names and dtypes of the columns written by 'method', from the prediction of a single row. Numeric predictions
+    are stored as floats so rows with missing features can be null.
+    """
+    sample = np.asarray(getattr(model, method)(np.zeros((1, n_features))))
+    dtype = "float64" if sample.dtype.kind in "biuf" else "object"
+    if sample.ndim == 1:
+        return {output_col: dtype}
+    return {f"{output_col}_{i}": dtype for i in range(sample.shape[1])}
+
+
+def _predict(pdf, model, features, method, output_cols, chunk_size):
+    """
+    Partition with the predictions of 'model' as new columns. The features are converted and predicted
+    'chunk_size' rows at a time, rows with a missing feature are not predicted.
+    """
+    rows = len(pdf)
+    values = [np.full(rows, np.nan if dtype == "float64" else None, dtype=dtype) for dtype in output_cols.values()]
+
+    for start in range(0, rows, chunk_size):
+        X = _features(pdf[features].iloc[start:start + chunk_size], features)
+        valid = ~np.isnan(X).any(axis=1)
+        if not valid.any():
+            continue
+        prediction = np.asarray(getattr(model, method)(X[valid]))
+        if prediction.ndim == 1:
+            prediction = prediction[:, None]
+        index = np.arange(start, start + len(X))[valid]
+        for i, column in enumerate(values):
+            column[index] = prediction[:, i]
+
+    pdf = pdf.copy()
+    for name, column in zip(output_cols, values):
+        pdf[name] = column
+    return pdf
+
+
+def predict(df, model, features, output_col="prediction", method="predict", chunk_size=CHUNK_SIZE):
+    """
+    Predict every partition of a dataframe with a fitted model, writing the predictions as new columns.
+
+    The model is held by a single task every partition depends on, so it is sent once to every worker instead of
+    once per partition, and a partition is converted to a feature matrix in chunks so the memory used does not
+    grow with the size of the partition.
+    :param df: Optimus DataFrame
+    :param model: Fitted scikit-learn estimator or pipeline
+    :param features: List of column names, in the order used to fit the model
+    :param output_col: Name of the output column, or prefix of the output columns of 'predict_proba'
+    :param method: 'predict', 'predict_proba' or any other method of the model that takes a feature matrix
+    :param chunk_size: Rows predicted at a time
+    :return: tuple with the dask or pandas DataFrame with the predictions and the names of the new columns
+    """
+    F = df.functions
+    dfd = df.data
+
+    output_cols = _output_cols(model, method, output_col, len(features))
+    meta = None
+    if hasattr(dfd, "_meta"):
+        meta = _predict(dfd._meta, model, features, method, output_cols, chunk_size)
+
+    model = F.delayed(_model)(model)
+    partitions = [F.delayed(_predict)(partition, model, features, method, output_cols, chunk_size)
+                  for partition in F.to_delayed(dfd)]
+
+    return F.from_delayed(partitions, meta=meta), list(output_cols)
@@ -0,0 +1,112 @@
+import functools
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, HashingVectorizer
+from sklearn.preprocessing import normalize
+
+
+def _documents(pdf, cols):
+    """
+    Text of the columns of every row joined by a space, as a pandas Series
+    """
+    if hasattr(pdf, "to_pandas"):
+        pdf = pdf.to_pandas()
+    texts = [pdf[col].fillna("").astype(str) for col in cols]
+    return functools.reduce(lambda a, b: a + " " + b, texts)
+
+
+def _vocabulary(documents, kwargs):
+    try:
+        return set(CountVectorizer(**kwargs).fit(documents).vocabulary_)
+    except ValueError:
+        # Partitions without terms
+        return set()
+
+
+def _merge_vocabularies(vocabularies):
+    # Sorted like in scikit-learn
+    return {term: i for i, term in enumerate(sorted(set().union(*vocabularies)))}
+
+
+def _counts(documents, kwargs, vocabulary, n_features):
+    if vocabulary is None:
+        vectorizer = HashingVectorizer(n_features=n_features, alternate_sign=False, norm=None, **kwargs)
+    else:
+        vectorizer = CountVectorizer(vocabulary=vocabulary, **kwargs)
+    return sparse.csr_matrix(vectorizer.transform(documents), dtype="float64")
+
+
+def _document_frequency(counts):
+    return np.bincount(counts.indices, minlength=counts.shape[1]), counts.shape[0]
+
+
+def _merge_document_frequencies(left, right):
+    return left[0] + right[0], left[1] + right[1]
+
+
+def _tf_idf(counts, frequencies):
+    # Smoothed idf and l2 norm, the defaults of scikit-learn's TfidfVectorizer
+    document_frequency, n = frequencies
+    idf = np.log((1 + n) / (1 + document_frequency)) + 1
+    return normalize(counts @ sparse.diags(idf), norm="l2", copy=False)
+
+
+def _used_features(matrix):
+    return np.unique(matrix.indices)
+
+
+def _to_frame(matrix, names, features=None):
+    if features is not None:
+        matrix = matrix[:, features]
+    return pd.DataFrame.sparse.from_spmatrix(matrix, columns=names)
+
+
+def vectorize(df, cols, tf_idf=False, hashing=False, n_features=2 ** 20, output="dataframe", **kwargs):
+    """
+    Count the terms of the text of the columns of every row, or get their TF-IDF, as a sparse matrix.
+
+    Every partition is fitted separately and the vocabularies are merged, then every partition is transformed
+    using the merged vocabulary. With hashing the terms are hashed to n_features columns and there is no
+    vocabulary to fit. The document frequencies used by TF-IDF are also computed by partition and merged.
+    :param df: Optimus DataFrame
+    :param cols: List of column names
+    :param tf_idf: Get the TF-IDF instead of the term counts
+    :param hashing: Hash the terms instead of building a vocabulary
+    :param n_features: Number of columns using hashing
+    :param output: 'dataframe' to get a DataFrame of the same engine with pandas sparse columns or 'matrix' to
+    get a scipy CSR matrix
+    :param kwargs: Arguments passed to the scikit-learn vectorizer
+    :return:
+    """
+    F = df.functions
+    documents = [F.delayed(_documents)(partition, cols) for partition in F.to_delayed(df.data)]
+
+    vocabulary = None
+    if not hashing:
+        vocabulary = F.compute(F.delayed(_merge_vocabularies)(
+            [F.delayed(_vocabulary)(partition, kwargs) for partition in documents]))
+
+    matrices = [F.delayed(_counts)(partition, kwargs, vocabulary, n_features) for partition in documents]
+
+    if tf_idf:
+        frequencies = F.delayed(functools.reduce)(_merge_document_frequencies,
+                                                  [F.delayed(_document_frequency)(matrix) for matrix in matrices])
+        matrices = [F.delayed(_tf_idf)(matrix, frequencies) for matrix in matrices]
+
+    if output == "matrix":
+        return F.compute(F.delayed(sparse.vstack)(matrices, format="csr"))
+
+    features = None
+    if hashing:
+        # Only the columns of the hashes found in the data
+        features = F.compute(F.delayed(functools.reduce)(np.union1d, [F.delayed(_used_features)(matrix)
+                                                                      for matrix in matrices]))
+        names = [f"hash_{i}" for i in features]
+    else:
+        names = list(vocabulary)
+
+    meta = _to_frame(sparse.csr_matrix((0, n_features if hashing else len(names))), names, features)
+    dfd = F.from_delayed([F.delayed(_to_frame)(matrix, names, features) for matrix in matrices], meta=meta)
+    return df.new(dfd)
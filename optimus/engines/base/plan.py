@@ -0,0 +1,134 @@
+from optimus.engines.base.meta import Meta
+from optimus.infer import is_str
+from optimus.helpers.types import *
+
+
+class Plan:
+    """
+    Logical plan used by lazy dataframes. Every element-wise transformation applied through `cols.apply` is stored
+    as a node instead of being executed. A node reads from a column of the data or from the output of a previous
+    node, so transformations that share a prefix reference it instead of repeating it. When the plan is executed
+    every node is evaluated once, in the order it was added, and the results are assigned in one pass.
+    """
+
+    def __init__(self, names=None, nodes=None, current=None, actions=None):
+        """
+        :param names: Ordered column names after applying every pending node.
+        :param nodes: List of nodes with the form [(source, func, args), ...]. 'source' is a column name of the
+        data or the index of a previous node.
+        :param current: Dict with the form {col_name: node_index} with the node that holds every modified column.
+        :param actions: Pending meta actions with the form [(action_name, col_name), ...].
+        """
+        self.names = names
+        self.nodes = nodes or []
+        self.current = current or {}
+        self.actions = actions or []
+
+    def __repr__(self):
+        return f"Plan({self.chains})"
+
+    @property
+    def chains(self) -> dict:
+        """
+        Functions applied to every modified column, with the form {col_name: [func_name, ...]}.
+        """
+        result = {}
+        for col, index in self.current.items():
+            chain = []
+            while not is_str(index):
+                source, func, _ = self.nodes[index]
+                chain.insert(0, func.__name__)
+                index = source
+            result[col] = chain
+        return result
+
+    @property
+    def pending(self) -> bool:
+        return len(self.current) > 0
+
+    def copy(self) -> 'Plan':
+        # Nodes are immutable tuples so the list can be copied without copying them
+        return Plan(list(self.names) if self.names is not None else None, list(self.nodes), dict(self.current),
+                    list(self.actions))
+
+    def add(self, input_col, output_col, func, args, meta_action) -> 'Plan':
+        """
+        Returns a new plan with the node appended.
+
+        :param input_col: Column to read from.
+        :param output_col: Column where the result will be saved.
+        :param func: Element-wise function which receives a series.
+        :param args: Arguments passed to 'func'.
+        :param meta_action: Action to be saved in the meta data when the plan is executed.
+        :return: Plan
+        """
+        plan = self.copy()
+
+        plan.nodes.append((plan.current.get(input_col, input_col), func, args))
+        plan.current[output_col] = len(plan.nodes) - 1
+
+        # Preserve column order
+        if output_col not in plan.names:
+            col_index = plan.names.index(input_col) + 1
+            plan.names[col_index:col_index] = [output_col]
+
+        plan.actions.append((meta_action, output_col))
+
+        return plan
+
+    def execute(self, df: 'DataFrameType') -> 'InternalDataFrameType':
+        """
+        Apply every pending node to the dataframe data and clear the nodes.
+
+        :param df: Lazy dataframe that holds this plan.
+        :return: Internal dataframe with the transformed columns.
+        """
+        dfd = df._data
+
+        # Only the nodes needed by the current columns are evaluated, counting how many nodes read every result so
+        # intermediate series are released as soon as they are not needed
+        readers = {}
+        needed = set()
+        for index in self.current.values():
+            while not is_str(index) and index not in needed:
+                needed.add(index)
+                index = self.nodes[index][0]
+                if not is_str(index):
+                    readers[index] = readers.get(index, 0) + 1
+
+        outputs = {index: col for col, index in self.current.items()}
+        results = {}
+
+        for index in sorted(needed):
+            source, func, args = self.nodes[index]
+            if is_str(source):
+                series = dfd[source]
+            else:
+                series = results[source]
+                readers[source] -= 1
+                if readers[source] == 0 and source not in outputs:
+                    del results[source]
+
+            series = func(series, *args)
+            if not hasattr(series, "index"):
+                # functions like scalers return arrays, we need a series to keep chaining
+                name = outputs.get(index, "__plan__")
+                series = df.new(dfd)._assign({name: series})[name]
+            results[index] = series
+
+        dfd = df.new(dfd)._assign({col: results[index] for col, index in self.current.items()})
+        self.nodes = []
+        self.current = {}
+
+        return dfd[self.names]
+
+    def flush_actions(self, meta) -> dict:
+        """
+        Save the pending actions in the meta data using only one copy of it.
+
+        :param meta: Meta data to be modified
+        :return: dict (Meta)
+        """
+        meta = Meta.actions(meta, self.actions)
+        self.actions = []
+        return meta
@@ -8,13 +8,15 @@ from optimus.helpers.columns import parse_columns
 from optimus.helpers.core import one_list_to_val
 from optimus.helpers.functions import update_dict
 from optimus.helpers.json import dump_json
+from optimus.helpers.timings import Timed, timings
 from optimus.helpers.types import *
 from optimus.infer import is_list
 from optimus.profiler.constants import MAX_BUCKETS
 
 
-class BaseProfile(ABC):
+class BaseProfile(Timed, ABC):
     """Base class for all profile implementations"""
+    _timed_name = "profile"
 
     def __init__(self, root: 'DataFrameType'):
         self.root = root
@@ -166,7 +168,7 @@ class BaseProfile(ABC):
                 cols_data_types = {col: cols_data_types[col] for col in cols_to_profile if col in cols_data_types}
 
             _t = time.process_time()
-            mismatch = df.cols.quality(cols_data_types)
+            mismatch = df.cols.quality(cols_data_types, compute=False)
             profiler_time["count_mismatch"] = {
                 "columns": cols_data_types, "elapsed_time": time.process_time() - _t}
 
@@ -311,5 +313,5 @@ class BaseProfile(ABC):
         meta = Meta.reset_actions(meta, parse_columns(df, cols or []))
         df.meta = meta
         profiler_time["end"] = {"elapsed_time": time.process_time() - _t}
-        # print(profiler_time)
+        timings.annotate(profiler_time)
         return df
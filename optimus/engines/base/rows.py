@@ -7,12 +7,14 @@ from optimus.helpers.columns import parse_columns, prepare_columns_arguments
 from optimus.helpers.constants import Actions
 from optimus.helpers.core import val_to_list
 from optimus.helpers.raiseit import RaiseIt
+from optimus.helpers.timings import Timed
 from optimus.helpers.types import *
 from optimus.infer import is_dict, is_list_of_str, is_list_of_tuples, is_list_value, is_str
 
 
-class BaseRows(ABC):
+class BaseRows(Timed, ABC):
     """Base class for all Rows implementations"""
+    _timed_name = "rows"
 
     def __init__(self, root: 'DataFrameType'):
         self.root = root
@@ -159,6 +161,7 @@ class BaseRows(ABC):
         meta = Meta.action(df.meta, Actions.SELECT_ROW.value, df.cols.names())
 
         df = self.root.new(dfd, meta=meta)
+        df.cache["inferred_types"] = dict(self.root.cache.get("inferred_types", {}))
         return df
 
     def _count(self, compute=True) -> int:
@@ -201,13 +204,25 @@ class BaseRows(ABC):
         :param order:
         :param cast: cast rows before sorting them.
         """
+        cols, order, casts = self._sort_arguments(cols, order, cast)
+
+        dfd = self.root.functions.sort_df(self.root.data, cols, order, casts)
+        meta = Meta.action(self.root.meta, Actions.SORT_ROW.value, cols)
+
+        return self.root.new(dfd, meta=meta)
+
+    def _sort_arguments(self, cols, order, cast) -> tuple:
+        """
+        Columns, list of booleans with the order of every column and the casts used to compare the values.
+        Values are cast only to get the sort keys, the cast columns are not saved in the dataframe.
+        """
         df = self.root
 
         if is_dict(cols):
             cols = list(cols.items())
 
         if is_list_of_tuples(cols):
-            cols, order = zip(*cols)
+            cols, order = map(list, zip(*cols))
 
         cols = parse_columns(df, cols)
         order = prepare_columns_arguments(cols, order)
@@ -221,28 +236,14 @@ class BaseRows(ABC):
 
         order = [_set_order(o) for o in order]
 
-        if cast:
-            sort_cols = [f"__{col}_sort__" for col in cols]
-            types = df.cols.inferred_data_type(cols, use_internal=True, tidy=False)["inferred_data_type"]
-            casts = {}
-
-            for col_name, data_type in types.items():
-                _cast = "float" if data_type in df.constants.NUMERIC_INTERNAL_TYPES else "str"
-                casts.update({col_name: _cast})
-
-            df = df.cols.cast(casts, output_cols=sort_cols)
-        else:
-            sort_cols = cols
-
-        dfd = df.functions.sort_df(df.data, sort_cols, order)
-        meta = Meta.action(self.root.meta, Actions.SORT_ROW.value, cols)
+        casts = None
 
         if cast:
-            dfd = dfd.drop(sort_cols, axis=1)
-
-        df = self.root.new(dfd, meta=meta)
+            types = df.cols.inferred_data_type(cols, use_internal=True, tidy=False)["inferred_data_type"]
+            casts = {col_name: "float" if data_type in df.constants.NUMERIC_INTERNAL_TYPES else "str"
+                     for col_name, data_type in types.items()}
 
-        return df
+        return cols, order, casts
 
     def reverse(self) -> 'DataFrameType':
         """
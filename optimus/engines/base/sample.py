@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+BLOCK_SAMPLE_ROWS = 10
+"""Rows read for every sampled row using block sampling before the remaining partitions are skipped"""
+
+KEY_COL = "__sample_key__"
+
+GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(values):
+    # splitmix64 finalizer, spreads the seeded row hashes uniformly over the 64 bits
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def _combine(keys, values):
+    # splitmix64 steps, adding the golden ratio increments keeps 0 apart from the other values
+    return _mix(keys + (np.asarray(values, dtype="uint64") + np.uint64(1)) * GOLDEN)
+
+
+def _labels(index):
+    """
+    64 bits of every index label. Integer labels are used as they are, other labels are hashed.
+    """
+    if hasattr(index, "to_pandas"):
+        index = index.to_pandas()
+    if index.dtype.kind in "iu":
+        return index.values.astype("uint64")
+    return pd.util.hash_pandas_object(index, index=False).values
+
+
+def _keys(pdf, seed, partition=0):
+    """
+    Random key of every row, taken from its index label and the seed, so a row gets the same key no matter the
+    engine or the partition it is in, and rows with the same values get independent keys. Repeated labels are told
+    apart by their occurrence number and, when the labels of different partitions can repeat, by 'partition'.
+    :param pdf: pandas or cudf DataFrame
+    :param seed: Integer seed
+    :param partition: Number of the partition
+    :return: numpy array of uint64
+    """
+    index = pdf.index
+    keys = _labels(index)
+    with np.errstate(over="ignore"):
+        keys = _combine(keys, seed)
+        if not index.is_unique:
+            keys = _combine(keys, pd.Series(keys).groupby(keys, sort=False).cumcount().values)
+        if partition:
+            keys = _combine(keys, partition)
+    return keys
+
+
+def _smallest(pdf, n, seed, by=None, partition=0):
+    """
+    Rows with the n smallest keys of a partition, or of every value of 'by'.
+    """
+    if by is None:
+        keys = pdf[KEY_COL].values if KEY_COL in pdf.columns else _keys(pdf, seed, partition)
+        if len(pdf) > n:
+            # only the rows taken get the key column
+            rows = np.argpartition(keys, n)[:n]
+            pdf, keys = pdf.iloc[rows], keys[rows]
+        return pdf.assign(**{KEY_COL: keys}).sort_values(KEY_COL, kind="stable")
+
+    if KEY_COL not in pdf.columns:
+        pdf = pdf.assign(**{KEY_COL: _keys(pdf, seed, partition)})
+
+    pdf = pdf.sort_values([by, KEY_COL], kind="stable")
+    return pdf.groupby(by, dropna=False, sort=False).head(n)
+
+
+def _block(pdf, n, seed, partition):
+    return _smallest(pdf, n, seed, partition=partition), len(pdf)
+
+
+def _partitions(dfd):
+    """
+    Number of every partition used to build the keys, 0 when the index labels are not repeated between partitions.
+    """
+    count = getattr(dfd, "npartitions", 1)
+    if getattr(dfd, "known_divisions", True):
+        return [0] * count
+    return list(range(count))
+
+
+def _merge(samples, n, seed, by=None):
+    if type(samples[0]).__module__.startswith("cudf"):
+        import cudf
+        pdf = cudf.concat(samples)
+    else:
+        pdf = pd.concat(samples)
+    return _smallest(pdf, n, seed, by).drop(columns=KEY_COL).reset_index(drop=True)
+
+
+def reservoir(df, n, seed):
+    """
+    Uniform sample of n rows without replacement in a single pass. Every row gets a random key and every partition
+    keeps the n rows with the smallest keys, like a reservoir of size n. The n smallest of all the partitions are a
+    uniform sample of the whole dataframe.
+    :param df: Optimus DataFrame
+    :param n: Number of rows
+    :param seed: Integer seed
+    :return: DataFrame of the same engine. On Dask it is computed when the result is computed
+    """
+    F = df.functions
+    dfd = df.data
+    samples = [F.delayed(_smallest)(partition, n, seed, partition=i)
+               for partition, i in zip(F.to_delayed(dfd), _partitions(dfd))]
+    return F.from_delayed([F.delayed(_merge)(samples, n, seed)], meta=getattr(dfd, "_meta", None))
+
+
+def block(df, n, seed):
+    """
+    Sample of n rows that reads only some partitions. Partitions are taken in a random order in batches that double
+    their size until BLOCK_SAMPLE_ROWS rows were read for every sampled row, every partition read contributes in
+    proportion to its number of rows.
+    :param df: Optimus DataFrame
+    :param n: Number of rows
+    :param seed: Integer seed
+    :return: DataFrame of the same engine
+    """
+    F = df.functions
+    partitions = F.to_delayed(df.data)
+    numbers = _partitions(df.data)
+    order = np.random.default_rng(seed).permutation(len(partitions))
+
+    samples = []
+    count = 0
+    start = 0
+    batch = 1
+
+    while start < len(partitions) and count < n * BLOCK_SAMPLE_ROWS:
+        stop = min(start + batch, len(partitions))
+        results = F.compute(*[F.delayed(_block)(partitions[i], n, seed, numbers[i]) for i in order[start:stop]])
+        for sample, rows in results if stop - start > 1 else [results]:
+            samples.append(sample)
+            count += rows
+        start, batch = stop, batch * 2
+
+    return F.from_delayed([F.delayed(_merge)(samples, n, seed)], meta=getattr(df.data, "_meta", None))
+
+
+def stratified(df, col_name, n, seed):
+    """
+    Sample of up to n rows for every value of a column, chosen with the same keys used by reservoir sampling.
+    :param df: Optimus DataFrame
+    :param col_name: Column with the strata
+    :param n: Number of rows for every value
+    :param seed: Integer seed
+    :return: DataFrame of the same engine
+    """
+    F = df.functions
+    dfd = df.data
+    samples = [F.delayed(_smallest)(partition, n, seed, col_name, i)
+               for partition, i in zip(F.to_delayed(dfd), _partitions(dfd))]
+    return F.from_delayed([F.delayed(_merge)(samples, n, seed, col_name)], meta=getattr(dfd, "_meta", None))
@@ -1,15 +1,68 @@
-import copy
 from itertools import combinations_with_replacement
 from optimus.helpers.types import *
 
 import jellyfish as jellyfish
 import numpy as np
+import pandas as pd
 
 from optimus.engines.base.ml.constants import CLUSTER_COL
 from optimus.helpers.columns import parse_columns, name_col
 from optimus.helpers.output import output_json
 from optimus.helpers.raiseit import RaiseIt
-from optimus.infer import is_list, is_str
+from optimus.infer import is_str
+
+
+CLUSTERS_LIMIT = 100
+"""Clusters returned by string_clustering by default, the ones with the most rows"""
+
+
+def _cluster_arrays(clusters, suggestions, total_counts, values, codes):
+    """
+    Compact representation of the clusters of a column. Every value is in the cluster of the same position in
+    'codes', the values are sorted by cluster and clusters are sorted by their total count.
+    """
+    codes = np.asarray(codes, dtype="int64")
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    return {"cluster": np.asarray(clusters, dtype=object), "suggestion": np.asarray(suggestions, dtype=object),
+            "total_count": np.asarray(total_counts, dtype="int64"), "value": np.asarray(values, dtype=object)[order],
+            "start": np.searchsorted(codes, np.arange(len(clusters) + 1))}
+
+
+def _from_counts(keys, values, counts, limit=None):
+    """
+    Clusters from the count of every distinct value and its key. The most frequent value of a cluster is its
+    suggestion.
+    """
+    codes, clusters = pd.factorize(np.asarray(keys, dtype=object))
+    counts = np.asarray(counts, dtype="int64")
+    total_counts = np.bincount(codes, weights=counts, minlength=len(clusters)).astype("int64")
+
+    # number the clusters by their total count
+    ranks = np.empty(len(clusters), dtype="int64")
+    ranks[np.argsort(-total_counts, kind="stable")] = np.arange(len(clusters))
+    codes = ranks[codes]
+    clusters, total_counts = np.asarray(clusters, dtype=object)[np.argsort(ranks)], total_counts[np.argsort(ranks)]
+
+    values = np.asarray(values, dtype=object)
+    order = np.lexsort((-counts, codes))
+    values, codes = values[order], codes[order]
+
+    if limit is not None:
+        keep = codes < limit
+        values, codes, clusters, total_counts = values[keep], codes[keep], clusters[:limit], total_counts[:limit]
+
+    first = np.searchsorted(codes, np.arange(len(clusters)))
+    return _cluster_arrays(clusters, values[first], total_counts, values, codes)
+
+
+def _from_suggestions(suggestions, limit=None):
+    suggestions = suggestions[:limit]
+    values = [value for suggestion in suggestions for value in suggestion["suggestions"]]
+    codes = [i for i, suggestion in enumerate(suggestions) for _ in suggestion["suggestions"]]
+    return _cluster_arrays([suggestion["cluster"] for suggestion in suggestions],
+                           [suggestion["suggestion"] for suggestion in suggestions],
+                           [suggestion["total_count"] for suggestion in suggestions], values, codes)
 
 
 class Clusters:
@@ -17,6 +70,9 @@ class Clusters:
     clusters = {}
 
     def __init__(self, clusters):
+        """
+        :param clusters: dict with the arrays of the clusters of every column, see _cluster_arrays
+        """
         self.clusters = clusters
 
     def __repr__(self):
@@ -32,17 +88,16 @@ class Clusters:
         if isinstance(column, (int,)):
             column = list(self.clusters.keys())[column]
 
-        if is_str(suggestion_or_id):
-            for i in range(len(self.clusters[column])):
-                if (self.clusters[column][i]["suggestion"] == suggestion_or_id) or (
-                        self.clusters[column][i]["cluster"] == suggestion_or_id):
-                    suggestion_or_id = i
-                    break
+        clusters = self.clusters[column]
 
-            if is_str(suggestion_or_id):
+        if is_str(suggestion_or_id):
+            found = np.flatnonzero((clusters["suggestion"] == suggestion_or_id) |
+                                   (clusters["cluster"] == suggestion_or_id))
+            if not len(found):
                 raise ValueError(f"'{suggestion_or_id}' is not a cluster of '{column}'")
+            suggestion_or_id = found[0]
 
-        self.clusters[column][suggestion_or_id]["suggestion"] = new_value
+        clusters["suggestion"][suggestion_or_id] = new_value
 
     def to_dict(self, columns="*", limit_clusters=None, limit_suggestions=None, verbose=False):
         result = {}
@@ -52,19 +107,19 @@ class Clusters:
         for column in columns:
             result[column] = {}
             clusters = self.clusters[column]
-            if not is_list(clusters):
-                clusters = list(clusters.values())
-                
-            for cluster in clusters[0:limit_clusters]:
+            start = clusters["start"]
+
+            for i in range(len(clusters["cluster"][0:limit_clusters])):
+                suggestions = clusters["value"][start[i]:start[i + 1]].tolist()
                 if verbose:
-                    cluster_name = cluster["cluster"]
-                    _cluster = copy.deepcopy(cluster)
-                    del _cluster["cluster"]
-                    result[column][cluster_name] = _cluster
+                    result[column][clusters["cluster"][i]] = {"suggestion": clusters["suggestion"][i],
+                                                              "total_count": int(clusters["total_count"][i]),
+                                                              "suggestions": suggestions,
+                                                              "suggestions_size": len(suggestions)}
                 else:
-                    cluster_name = cluster["suggestion"]
+                    cluster_name = clusters["suggestion"][i]
                     result[column][cluster_name] = result[column].get(cluster_name, [])
-                    result[column][cluster_name] += cluster["suggestions"][0:limit_suggestions]
+                    result[column][cluster_name] += suggestions[0:limit_suggestions]
 
         return result
 
@@ -85,9 +140,10 @@ class Clusters:
         return self.to_dict(columns, limit_clusters, limit_suggestions, verbose)
 
 
-def string_clustering(df, cols="*", algorithm=None, *args, **kwargs) -> 'ClustersType':
+def string_clustering(df, cols="*", algorithm=None, *args, limit=CLUSTERS_LIMIT, **kwargs) -> 'ClustersType':
     """
     Cluster a dataframe column based on the Fingerprint algorithm
+    :param limit: Max number of clusters by column, the ones with the most rows. None returns every cluster
     :return:
     """
 
@@ -114,7 +170,6 @@ def string_clustering(df, cols="*", algorithm=None, *args, **kwargs) -> 'Cluster
 
             total_rows = df.rows.count()
             topn = 2
-            result = {}
             suggestions = []
 
             for s in _df.data[input_col]:
@@ -129,35 +184,17 @@ def string_clustering(df, cols="*", algorithm=None, *args, **kwargs) -> 'Cluster
                     "suggestions_size": len(c), 
                     "total_count": total_rows
                 })
-            result[input_col] = suggestions
+            result[input_col] = _from_suggestions(suggestions, limit)
         else:
 
             cluster_col = name_col(input_col, CLUSTER_COL)
-            # TODO: Think we can remove duplicated values to improve time calculation performace
-            df = func(input_col, output_cols=cluster_col, *args, **kwargs)
-
-            # sets the original values as indices: {"VALUE": "value", "Value": "value"}
-
-            _dfd = df.cols.select([input_col, cluster_col]).cols.to_string().data.set_index(input_col)
-            _df = df.new(_dfd)
-            values = _df[cluster_col].to_pandas().to_dict()[cluster_col]
-
-            suggestions_items = {}
-            for k, v in values.items():
-                suggestions_items[v] = suggestions_items.get(v, []) + [k]
-
-            counts_list = df.cols.frequency(cluster_col, len(values))['frequency'][cluster_col]['values']
-            suggestions = []
-
-            for d in counts_list:
-                value = d['value']
-                suggestion = {"suggestion": value, "cluster": value, "total_count": d['count']}
-                if suggestions_items[value]:
-                    suggestion["suggestions"] = suggestions_items[value]
-                    suggestion["suggestion"] = suggestion["suggestions"][0]
-                    suggestion["suggestions_size"] = len(suggestions_items[value])
+            dfd = func(input_col, output_cols=cluster_col, *args, **kwargs).cols.to_string(input_col).data
 
-                suggestions += [suggestion]
+            # count every distinct value with its key in one job, nulls are not clustered
+            counts = df.functions.compute(dfd.groupby([cluster_col, input_col]).size())
+            if hasattr(counts, "to_pandas"):
+                counts = counts.to_pandas()
 
-            result[input_col] = suggestions
+            result[input_col] = _from_counts(counts.index.get_level_values(0), counts.index.get_level_values(1),
+                                             counts.values, limit)
     return Clusters(result)
@@ -1,7 +1,7 @@
 import builtins
 from sklearn.preprocessing import StandardScaler
 
-from optimus.engines.base.commons.functions import string_to_index, index_to_string, find
+from optimus.engines.base.commons.functions import string_to_index, index_to_string, find, apply_batch
 from optimus.engines.base.cudf.columns import CUDFBaseColumns
 from optimus.engines.base.dataframe.columns import DataFrameBaseColumns
 from optimus.helpers.columns import parse_columns, get_output_cols
@@ -17,6 +17,9 @@ class Cols(CUDFBaseColumns, DataFrameBaseColumns):
     def _series_to_pandas(self, series):
         return series.to_pandas()
 
+    def _apply_batch(self, dfd, columns, func, args):
+        return apply_batch(self.root, dfd, columns, func, args)
+
     def find(self, cols, sub, ignore_case=False):
         """
         Find the start and end position for a char or substring
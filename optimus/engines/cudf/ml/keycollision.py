@@ -10,29 +10,9 @@ def fingerprint(df, input_cols):
     :param input_cols: Column to be processed
     :return:
     """
-
-    # https://github.com/OpenRefine/OpenRefine/blob/master/main/src/com/google/refine/clustering/binning/FingerprintKeyer.java#L56
-    def _split_sort_remove_join(value):
-        """
-        Helper function to split, remove duplicate, sort and join back together
-        """
-        split_key = value.split()
-
-        split_key = sorted(set(split_key))
-
-        return "".join(split_key)
-
     input_cols = parse_columns(df, input_cols)
-    for input_col in input_cols:
-        output_col = name_col(input_col, FINGERPRINT_COL)
-        df = (df
-              .cols.copy(input_col, output_col)
-              .cols.trim(output_col)
-              .cols.lower(output_col)
-              .cols.remove_special_chars(output_col)
-              .cols.normalize_chars(output_col))
-        df[output_col] = df[output_col].map(_split_sort_remove_join)
-    return df
+    return df.cols.fingerprint(input_cols, output_cols=[name_col(input_col, FINGERPRINT_COL)
+                                                        for input_col in input_cols])
 
 
 def n_gram_fingerprint(df, input_cols, n_size=2):
@@ -43,36 +23,9 @@ def n_gram_fingerprint(df, input_cols, n_size=2):
     :param n_size:
     :return:
     """
-
-    def calculate_ngrams(value):
-        # remove white spaces
-        ngram = list(ngrams(value, n_size))
-
-        # sort and remove duplicated
-        ngram = sorted(set(ngram))
-
-        _result = ""
-        for item in ngram:
-            for i in item:
-                _result = _result + i
-
-        # join the tokens back together
-        _result = "".join(_result)
-
-        return _result
-
     input_cols = parse_columns(df, input_cols)
-
-    for input_col in input_cols:
-        ngram_fingerprint_col = name_col(input_col, FINGERPRINT_COL)
-
-        df = df.cols.copy(input_col, ngram_fingerprint_col).cols.lower(ngram_fingerprint_col).cols.remove_white_spaces(
-            ngram_fingerprint_col)
-
-        df[ngram_fingerprint_col] = df[ngram_fingerprint_col].map(calculate_ngrams)
-        df = df.cols.remove_special_chars(ngram_fingerprint_col).cols.normalize_chars(ngram_fingerprint_col)
-
-    return df
+    return df.cols.ngram_fingerprint(input_cols, n_size, output_cols=[name_col(input_col, FINGERPRINT_COL)
+                                                                      for input_col in input_cols])
 
 
 def fingerprint_cluster(df, input_cols, output: str = "dict"):
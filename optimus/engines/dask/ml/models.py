@@ -1,63 +1,102 @@
-from dask_ml.cluster import KMeans
-from dask_ml.linear_model import LinearRegression, LogisticRegression
+import joblib
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.ensemble import RandomForestClassifier
-from sklearn.externals import joblib
+from sklearn.linear_model import SGDClassifier, SGDRegressor
 
+from optimus.engines.base.ml import incremental
 from optimus.engines.base.ml.models import BaseML
+from optimus.engines.pandas.ml.models import Model
 from optimus.helpers.columns import parse_columns
 from optimus.helpers.types import *
 
+EPOCHS = 5
+"""Passes over the data of the models trained with partial_fit"""
+
 
 class ML(BaseML):
     def __init__(self, root: 'DataFrameType'):
         super().__init__(root)
         self.root = root
 
-    def linear_regression(self, features, target, *args, **kwargs):
+    def _fit(self, features, target, estimator, scale=True, classify=False, kwargs=None):
         """
-        Fit a linear regression model. This ensure that the data is ready converting to numeric and dropping NA
+        Fit an incremental estimator from the partitions, converting the columns to numeric and dropping NA.
         :param features:
         :param target:
-        :param args:
-        :param kwargs:
+        :param estimator: Estimator with partial_fit
+        :param scale: Standardize the features
+        :param classify: Pass every class of the target to partial_fit
+        :param kwargs: 'test_size', 'random_state' and 'epochs'
         :return:
         """
         df = self.root
-        lm = LinearRegression(*args, **kwargs)
+        kwargs = kwargs or {}
 
         features = parse_columns(df, features)
-        target = parse_columns(df, target)
+        target = parse_columns(df, target) if target is not None else []
 
         df = df.cols.select(features + target).cols.to_float().rows.drop_missings()
-        X_train = df[features]._to_values()
-        y_train = df[target]._to_values()
 
-        return lm.fit(X_train, y_train)
+        fit_kwargs = {}
+        if classify:
+            # partial_fit needs every class from the first partition
+            fit_kwargs["classes"] = np.unique(df.functions.compute(df.data[target[0]].unique()))
 
-    def logistic_regression(self, features, target, *args, **kwargs):
-        df = self.root
-        lm = LogisticRegression(*args, **kwargs)
+        model, score = incremental.fit(df, features, target, estimator, test_size=kwargs.get("test_size", 0.2),
+                                       seed=kwargs.get("random_state", 0), epochs=kwargs.get("epochs", EPOCHS),
+                                       scale=scale, **fit_kwargs)
+        model = Model(model, op=df.op, features=features)
+        model.score = score
+        model.evaluation = score
+        return model
 
-        features = parse_columns(df, features)
-        target = parse_columns(df, target)
+    @staticmethod
+    def _split_kwargs(kwargs):
+        return {key: kwargs.pop(key) for key in ["test_size", "random_state", "epochs"] if key in kwargs}
 
-        df = df.cols.select(features + target).cols.to_float().rows.drop_missings()
-        # LogisticRegression requires that the Dask Array passed to it has known chunk sizes
-        # https://stackoverflow.com/questions/61756328/dusk-ml-logisticregression-throws-this-error-notimplementederror-can-not-add
-        X_train = df[features]._to_values().compute_chunk_sizes()
-        y_train = df[target]._to_values().compute_chunk_sizes()
+    def linear_regression(self, features, target, *args, **kwargs):
+        """
+        Fit a linear regression model with stochastic gradient descent, one partition at a time. This ensure that
+        the data is ready converting to numeric and dropping NA
+        :param features:
+        :param target:
+        :param args:
+        :param kwargs: 'test_size', 'random_state' and 'epochs' or arguments of SGDRegressor
+        :return:
+        """
+        split_kwargs = self._split_kwargs(kwargs)
+        kwargs.setdefault("random_state", split_kwargs.get("random_state", 0))
+        return self._fit(features, target, SGDRegressor(*args, **kwargs), kwargs=split_kwargs)
 
-        return lm.fit(X_train, y_train)
+    def logistic_regression(self, features, target, *args, **kwargs):
+        """
+        Fit a logistic regression model with stochastic gradient descent, one partition at a time.
+        :param features:
+        :param target:
+        :param args:
+        :param kwargs: 'test_size', 'random_state' and 'epochs' or arguments of SGDClassifier
+        :return:
+        """
+        split_kwargs = self._split_kwargs(kwargs)
+        kwargs.setdefault("random_state", split_kwargs.get("random_state", 0))
+        kwargs.setdefault("loss", "log_loss")
+        return self._fit(features, target, SGDClassifier(*args, **kwargs), kwargs=split_kwargs, classify=True)
 
     def k_means(self, features, n_centers, *args, **kwargs):
-        df = self.root
-        k_means = KMeans(n_clusters=n_centers)
-        features = parse_columns(df, features)
-        df = df.cols.select(features).cols.to_float().rows.drop_missings()
-        X_train = df[features]._to_values().compute_chunk_sizes()
-        print(X_train)
-        k_means.fit(X_train)
-        return
+        """
+        Fit a mini-batch k-means model, one partition at a time.
+        :param features:
+        :param n_centers: Number of clusters
+        :param args:
+        :param kwargs: 'test_size', 'random_state' and 'epochs' or arguments of MiniBatchKMeans
+        :return:
+        """
+        split_kwargs = self._split_kwargs(kwargs)
+        kwargs.setdefault("random_state", split_kwargs.get("random_state", 0))
+        kwargs.setdefault("n_init", 3)
+        return self._fit(features, None, MiniBatchKMeans(n_centers, *args, **kwargs), scale=False,
+                         kwargs=split_kwargs)
 
     def random_forest(self, features, target, *args, **kwargs):
         """
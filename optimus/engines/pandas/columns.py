@@ -1,9 +1,10 @@
 import pandas as pd
 from sklearn import preprocessing
 
-from optimus.engines.base.commons.functions import string_to_index, index_to_string, find
+from optimus.engines.base.commons.functions import string_to_index, index_to_string, find, apply_batch
 from optimus.engines.base.dataframe.columns import DataFrameBaseColumns
 from optimus.engines.base.pandas.columns import PandasBaseColumns
+from optimus.engines.pandas.parallel import apply_parallel
 
 DataFrame = pd.DataFrame
 
@@ -15,6 +16,12 @@ class Cols(PandasBaseColumns, DataFrameBaseColumns):
     def _series_to_pandas(self, series):
         return series
 
+    def _apply_batch(self, dfd, columns, func, args):
+        return apply_batch(self.root, dfd, columns, func, args)
+
+    def _parallel(self, series, func, *args):
+        return apply_parallel(series, func, args, functions=self.F)
+
     def find(self, cols="*", sub=None, ignore_case=False):
         """
         Find the start and end position for a char or substring
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+
 from optimus.engines.base.dataframe.dataframe import DataFrameBaseDataFrame
 from optimus.engines.base.pandas.dataframe import PandasBaseDataFrame
 from optimus.engines.pandas.io.save import Save
@@ -6,8 +9,22 @@ from optimus.engines.pandas.io.save import Save
 class PandasDataFrame(PandasBaseDataFrame, DataFrameBaseDataFrame):
 
     def _assign(self, kw_columns: dict):
+        dfd = self.root.data
         kw_columns = {str(key): kw_column for key, kw_column in kw_columns.items()}
-        return self.root.data.assign(**kw_columns)
+
+        if len(kw_columns) < 2 or not dfd.columns.is_unique:
+            return dfd.assign(**kw_columns)
+
+        # DataFrame.assign inserts the columns one by one, build all of them in a single concat instead
+        kw_columns = {key: value(dfd) if callable(value) else value for key, value in kw_columns.items()}
+        # functions like scalers return arrays with one column
+        kw_columns = {key: value.ravel() if isinstance(value, np.ndarray) and value.ndim == 2 and value.shape[1] == 1
+                      else value
+                      for key, value in kw_columns.items()}
+        new_dfd = pd.DataFrame(kw_columns, index=dfd.index)
+        kept = [col for col in dfd.columns if col not in kw_columns]
+        columns = [*dfd.columns, *(col for col in new_dfd.columns if col not in dfd.columns)]
+        return pd.concat([dfd[kept], new_dfd], axis=1, copy=False)[columns]
 
     def _base_to_dfd(self, pdf, n_partitions):
         pass
@@ -16,16 +16,21 @@ from sklearn.model_selection import train_test_split
 from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 
+from optimus.engines.base.meta import Meta
+from optimus.engines.base.ml import scoring
 from optimus.engines.base.ml.models import BaseML
 from optimus.helpers.columns import parse_columns
+from optimus.helpers.constants import Actions
 from optimus.helpers.converter import format_dict
 from optimus.helpers.core import val_to_list
+from optimus.helpers.raiseit import RaiseIt
 from optimus.helpers.types import *
 from optimus.infer import is_numeric
 
 
 class Model:
-    def __init__(self, model, X_train=None, y_train=None, X_test=None, y_test=None, op=None, **kwargs):
+    def __init__(self, model, X_train=None, y_train=None, X_test=None, y_test=None, op=None, features=None,
+                 **kwargs):
         """
 
         :param model: ML Model
@@ -33,10 +38,12 @@ class Model:
         :param y_train: Training labels
         :param X_test: Test data
         :param y_test: Test labels
+        :param features: Columns used to fit the model
         :param kwargs:
         """
         self.op = op
         self.model = model
+        self.features = features
         self.X_train = X_train
         self.y_train = y_train
 
@@ -58,6 +65,28 @@ class Model:
 
         return list(self.model.predict(value))
 
+    def predict_batch(self, df, features=None, output_col="prediction", method="predict",
+                      chunk_size=scoring.CHUNK_SIZE):
+        """
+        Predict a whole dataframe one partition at a time, in chunks of rows, and save the predictions as new
+        columns
+        :param df: Dataframe used to predict
+        :param features: Columns used as features, by default the ones used to fit the model
+        :param output_col: Column name to save the prediction, or prefix of the columns of 'predict_proba'
+        :param method: 'predict' or 'predict_proba'
+        :param chunk_size: Rows predicted at a time
+        :return:
+        """
+        if features is None:
+            if self.features is None:
+                RaiseIt.message(ValueError, "'features' must be passed, the columns used to fit the model are not "
+                                            "known")
+            features = self.features
+        features = parse_columns(df, features)
+        dfd, output_cols = scoring.predict(df, self.model, features, output_col, method, chunk_size)
+        meta = Meta.action(df.meta, Actions.SET.value, output_cols)
+        return df.new(dfd, meta=meta)
+
     def predict_proba(self, df, output_col=None, index=None):
         """
         Predict probabilities for a list of features
@@ -316,7 +345,7 @@ class ML(BaseML):
         score = cross_validate(lm, X_train, y_train.ravel(), cv=kf, scoring=scoring)
 
         fm = lm.fit(X_train, y_train.ravel())
-        model = Model(fm, X_train, y_train, X_test, y_test)
+        model = Model(fm, X_train, y_train, X_test, y_test, op=df.op, features=features)
         model.score = {i: list(score["test_" + i]) for i in scoring.keys()}
         model.evaluation = {"accuracy": lm.score(X, y),
                             "standard deviation": score["test_r2"].std()}
@@ -362,7 +391,7 @@ class ML(BaseML):
 
         #
         fm = lm.fit(X_train, y_train.ravel())
-        model = Model(fm, X_train, y_train, X_test, y_test)
+        model = Model(fm, X_train, y_train, X_test, y_test, op=df.op, features=features)
         model.evaluation = {"accuracy": fm.score(X, y),
                             "standard deviation": score["test_score"].mean()}
         #
@@ -392,7 +421,7 @@ class ML(BaseML):
 
         kmeans = KMeans(n_clusters=n_clusters, random_state=0).fit(X_train)
         # model = Model(one_list_to_val(models), X, y)
-        model = Model(kmeans, X_train, y_train, X_test, y_test, n_cluster=n_clusters)
+        model = Model(kmeans, X_train, y_train, X_test, y_test, op=df.op, features=features, n_cluster=n_clusters)
 
         model.score = format_dict(scores)
         # https://stackoverflow.com/questions/19197715/scikit-learn-k-means-elbow-criterion
@@ -503,7 +532,7 @@ class ML(BaseML):
                                           ccp_alpha,
                                           max_samples)
         fm = regressor.fit(X_train, y_train.ravel())
-        model = Model(fm, X_train, y_train, X_test, y_test)
+        model = Model(fm, X_train, y_train, X_test, y_test, op=df.op, features=features)
         # y_pred = regressor.predict(X_test
 
         return model
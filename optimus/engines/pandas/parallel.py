@@ -0,0 +1,180 @@
+import os
+import atexit
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from optimus.helpers.decorators import evaluate_on_uniques, uniques_key
+
+PARALLEL_MIN_ROWS = 50000
+"""Series with less rows than this are processed in the current process, starting the pool would take longer"""
+PARALLEL_WORKERS = None
+"""Number of processes used, defaults to the number of CPUs"""
+
+_executor = None
+_executor_workers = None
+
+
+def _shutdown_executor():
+    global _executor, _executor_workers
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    _executor_workers = None
+
+
+atexit.register(_shutdown_executor)
+
+
+def _get_executor(workers):
+    """
+    Process pool with 'workers' processes. The pool is created again if the number of workers changes.
+    """
+    global _executor, _executor_workers
+    if _executor is not None and _executor_workers != workers:
+        _shutdown_executor()
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=workers)
+        _executor_workers = workers
+    return _executor
+
+
+def _call_function(functions_class, name, series, *args):
+    # Create the functions object in the worker instead of pickling the dataframe it references
+    return getattr(functions_class(), name)(series, *args)
+
+
+def _picklable(func, functions):
+    """
+    Bound methods of a functions object reference the whole dataframe, replace them by a reference to the class.
+    """
+    if getattr(func, "__self__", None) is not functions:
+        return func
+
+    cls = type(functions)
+    name = func.__name__
+    if getattr(cls, name, None) is not func.__func__:
+        # decorated methods like the ones using apply_to_categories are named 'wrapper'
+        name = next((n for n in dir(cls) if getattr(cls, n, None) is func.__func__), None)
+
+    return func if name is None else partial(_call_function, cls, name)
+
+
+def _to_shared_memory(series):
+    """
+    Write a string series to a shared memory block using the Arrow IPC format.
+    :return: SharedMemory object or None if the series can not be converted to Arrow.
+    """
+    try:
+        import pyarrow as pa
+        from multiprocessing import shared_memory
+    except ImportError:
+        return None
+
+    try:
+        table = pa.Table.from_arrays([pa.array(series.values, from_pandas=True)], names=["values"])
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return None
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    buffer = sink.getvalue()
+
+    shm = shared_memory.SharedMemory(create=True, size=max(buffer.size, 1))
+    shm.buf[:buffer.size] = buffer.to_pybytes()
+    return shm
+
+
+def _apply_shared(shm_name, start, stop, index, name, func, args):
+    import pyarrow as pa
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(shm.buf)).read_all()
+        values = table.column(0).slice(start, stop - start).to_pandas()
+        del table
+    finally:
+        shm.close()
+
+    series = pd.Series(values.values, index=index, name=name)
+    return func(series, *args)
+
+
+def _apply_shard(series, func, args):
+    return func(series, *args)
+
+
+def apply_parallel(series, func, args=(), functions=None, workers=None, min_rows=None):
+    """
+    Split a series in shards, apply 'func' to every shard in a process pool and join the results in order.
+    Only the distinct values are sent when the series has many repeated values.
+    String data is sent to the workers through shared memory when pyarrow is available.
+    If 'func' can not be sent to other processes it is applied in the current process.
+    :param series: pandas Series.
+    :param func: Element-wise function which receives a series.
+    :param args: Arguments passed to 'func'.
+    :param functions: Functions object of the dataframe. Used to avoid sending the dataframe to the workers.
+    :param workers: Number of processes. Defaults to PARALLEL_WORKERS.
+    :param min_rows: Series with less rows are processed in the current process. Defaults to PARALLEL_MIN_ROWS.
+    :return: pandas Series
+    """
+    if not any(isinstance(arg, pd.Series) for arg in args):
+        key = uniques_key(func, args) if getattr(func, "cache_uniques", False) else None
+        result = evaluate_on_uniques(series, partial(_apply_parallel, func=func, args=args, functions=functions,
+                                                     workers=workers, min_rows=min_rows), key)
+        if result is not None:
+            return result
+
+    return _apply_parallel(series, func, args, functions, workers, min_rows)
+
+
+def _apply_parallel(series, func, args=(), functions=None, workers=None, min_rows=None):
+    workers = workers or PARALLEL_WORKERS or os.cpu_count() or 1
+    min_rows = PARALLEL_MIN_ROWS if min_rows is None else min_rows
+
+    if len(series) < min_rows or workers < 2:
+        return func(series, *args)
+
+    if functions is not None:
+        func = _picklable(func, functions)
+
+    try:
+        pickle.dumps((func, [arg for arg in args if not isinstance(arg, pd.Series)]))
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # lambdas and local functions
+        return func(series, *args)
+
+    executor = _get_executor(workers)
+    bounds = np.linspace(0, len(series), workers + 1, dtype=int)
+    shards = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+
+    shm = _to_shared_memory(series) if series.dtype == object else None
+
+    try:
+        futures = []
+        for start, stop in shards:
+            # Series arguments like the other column in levenshtein are split like the series
+            shard_args = tuple(arg.iloc[start:stop] if isinstance(arg, pd.Series) and len(arg) == len(series)
+                               else arg for arg in args)
+            if shm is not None:
+                futures.append(executor.submit(_apply_shared, shm.name, start, stop, series.index[start:stop],
+                                               series.name, func, shard_args))
+            else:
+                futures.append(executor.submit(_apply_shard, series.iloc[start:stop], func, shard_args))
+        results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        # a worker died, the pool can not be used anymore
+        _shutdown_executor()
+        return func(series, *args)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    return pd.concat(results)
@@ -167,7 +167,9 @@ def parse_columns(df, cols_args, is_regex=None, filter_by_column_types=None, acc
 
     # if columns value is * get all dataframes columns
 
-    df_columns = df.cols._names()
+    plan = getattr(df, "plan", None)
+    # Lazy dataframes keep the column names of the pending transformations in the plan
+    df_columns = list(plan.names) if plan is not None and plan.pending else df.cols._names()
 
     if is_regex is True:
         r = re.compile(cols_args)
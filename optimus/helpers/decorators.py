@@ -1,4 +1,6 @@
+import threading
 import timeit
+from functools import wraps
 
 from optimus.helpers.logger import logger
 
@@ -22,6 +24,7 @@ def apply_to_categories(func):
     else:
         static = False
 
+    @wraps(func)
     def wrapper(ref, series, *args, **kwargs):
         # TODO:
         #  Handle Ibis Series. Ibis use 'type' instead of dtype.
@@ -46,3 +49,186 @@ def apply_to_categories(func):
             return func(ref, series, *args, **kwargs)
 
     return wrapper
+
+
+UNIQUES_RATIO = 0.5
+"""Functions decorated with apply_to_uniques are evaluated on the distinct values when the ratio between distinct
+values and rows in a sample of the series is lower than this"""
+UNIQUES_MIN_ROWS = 1000
+UNIQUES_SAMPLE_SIZE = 10000
+UNIQUES_CACHE_SIZE = 100000
+
+
+class UniquesCache:
+    """
+    Bounded LRU cache of the results of functions decorated with apply_to_uniques. It is shared across calls so
+    values repeated between columns or dataframes are only evaluated once.
+    """
+
+    def __init__(self, maxsize=UNIQUES_CACHE_SIZE):
+        from collections import OrderedDict
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+        # the threaded scheduler of Dask reads and writes from several threads
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.data:
+                self.data.move_to_end(key)
+                return self.data[key]
+            return default
+
+    def set(self, key, value):
+        with self.lock:
+            self.data[key] = value
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize:
+                self.data.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+
+
+uniques_cache = UniquesCache()
+
+_MISSING = object()
+
+
+def _factorize(series):
+    """
+    Codes and distinct values of a series. In object series values that are equal but have different types like
+    1, 1.0 and True get different codes.
+    :return: tuple (codes, list of distinct values)
+    """
+    if type(series).__module__.startswith("cudf"):
+        codes, uniques = series.factorize()
+        return codes, list(uniques.to_pandas())
+
+    import numpy as np
+    import pandas as pd
+
+    # passing an object array avoids the Index creation and its dtype inference
+    values = np.asarray(series, dtype=object if series.dtype == object else None)
+    codes, uniques = pd.factorize(values)
+
+    if series.dtype != object:
+        return codes, list(uniques)
+
+    type_codes, types = pd.factorize(np.fromiter(map(type, values), dtype=object, count=len(values)))
+    if len(types) == 1:
+        return codes, list(uniques)
+
+    valid = np.flatnonzero(codes != -1)
+    valid_codes, _ = pd.factorize(codes[valid] * len(types) + type_codes[valid])
+    codes = np.full(len(values), -1, dtype=valid_codes.dtype)
+    codes[valid] = valid_codes
+    _, first = np.unique(valid_codes, return_index=True)
+    return codes, list(values[valid[first]])
+
+
+def evaluate_on_uniques(series, func, key=None):
+    """
+    Factorize the series, apply 'func' to the distinct values only and broadcast the result back using the codes.
+    Returns None if the series is not a good candidate: it has too many distinct values, it is too small or it
+    can not be factorized.
+    :param series: Series with a 'factorize' method like pandas or cuDF.
+    :param func: Function which receives a series and returns a series of the same length.
+    :param key: Hashable used to save the results in the shared cache. Results are not cached if None.
+    :return: Series or None
+    """
+    if not hasattr(series, "factorize") or len(series) < UNIQUES_MIN_ROWS:
+        return None
+
+    try:
+        sample = series
+        if len(series) > UNIQUES_SAMPLE_SIZE:
+            # rows from the whole series, the first ones can be sorted or clustered
+            import numpy as np
+            positions = np.random.default_rng(0).choice(len(series), UNIQUES_SAMPLE_SIZE, replace=False)
+            sample = series.iloc[np.sort(positions)]
+        if sample.nunique(dropna=False) / len(sample) > UNIQUES_RATIO:
+            return None
+        codes, uniques = _factorize(series)
+    except TypeError:
+        # unhashable values like lists
+        return None
+
+    has_nulls = (codes == -1).any()
+
+    # 1, 1.0 and True are equal in python, the type is part of the key so they are cached separately
+    results = [uniques_cache.get((key, type(value), value), _MISSING) if key is not None else _MISSING
+               for value in uniques]
+    missing = [i for i, result in enumerate(results) if result is _MISSING]
+
+    to_evaluate = [uniques[i] for i in missing]
+    if has_nulls:
+        # evaluate one of the nulls of the series so the function decides how to handle them
+        to_evaluate.append(series[codes == -1].iloc[0])
+
+    dtype = None
+    if to_evaluate:
+        evaluated = func(series.__class__(to_evaluate, dtype=series.dtype))
+        dtype = evaluated.dtype
+        evaluated = list(evaluated.to_pandas() if hasattr(evaluated, "to_pandas") else evaluated)
+        for i, result in zip(missing, evaluated):
+            results[i] = result
+            if key is not None:
+                uniques_cache.set((key, type(uniques[i]), uniques[i]), result)
+        if has_nulls:
+            results.append(evaluated[-1])
+
+    result = series.__class__(results, dtype=dtype).take(codes)
+    result.index = series.index
+    result.name = series.name
+    return result
+
+
+def apply_to_uniques(func):
+    """
+    Evaluate a function only on the distinct values of a series, see evaluate_on_uniques.
+    The function must return a series with one value per element.
+    """
+
+    @wraps(func)
+    def wrapper(ref, series, *args, **kwargs):
+        key = uniques_key(func, args, kwargs)
+
+        if hasattr(series, "map_partitions"):
+            # Dask: factorize every partition using the functions of the partition engine
+            partition_ref = _partition_functions(series)
+
+            def evaluate_partition(partition):
+                result = evaluate_on_uniques(partition, lambda _s: func(partition_ref, _s, *args, **kwargs), key)
+                return func(partition_ref, partition, *args, **kwargs) if result is None else result
+
+            meta = func(partition_ref, series._meta, *args, **kwargs)
+            return series.map_partitions(evaluate_partition, meta=meta)
+
+        result = evaluate_on_uniques(series, lambda _series: func(ref, _series, *args, **kwargs), key)
+        return func(ref, series, *args, **kwargs) if result is None else result
+
+    # lets other callers like the parallel mode share the cache
+    wrapper.cache_uniques = True
+    return wrapper
+
+
+def uniques_key(func, args=(), kwargs=None):
+    """
+    Key used to save the results of a function in the uniques cache. None if the arguments are not hashable.
+    """
+    try:
+        key = (func.__qualname__, tuple(args), tuple(sorted((kwargs or {}).items())))
+        hash(key)
+    except TypeError:
+        key = None
+    return key
+
+
+def _partition_functions(series):
+    if type(series._meta).__module__.startswith("cudf"):
+        from optimus.engines.cudf.functions import CUDFFunctions
+        return CUDFFunctions()
+    from optimus.engines.pandas.functions import PandasFunctions
+    return PandasFunctions()
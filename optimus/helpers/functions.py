@@ -16,7 +16,6 @@ from urllib.request import Request, urlopen
 import humanize
 import numpy as np
 import six
-from fastnumbers import isint, isfloat
 
 from optimus import ROOT_DIR
 from optimus.helpers.constants import DATE_FORMAT_ITEMS, DATE_FORMAT_ITEMS_MONTH, PYTHON_DATE_TO_FORMAT
@@ -304,86 +303,198 @@ def update_dict(d, u):
     return d
 
 
+def _memory_stats(dfd, categorical_threshold):
+    """
+    Statistics used by reduce_mem_usage for every column of a pandas DataFrame, computed with vectorized
+    operations. Text is factorized so only the distinct values are parsed as numbers. Results of different
+    partitions are merged with _merge_memory_stats.
+    :return: dict with the form {col_name: {...}}
+    """
+    import pandas as pd
+
+    result = {}
+
+    for col_name in dfd.columns:
+        series = dfd[col_name]
+        nulls = series.isna()
+        stats = {"rows": len(series), "nulls": int(nulls.sum()),
+                 "bytes": int(series.memory_usage(index=False, deep=True))}
+
+        if series.dtype.kind in "iuf":
+            numbers = series[~nulls]
+        elif series.dtype.kind == "O" or str(series.dtype).startswith("string"):
+            try:
+                codes, uniques = pd.factorize(series[~nulls])
+            except TypeError:
+                # unhashable values like lists
+                stats.update({"numeric": False, "strings": False, "chars": 0, "uniques": None})
+                result[col_name] = stats
+                continue
+
+            strings = pd.api.types.infer_dtype(uniques, skipna=True) in ["string", "empty"]
+            chars = 0
+            if strings:
+                chars = int(np.bincount(codes, minlength=len(uniques)) @ np.array([len(v) for v in uniques],
+                                                                                   dtype="int64"))
+            stats.update({"strings": strings, "chars": chars,
+                          "uniques": list(uniques) if len(uniques) <= categorical_threshold else None})
+            try:
+                numbers = pd.Series(pd.to_numeric(uniques))
+            except (ValueError, TypeError):
+                numbers = None
+        else:
+            result[col_name] = stats
+            continue
+
+        if numbers is None or numbers.dtype.kind not in "iuf":
+            stats.update({"numeric": False})
+            result[col_name] = stats
+            continue
+
+        if numbers.dtype.kind == "f":
+            integers = bool((numbers % 1 == 0).all())
+            float32 = bool((numbers.astype("float32") == numbers).all())
+        else:
+            integers, float32 = True, False
+
+        stats.update({"numeric": True, "numbers": len(numbers), "min": numbers.min() if len(numbers) else None,
+                      "max": numbers.max() if len(numbers) else None, "integers": integers, "float32": float32})
+        result[col_name] = stats
+
+    return result
+
+
+def _merge_memory_stats(left, right):
+    result = {}
+    for col_name, a in left.items():
+        b = right[col_name]
+        stats = {key: a[key] + b[key] for key in ["rows", "nulls", "bytes"]}
+
+        if "numeric" in a:
+            stats["numeric"] = a["numeric"] and b["numeric"]
+            if stats["numeric"]:
+                bounds = [_stats for _stats in (a, b) if _stats["numbers"]]
+                stats.update({"numbers": a["numbers"] + b["numbers"],
+                              "min": min(_stats["min"] for _stats in bounds) if bounds else None,
+                              "max": max(_stats["max"] for _stats in bounds) if bounds else None,
+                              "integers": a["integers"] and b["integers"],
+                              "float32": a["float32"] and b["float32"]})
+
+        if "strings" in a:
+            uniques = None
+            if a["uniques"] is not None and b["uniques"] is not None:
+                uniques = list(dict.fromkeys(a["uniques"] + b["uniques"]))
+            stats.update({"strings": a["strings"] and b["strings"], "chars": a["chars"] + b["chars"],
+                          "uniques": uniques})
+
+        result[col_name] = stats
+
+    return result
+
+
+def _optimized_dtype(stats, categorical, categorical_threshold):
+    """
+    Smallest data type that can hold the values of a column and its estimated size in bytes.
+    :return: tuple (dtype, bytes) or None if the column can not be optimized
+    """
+    import pandas as pd
+
+    rows, nulls = stats["rows"], stats["nulls"]
+
+    if rows == nulls or "numeric" not in stats:
+        return None
+
+    if stats["numeric"]:
+        if stats["integers"]:
+            _min, _max = stats["min"], stats["max"]
+            for _dtype in ["uint8", "uint16", "uint32", "uint64"] if _min >= 0 else ["int8", "int16", "int32",
+                                                                                      "int64"]:
+                info = np.iinfo(_dtype)
+                if info.min <= _min and _max <= info.max:
+                    break
+            # nullable integers use an extra byte per row for the mask
+            if nulls:
+                return _dtype.capitalize().replace("Uint", "UInt"), (np.dtype(_dtype).itemsize + 1) * rows
+            return np.dtype(_dtype), np.dtype(_dtype).itemsize * rows
+
+        _dtype = np.dtype("float32" if stats["float32"] else "float64")
+        return _dtype, _dtype.itemsize * rows
+
+    if "strings" not in stats:
+        return None
+
+    uniques = stats["uniques"]
+    if categorical and uniques is not None and len(uniques) <= categorical_threshold:
+        _dtype = pd.CategoricalDtype(uniques)
+        return _dtype, _dtype.categories.memory_usage(deep=True) + rows * (1 if len(uniques) < 128 else 2)
+
+    if stats["strings"] and is_pyarrow_installed():
+        # characters, offsets and validity bitmap. Characters are counted as one byte
+        return pd.StringDtype("pyarrow"), stats["chars"] + 4 * (rows + 1) + (rows + 7) // 8
+
+    return None
+
+
+def _convert_dtypes(dfd, dtypes):
+    import pandas as pd
+
+    columns = {}
+    for col_name, dtype in dtypes.items():
+        series = dfd[col_name]
+        if not isinstance(dtype, (pd.CategoricalDtype, pd.StringDtype)) and series.dtype.kind not in "iuf":
+            series = pd.to_numeric(series, errors="coerce")
+        columns[col_name] = series.astype(dtype)
+    return dfd.assign(**columns)
+
+
 def reduce_mem_usage(df, categorical=True, categorical_threshold=50, verbose=False):
     """
-    Change the columns datatype to reduce the memory usage.
+    Change the columns data type to reduce the memory usage.
+
+    Every column is read once to get its nulls, numeric range, distinct values and size. Text that can be parsed
+    as numbers is converted to the smallest integer or float type, text with few distinct values to category and
+    the remaining text to the Arrow string type if pyarrow is installed. On distributed engines every partition is
+    converted lazily. The bytes saved by every column are saved in the meta data in "optimize".
     :param df: Dataframe to reduce the memory usage
-    :param categorical:
-    :param categorical_threshold: Max number to categorical features to me considered a categorical column
-    :param verbose:
+    :param categorical: Convert text columns with few distinct values to category
+    :param categorical_threshold: Max number of distinct values to consider a column categorical
+    :param verbose: Print the bytes saved by every column
     :return:
     """
+    from optimus.engines.base.meta import Meta
 
-    # Reference https://www.kaggle.com/arjanso/reducing-dataframe-memory-size-by-65/notebook
-
-    start_mem_usg = df.size()
     dfd = df.data
-    ints = df.cols.exec_agg(dfd.applymap(isint).sum(), True)
-    floats = df.cols.exec_agg(dfd.applymap(isfloat).sum(), True)
-    nulls = df.cols.exec_agg(dfd.isnull().sum(), True)
-    total_rows = len(dfd)
-
-    columns_dtype = {}
-    for x, y in ints.items():
-
-        if ints[x] == nulls[x]:
-            dtype = "object"
-        elif floats[x] == total_rows:
-            dtype = "numerical"
-        elif total_rows <= ints[x] + nulls[x]:
-            dtype = "numerical"
+    stats = [df.functions.delayed(_memory_stats)(partition, categorical_threshold)
+             for partition in df.functions.to_delayed(dfd)]
+    stats = df.functions.compute(df.functions.delayed(functools.reduce)(_merge_memory_stats, stats))
+
+    dtypes = {}
+    report = {}
+    for col_name, col_stats in stats.items():
+        dtype = dfd[col_name].dtype
+        optimized = _optimized_dtype(col_stats, categorical, categorical_threshold)
+        if optimized is None or optimized[0] == dtype or optimized[1] >= col_stats["bytes"]:
+            continue
+        dtypes[col_name] = optimized[0]
+        report[col_name] = {"from": str(dtype), "to": str(optimized[0]), "bytes": col_stats["bytes"],
+                            "saved": col_stats["bytes"] - int(optimized[1])}
+
+    if dtypes:
+        if hasattr(dfd, "map_partitions"):
+            dfd = dfd.map_partitions(_convert_dtypes, dtypes, meta=_convert_dtypes(dfd._meta, dtypes))
         else:
-            dtype = "object"
-        columns_dtype[x] = dtype
-
-    numerical_int = [col for col, dtype in columns_dtype.items() if dtype == "numerical"]
-    final = {}
-
-    if len(numerical_int) > 0:
-        min_max = df.cols.range(numerical_int)
-
-        import numpy as np
-        for col_name in min_max.keys():
-            _min = min_max[col_name]["min"]
-            _max = min_max[col_name]["max"]
-            if _min >= 0:
-                if _max < 255:
-                    final[col_name] = np.uint8
-                elif _max < 65535:
-                    final[col_name] = np.uint16
-                elif _max < 4294967295:
-                    final[col_name] = np.uint32
-                else:
-                    final[col_name] = np.uint64
-            else:
-                if _min > np.iinfo(np.int8).min and _max < np.iinfo(np.int8).max:
-                    final[col_name] = np.int8
-                elif _min > np.iinfo(np.int16).min and _max < np.iinfo(np.int16).max:
-                    final[col_name] = np.int16
-                elif _min > np.iinfo(np.int32).min and _max < np.iinfo(np.int32).max:
-                    final[col_name] = np.int32
-                elif _min > np.iinfo(np.int64).min and _max < np.iinfo(np.int64).max:
-                    final[col_name] = np.int64
-            # print(final[col_name])
-
-    object_int = [col for col, dtype in columns_dtype.items() if dtype == "object"]
-    if len(object_int) > 0:
-        count_values = df.cols.value_counts(object_int)
-
-    # if categorical is True:
-    #     for col_name in object_int:
-    #         if len(count_values[col_name]) <= categorical_threshold:
-    #             final[col_name] = "category"
-
-    dfd = dfd.astype(final)
-    mem_usg = dfd.size
+            dfd = _convert_dtypes(dfd, dtypes)
 
     if verbose is True:
-        print("Memory usage after optimization:", humanize.naturalsize(start_mem_usg))
-        print("Memory usage before optimization is: ", humanize.naturalsize(mem_usg))
-        print(round(100 * mem_usg / start_mem_usg), "% of the initial size")
-
-    return df.new(dfd, meta=df.meta)
+        for col_name, col_report in report.items():
+            print(f"{col_name}: {col_report['from']} -> {col_report['to']}, "
+                         f"{humanize.naturalsize(col_report['saved'])} saved")
+        total = sum(stats[col_name]["bytes"] for col_name in stats)
+        saved = sum(col_report["saved"] for col_report in report.values())
+        print(f"Memory usage before optimization: {humanize.naturalsize(total)}, "
+                     f"after: {humanize.naturalsize(total - saved)}")
+
+    return df.new(dfd, meta=Meta.set(df.meta, "optimize", report))
 
 
 def downloader(url, file_format):
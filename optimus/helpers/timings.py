@@ -0,0 +1,208 @@
+import inspect
+import time
+import timeit
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+from optimus.helpers.logger import Singleton
+
+TIMINGS_PATH = "timings"
+
+
+def _data_stats(df):
+    """
+    Rows, partitions and tasks of a dataframe. Only uses operations that do not trigger a computation.
+    :param df: Optimus dataframe
+    :return: dict
+    """
+    dfd = df._data
+    stats = {}
+    if hasattr(dfd, "__dask_graph__"):
+        stats["partitions"] = dfd.npartitions
+        stats["tasks"] = len(dfd.__dask_graph__())
+    elif hasattr(dfd, "index"):
+        stats["rows"] = len(dfd.index)
+    return stats
+
+
+class Timings(Singleton):
+    """
+    Record wall time, CPU time, data size and optionally memory of every public call to the cols, rows, mask,
+    profile, create, load and save accessors. Only the outermost call is recorded, operations called internally are
+    part of its time.
+    """
+
+    def __init__(self):
+        if not hasattr(self, "_sessions"):
+            # Recordings can be nested, every one has its own events and callback
+            self._sessions = []
+            self._stack = []
+
+    @property
+    def active(self) -> bool:
+        return len(self._sessions) > 0
+
+    @property
+    def recording(self) -> bool:
+        return len(self._stack) > 0
+
+    @property
+    def events(self):
+        """
+        Events of the innermost recording or None if there is no recording
+        """
+        return self._sessions[-1][0] if self._sessions else None
+
+    @property
+    def memory(self) -> bool:
+        return any(memory for _, _, memory in self._sessions)
+
+    def start(self, callback=None, memory=False):
+        """
+        Start a recording. Recordings can be nested, the events are saved in every active recording.
+        :param callback: Function called with every recorded event.
+        :param memory: Trace the memory allocated by every operation with tracemalloc, it makes them slower.
+        :return: list where the events are appended
+        """
+        events = []
+        self._sessions.append((events, callback, memory))
+        return events
+
+    def stop(self) -> list:
+        """
+        Stop the innermost recording and return its events
+        :return: list of events
+        """
+        if not self._sessions:
+            return []
+        events, _, _ = self._sessions.pop()
+        if not self._sessions:
+            self._stack = []
+        return events
+
+    @contextmanager
+    def __call__(self, callback=None, memory=False):
+        """
+        Record every operation inside the with block.
+
+        with timings() as events:
+            df = op.load.csv("foo.csv").cols.upper("*")
+        :param callback: Function called with every recorded event.
+        :param memory: Trace the memory allocated by every operation with tracemalloc, it makes them slower.
+        :return: list where the events are appended
+        """
+        events = self.start(callback, memory)
+        try:
+            yield events
+        finally:
+            self.stop()
+
+    def annotate(self, details: dict):
+        """
+        Add details to the operation being recorded.
+        :param details: dict
+        :return:
+        """
+        if self._stack:
+            self._stack[-1].update(details)
+
+    def wrap(self, accessor, name, method):
+        """
+        Returns a function that records 'method' when it is the outermost recorded call.
+        :param accessor: Object that holds the method, like df.cols or op.load.
+        :param name: Method name.
+        :param method: Bound method.
+        :return:
+        """
+
+        @wraps(method)
+        def timed(*args, **kwargs):
+            if not self.active or self.recording:
+                return method(*args, **kwargs)
+
+            from optimus.engines.base.basedataframe import BaseDataFrame
+            from optimus.engines.base.meta import Meta
+
+            kind = getattr(accessor, "_timed_name", type(accessor).__name__.lower())
+            details = {}
+            self._stack.append(details)
+
+            trace = self.memory and not tracemalloc.is_tracing()
+            if trace:
+                tracemalloc.start()
+
+            wall_time = timeit.default_timer()
+            cpu_time = time.process_time()
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                self._stack.pop()
+                wall_time = timeit.default_timer() - wall_time
+                cpu_time = time.process_time() - cpu_time
+                if trace:
+                    # Memory allocated by this process, the workers of a distributed engine are not traced
+                    _, peak_memory = tracemalloc.get_traced_memory()
+                    tracemalloc.stop()
+
+            event = {
+                "operation": kind if name == "__call__" else f"{kind}.{name}",
+                "wall_time": wall_time,
+                "cpu_time": cpu_time
+            }
+            if trace:
+                event["peak_memory"] = peak_memory
+
+            if details:
+                event["details"] = details
+
+            if isinstance(result, BaseDataFrame):
+                event.update(_data_stats(result))
+                # Only the operation that created the dataframe, the events of every operation would be copied to
+                # all the dataframes derived from it
+                result.meta = Meta.set(result.meta, TIMINGS_PATH, event)
+
+            for events, callback, _ in list(self._sessions):
+                events.append(event)
+                if callback is not None:
+                    callback(event)
+
+            return result
+
+        return timed
+
+
+timings = Timings()
+
+
+def _timed(name, method):
+    """
+    Method that records 'method' while timings are active.
+    """
+
+    @wraps(method)
+    def timed(self, *args, **kwargs):
+        if timings.active and not timings.recording:
+            return timings.wrap(self, name, method.__get__(self))(*args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    timed._timed = True
+    return timed
+
+
+class Timed:
+    """
+    Mixin that records the public methods of an accessor while timings are active. Accessors that are called
+    directly, like df.profile(), record their __call__ method too. The methods are wrapped once when the class is
+    created, reading an attribute costs the same as in any other class.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in dir(cls):
+            if name.startswith("_") and name != "__call__":
+                continue
+            # functions of the class or of mixins that are not Timed, not properties or static methods
+            method = inspect.getattr_static(cls, name)
+            if inspect.isfunction(method) and not getattr(method, "_timed", False):
+                setattr(cls, name, _timed(name, method))
@@ -6,6 +6,7 @@ import math
 import os
 import re
 from ast import literal_eval
+from functools import lru_cache
 
 import fastnumbers
 import hidateinfer
@@ -82,6 +83,31 @@ class Trie:
         return re.compile(r"\b" + self.pattern() + r"\b", re.IGNORECASE)
 
 
+MULTI_PATTERN_TEMPLATES = {"chars": "%s", "words": r"\b%s\b", "full": r"^%s$"}
+
+
+@lru_cache(maxsize=256)
+def multi_pattern_regex(terms: tuple, mode="chars", ignore_case=False, is_regex=False):
+    """
+    Compile a list of terms to only one regex so a column is scanned once no matter how many terms are searched.
+    Literal terms are merged in a trie so the alternation does not need to test every term at every position.
+    :param terms: Tuple of strings to search.
+    :param mode: "chars", "words" or "full".
+    :param ignore_case: Ignore case when matching.
+    :param is_regex: If True the terms are regular expressions and are joined in an alternation.
+    :return: Compiled regex
+    """
+    if is_regex:
+        pattern = "|".join("(?:%s)" % term for term in terms)
+    else:
+        trie = Trie()
+        for term in terms:
+            trie.add(term)
+        pattern = trie.pattern()
+
+    return re.compile(MULTI_PATTERN_TEMPLATES[mode] % ("(?:%s)" % pattern), re.IGNORECASE if ignore_case else 0)
+
+
 def is_datetime_str(value: str):
     try:
         pdi = hidateinfer.infer([value])
@@ -4,8 +4,8 @@ import pprint
 
 from optimus.helpers.columns import parse_columns
 from optimus.helpers.core import val_to_list, one_list_to_val
-from optimus.helpers.filters import dict_filter
 from optimus.helpers.json import dump_json
+from optimus.outliers import stats
 
 
 class AbstractOutlierBounds(ABC):
@@ -13,6 +13,8 @@ class AbstractOutlierBounds(ABC):
      This is a template class to expand the outliers methods
      Also you need to add the new outlier detection method to outliers.py
      """
+    _whiskers = None
+    _summary = None
 
     def __init__(self, df, col_name: str, lower_bound: int, upper_bound: int):
         """
@@ -36,6 +38,18 @@ class AbstractOutlierBounds(ABC):
         """
         pass
 
+    def summary(self, bins: int = 20):
+        """
+        Counts and histograms of the values below, between and above the bounds. They are computed in a single pass
+        the first time they are requested
+        :param bins: Number of bins of every histogram
+        :return:
+        """
+        if self._summary is None or self._summary[0] != bins:
+            result = stats.summary(self.df, {"bounds": {self.col_name: self.whiskers()}}, bins)
+            self._summary = bins, result["bounds"][self.col_name]
+        return self._summary[1]
+
     def select(self):
         """
         Select outliers rows using the selected column
@@ -43,31 +57,17 @@ class AbstractOutlierBounds(ABC):
         """
         df = self.df
         col_name = self.col_name
-        upper_bound, lower_bound = dict_filter(self.whiskers(), ["upper_bound", "lower_bound"])
+        upper_bound, lower_bound = self.upper_bound, self.lower_bound
         return df.rows.select((df[col_name] > upper_bound) | (df[col_name] < lower_bound))
 
-    # TODO: Pass a defined division param instead or run 3 separated jobs
-    def hist(self, col_name: str):
-        df = self.df
-        # lower bound
-        lower_bound_hist = df.rows.select(df[col_name] < self.lower_bound).cols.hist(col_name, 20)
-
-        # upper bound
-        upper_bound_hist = df.rows.select(df[col_name] > self.upper_bound).cols.hist(col_name, 20)
-
-        # Non outliers
-        non_outlier_hist = df.rows.select(
-            (df[col_name] >= self.lower_bound) & (df[col_name] <= self.upper_bound)).cols.hist(col_name, 20)
-
-        result = {}
-        if lower_bound_hist is not None:
-            result.update(lower_bound_hist)
-        if upper_bound_hist is not None:
-            result.update(upper_bound_hist)
-        if non_outlier_hist is not None:
-            result.update(non_outlier_hist)
-
-        return dump_json(result)
+    def hist(self, col_name: str = None, bins: int = 20):
+        """
+        Histograms of the values below, between and above the bounds
+        :param col_name: Not used, the histograms are always from the selected column
+        :param bins: Number of bins of every histogram
+        :return:
+        """
+        return dump_json(self.summary(bins)["hist"])
 
     def select_lower_bound(self):
         col_name = self.col_name
@@ -95,6 +95,8 @@ class AbstractOutlierBounds(ABC):
         Count outlier in the lower bound
         :return:
         """
+        if bound == self.lower_bound:
+            return self.summary()["lower_bound_count"]
         col_name = self.col_name
         df = self.df
         return df.rows.select(df[col_name] < bound).rows.count()
@@ -104,6 +106,8 @@ class AbstractOutlierBounds(ABC):
         Count outliers in the upper bound
         :return:
         """
+        if bound == self.upper_bound:
+            return self.summary()["upper_bound_count"]
         col_name = self.col_name
         df = self.df
         return df.rows.select(df[col_name] > bound).rows.count()
@@ -113,18 +117,14 @@ class AbstractOutlierBounds(ABC):
         Count the outliers rows using the selected column
         :return:
         """
-        col_name = self.col_name
-        df = self.df
-        return df.rows.select((df[col_name] > self.upper_bound) | (df[col_name] < self.lower_bound)).rows.count()
+        return self.summary()["count_outliers"]
 
     def non_outliers_count(self):
         """
         Count non outliers rows using the selected column
         :return:
         """
-        df = self.df
-        col_name = self.col_name
-        return df.rows.select((df[col_name] <= self.upper_bound) & (df[col_name] >= self.lower_bound)).rows.count()
+        return self.summary()["count_non_outliers"]
 
     @abstractmethod
     def info(self, output: str = "dict"):
@@ -1,6 +1,9 @@
+from optimus.helpers.columns import parse_columns
 from optimus.helpers.constants import RELATIVE_ERROR
+from optimus.helpers.core import one_list_to_val
 from optimus.helpers.filters import dict_filter
 from optimus.helpers.json import dump_json
+from optimus.outliers import stats
 from optimus.outliers.abstract_outliers_bounds import AbstractOutlierBounds
 
 
@@ -18,7 +21,7 @@ class MAD(AbstractOutlierBounds):
         :type relative_error: object
         """
         self.df = df
-        self.col_name = col_name
+        self.col_name = one_list_to_val(parse_columns(df, col_name))
         self.threshold = threshold
         self.relative_error = relative_error
         self.upper_bound, self.lower_bound = dict_filter(self.whiskers(), ["upper_bound", "lower_bound"])
@@ -26,30 +29,25 @@ class MAD(AbstractOutlierBounds):
 
     def whiskers(self):
         """
-        Get the wisker used to defined outliers
+        Get the wisker used to defined outliers. They are computed once
         :return:
         """
-        mad_median_value = self.df.cols.mad(self.col_name, self.relative_error, more=True)
-        col_name = self.col_name
-        mad_value = mad_median_value[col_name]["mad"]
-        median_value = mad_median_value[col_name]["median"]
+        if self._whiskers is None:
+            self._whiskers = stats.bounds(self.df, [self.col_name], ["mad"], self.threshold,
+                                          self.relative_error)["mad"][self.col_name]
 
-        lower_bound = median_value - self.threshold * mad_value
-        upper_bound = median_value + self.threshold * mad_value
-
-        return {"lower_bound": lower_bound, "upper_bound": upper_bound}
+        return self._whiskers
 
     def info(self, output: str = "dict"):
         """
         Get whiskers, iqrs and outliers and non outliers count
         :return:
         """
-        upper_bound, lower_bound, = dict_filter(self.whiskers(),
-                                                ["upper_bound", "lower_bound"])
+        summary = self.summary()
 
-        result = {"count_outliers": self.count(), "count_non_outliers": self.non_outliers_count(),
-                  "lower_bound": lower_bound, "lower_bound_count": self.count_lower_bound(lower_bound),
-                  "upper_bound": upper_bound, "upper_bound_count": self.count_upper_bound(upper_bound)}
+        result = {"count_outliers": summary["count_outliers"], "count_non_outliers": summary["count_non_outliers"],
+                  "lower_bound": self.lower_bound, "lower_bound_count": summary["lower_bound_count"],
+                  "upper_bound": self.upper_bound, "upper_bound_count": summary["upper_bound_count"]}
         if output == "json":
             result = dump_json(result)
         return result
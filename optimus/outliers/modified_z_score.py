@@ -1,14 +1,14 @@
-# from pyspark.sql import functions as F
-
-from optimus.helpers.columns import parse_columns, name_col
+from optimus.helpers.columns import parse_columns
 from optimus.helpers.constants import RELATIVE_ERROR
-from optimus.helpers.converter import format_dict
 from optimus.helpers.core import one_list_to_val
+from optimus.helpers.filters import dict_filter
+from optimus.helpers.json import dump_json
 from optimus.infer import is_numeric
-from optimus.outliers.abstract_outliers_threshold import AbstractOutlierThreshold
+from optimus.outliers import stats
+from optimus.outliers.abstract_outliers_bounds import AbstractOutlierBounds
 
 
-class ModifiedZScore(AbstractOutlierThreshold):
+class ModifiedZScore(AbstractOutlierBounds):
     """
     Handle outliers from a DataFrame using modified z score
     Reference: http://colingorrie.github.io/outlier-detection.html#modified-z-score-method
@@ -33,19 +33,36 @@ class ModifiedZScore(AbstractOutlierThreshold):
         self.threshold = threshold
         self.relative_error = relative_error
         self.col_name = one_list_to_val(parse_columns(df, col_name))
-        self.z_score = df.cols.modified_z_score(col_name)
-        super().__init__()
+        self.lower_bound, self.upper_bound, self.median, self.mad = dict_filter(
+            self.whiskers(), ["lower_bound", "upper_bound", "median", "mad"]
+        )
+        super().__init__(df, col_name, self.lower_bound, self.upper_bound)
 
+    def whiskers(self):
+        """
+        Get the values whose modified z score is the threshold. They are computed once
+        :return:
+        """
+        if self._whiskers is None:
+            self._whiskers = stats.bounds(self.df, [self.col_name], ["modified_z_score"], self.threshold,
+                                          self.relative_error)["modified_z_score"][self.col_name]
 
-        # return df.withColumn(m_z_col_name, F.abs(0.6745 * (df[col_name] - mad["median"]) / mad["mad"]))
+        return self._whiskers
 
     def info(self, output: str = "dict"):
-        m_z_col_name = name_col(self.col_name, "modified_z_score")
+        """
+        Get the bounds, the outliers and non outliers count and the max modified z score
+        :return:
+        """
+        summary = self.summary()
+        whiskers = self.whiskers()
+        max_m_z_score = 0.6745 * max(abs(whiskers["max"] - self.median), abs(whiskers["min"] - self.median)) / self.mad
 
-        df = self.df
-        z_score = self.z_score
+        result = {"count_outliers": summary["count_outliers"], "count_non_outliers": summary["count_non_outliers"],
+                  "lower_bound": self.lower_bound, "lower_bound_count": summary["lower_bound_count"],
+                  "upper_bound": self.upper_bound, "upper_bound_count": summary["upper_bound_count"],
+                  "max_m_z_score": max_m_z_score}
 
-        max_m_z_score = df.rows.select(z_score > self.threshold).cols.max()
-        #
-        return {"count_outliers": self.count(), "count_non_outliers": self.non_outliers_count(),
-                "max_m_z_score": format_dict(max_m_z_score)}
+        if output == "json":
+            result = dump_json(result)
+        return result
@@ -1,5 +1,7 @@
-
+from optimus.helpers.columns import parse_columns
 from optimus.helpers.constants import RELATIVE_ERROR
+from optimus.helpers.core import val_to_list
+from optimus.outliers import stats
 from optimus.outliers.mad import MAD
 from optimus.outliers.modified_z_score import ModifiedZScore
 from optimus.outliers.tukey import Tukey
@@ -21,3 +23,20 @@ class Outliers:
 
     def modified_z_score(self, cols, threshold, relative_error=RELATIVE_ERROR):
         return ModifiedZScore(self.df, cols, threshold, relative_error)
+
+    def summary(self, cols="*", methods="tukey", threshold=None, relative_error=RELATIVE_ERROR, bins=20):
+        """
+        Bounds, outliers counts and histograms of several columns using several methods. The bounds are computed in
+        one pass and the counts and histograms in another one.
+        :param cols: "*", column name or list of column names to be processed.
+        :param methods: 'tukey', 'z_score', 'modified_z_score', 'mad' or a list of them
+        :param threshold: Threshold of z_score, modified_z_score and mad, or a dict with a threshold for every
+        method
+        :param relative_error:
+        :param bins: Number of bins of every histogram
+        :return: dict with the form {method: {col_name: {...}}}
+        """
+        df = self.df
+        cols = parse_columns(df, cols)
+        bounds = stats.bounds(df, cols, val_to_list(methods), threshold, relative_error)
+        return stats.summary(df, bounds, bins)
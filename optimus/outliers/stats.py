@@ -0,0 +1,161 @@
+import functools
+
+import numpy as np
+import pandas as pd
+
+from optimus.helpers.constants import RELATIVE_ERROR
+from optimus.helpers.raiseit import RaiseIt
+from optimus.infer import is_dict
+
+METHODS = ["tukey", "z_score", "modified_z_score", "mad"]
+
+THRESHOLDS = {"z_score": 3, "modified_z_score": 3.5, "mad": 3}
+"""Thresholds used when none is passed"""
+
+SEGMENTS = ["lower_bound", "non_outliers", "upper_bound"]
+
+
+def bounds(df, cols, methods, threshold=None, relative_error=RELATIVE_ERROR) -> dict:
+    """
+    Lower and upper bounds of the values of every column using every method. The aggregations needed by all the
+    methods and the minimum and maximum are computed together.
+
+    Every method is expressed as a pair of bounds: tukey uses the quartiles, z_score the mean and standard
+    deviation, mad the median and median absolute deviation and modified_z_score the same scaled by 0.6745.
+    :param df: Optimus DataFrame
+    :param cols: List of column names
+    :param methods: List of methods
+    :param threshold: Threshold of z_score, modified_z_score and mad, or a dict with a threshold for every method
+    :param relative_error:
+    :return: dict with the form {method: {col_name: {"lower_bound": ..., "upper_bound": ..., "min": ..., ...}}}
+    """
+    for method in methods:
+        if method not in METHODS:
+            RaiseIt.value_error(method, METHODS)
+
+    thresholds = {method: (threshold.get(method) if is_dict(threshold) else threshold) or THRESHOLDS.get(method)
+                  for method in methods}
+
+    aggregations = {"range": df.cols.range(cols, compute=False, tidy=False)}
+    if "tukey" in methods:
+        aggregations["percentile"] = df.cols.percentile(cols, [0.25, 0.5, 0.75], relative_error, compute=False,
+                                                        tidy=False)
+    if "z_score" in methods:
+        aggregations["mean"] = df.cols.mean(cols, compute=False, tidy=False)
+        aggregations["std"] = df.cols.std(cols, compute=False, tidy=False)
+    if "mad" in methods or "modified_z_score" in methods:
+        aggregations["mad"] = df.cols.mad(cols, relative_error, more=True, compute=False, tidy=False)
+
+    values = df.functions.compute(*aggregations.values())
+    if len(aggregations) == 1:
+        values = [values]
+    values = {name: value[name] for name, value in zip(aggregations, values)}
+
+    result = {}
+    for method in methods:
+        result[method] = {}
+        for col_name in cols:
+            _min, _max = values["range"][col_name]["min"], values["range"][col_name]["max"]
+
+            if method == "tukey":
+                percentile = values["percentile"][col_name]
+                q1, median, q3 = (np.nan, np.nan, np.nan) if not is_dict(percentile) else \
+                    (percentile[0.25], percentile[0.5], percentile[0.75])
+                iqr = q3 - q1
+                col_bounds = {"lower_bound": q1 - (iqr * 1.5), "upper_bound": q3 + (iqr * 1.5),
+                              "q1": q1, "median": median, "q3": q3, "iqr": iqr}
+            elif method == "z_score":
+                mean, std = values["mean"][col_name], values["std"][col_name]
+                col_bounds = {"lower_bound": mean - thresholds[method] * std,
+                              "upper_bound": mean + thresholds[method] * std, "mean": mean, "std": std}
+            else:
+                mad = values["mad"][col_name]
+                mad, median = (np.nan, np.nan) if not is_dict(mad) else (mad["mad"], mad["median"])
+                deviation = thresholds[method] * mad
+                if method == "modified_z_score":
+                    deviation = deviation / 0.6745
+                col_bounds = {"lower_bound": median - deviation, "upper_bound": median + deviation,
+                              "median": median, "mad": mad}
+
+            result[method][col_name] = {**col_bounds, "min": _min, "max": _max}
+
+    return result
+
+
+def _edges(col_bounds, bins):
+    """
+    Edges of the histograms of the values below, between and above the bounds
+    """
+    _min, _max = float(col_bounds["min"]), float(col_bounds["max"])
+    lower_bound, upper_bound = float(col_bounds["lower_bound"]), float(col_bounds["upper_bound"])
+
+    ranges = {"lower_bound": (_min, min(lower_bound, _max)), "non_outliers": (max(lower_bound, _min),
+                                                                               min(upper_bound, _max)),
+              "upper_bound": (max(upper_bound, _min), _max)}
+
+    return {segment: np.linspace(lower, upper, bins + 1 if lower < upper else 2)
+            for segment, (lower, upper) in ranges.items() if lower <= upper}
+
+
+def _partition_stats(pdf, specs):
+    if hasattr(pdf, "to_pandas"):
+        pdf = pdf.to_pandas()
+
+    result = {}
+    for key, (col_name, lower_bound, upper_bound, edges) in specs.items():
+        values = pd.to_numeric(pdf[col_name], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        values = values[~np.isnan(values)]
+
+        lower = values < lower_bound
+        upper = values > upper_bound
+        masks = {"lower_bound": lower, "non_outliers": ~(lower | upper), "upper_bound": upper}
+
+        result[key] = {"counts": {segment: int(mask.sum()) for segment, mask in masks.items()},
+                       "hist": {segment: np.histogram(values[masks[segment]], segment_edges)[0]
+                                for segment, segment_edges in edges.items()}}
+    return result
+
+
+def _merge_stats(left, right):
+    return {key: {"counts": {segment: left[key]["counts"][segment] + right[key]["counts"][segment]
+                             for segment in SEGMENTS},
+                  "hist": {segment: left[key]["hist"][segment] + right[key]["hist"][segment]
+                           for segment in left[key]["hist"]}}
+            for key in left}
+
+
+def summary(df, bounds_result, bins=20) -> dict:
+    """
+    Count the values below, between and above the bounds of every column and method, and get their histograms,
+    in a single pass over the data.
+    :param df: Optimus DataFrame
+    :param bounds_result: Result of bounds()
+    :param bins: Number of bins of every histogram
+    :return: dict with the form {method: {col_name: {"count_outliers": ..., "hist": {...}, ...}}}
+    """
+    specs = {}
+    for method, cols_bounds in bounds_result.items():
+        for col_name, col_bounds in cols_bounds.items():
+            specs[(method, col_name)] = (col_name, col_bounds["lower_bound"], col_bounds["upper_bound"],
+                                         _edges(col_bounds, bins))
+
+    F = df.functions
+    stats = [F.delayed(_partition_stats)(partition, specs) for partition in F.to_delayed(df.data)]
+    stats = F.compute(F.delayed(functools.reduce)(_merge_stats, stats))
+
+    result = {}
+    for (method, col_name), (_, _, _, edges) in specs.items():
+        counts = stats[(method, col_name)]["counts"]
+        hist = {segment: [{"lower": float(segment_edges[i]), "upper": float(segment_edges[i + 1]),
+                           "count": int(count)}
+                          for i, count in enumerate(stats[(method, col_name)]["hist"][segment])]
+                for segment, segment_edges in edges.items()}
+
+        result.setdefault(method, {})[col_name] = {
+            **bounds_result[method][col_name],
+            "count_outliers": counts["lower_bound"] + counts["upper_bound"],
+            "count_non_outliers": counts["non_outliers"],
+            "lower_bound_count": counts["lower_bound"], "upper_bound_count": counts["upper_bound"],
+            "hist": hist}
+
+    return result
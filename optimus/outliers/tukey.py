@@ -1,5 +1,8 @@
+from optimus.helpers.columns import parse_columns
+from optimus.helpers.core import one_list_to_val
 from optimus.helpers.filters import dict_filter
 from optimus.helpers.json import dump_json
+from optimus.outliers import stats
 from optimus.outliers.abstract_outliers_bounds import AbstractOutlierBounds
 
 
@@ -15,7 +18,7 @@ class Tukey(AbstractOutlierBounds):
         :param col_name: column name
         """
         self.df = df
-        self.col_name = col_name
+        self.col_name = one_list_to_val(parse_columns(df, col_name))
 
         self.lower_bound, self.upper_bound, self.q1, self.median, self.q3, self.iqr = dict_filter(
             self.whiskers(), ["lower_bound", "upper_bound", "q1", "median", "q3", "iqr"]
@@ -25,37 +28,25 @@ class Tukey(AbstractOutlierBounds):
 
     def whiskers(self):
         """
-        Get the whiskers and IQR
+        Get the whiskers and IQR. They are computed once
         :return:
         """
-        iqr = self.df.cols.iqr(self.col_name, more=True)
+        if self._whiskers is None:
+            self._whiskers = stats.bounds(self.df, [self.col_name], ["tukey"])["tukey"][self.col_name]
 
-        lower_bound = iqr["q1"] - (iqr["iqr"] * 1.5)
-        upper_bound = iqr["q3"] + (iqr["iqr"] * 1.5)
-
-        result = {"lower_bound": lower_bound, "upper_bound": upper_bound, "q1": iqr["q1"], "median": iqr["q2"],
-                  "q3": iqr["q3"], "iqr": iqr["iqr"]}
-
-        return result
+        return self._whiskers
 
     def info(self, output: str = "dict"):
         """
         Get whiskers, iqrs and outliers and non outliers count
         :return:
         """
+        summary = self.summary()
 
-        lower_bound = self.lower_bound
-        upper_bound = self.upper_bound
-
-        q1 = self.q1
-        median = self.median
-        q3 = self.q3
-        iqr = self.iqr
-
-        result = {"count_outliers": self.count(), "count_non_outliers": self.non_outliers_count(),
-                  "lower_bound": lower_bound, "lower_bound_count": self.count_lower_bound(lower_bound),
-                  "upper_bound": upper_bound, "upper_bound_count": self.count_upper_bound(upper_bound),
-                  "q1": q1, "median": median, "q3": q3, "iqr": iqr}
+        result = {"count_outliers": summary["count_outliers"], "count_non_outliers": summary["count_non_outliers"],
+                  "lower_bound": self.lower_bound, "lower_bound_count": summary["lower_bound_count"],
+                  "upper_bound": self.upper_bound, "upper_bound_count": summary["upper_bound_count"],
+                  "q1": self.q1, "median": self.median, "q3": self.q3, "iqr": self.iqr}
 
         if output == "json":
             result = dump_json(result)
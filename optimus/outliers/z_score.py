@@ -1,10 +1,13 @@
-from optimus.infer import is_numeric
-from optimus.helpers.columns import parse_columns, name_col
+from optimus.helpers.columns import parse_columns
 from optimus.helpers.core import one_list_to_val
-from optimus.outliers.abstract_outliers_threshold import AbstractOutlierThreshold
+from optimus.helpers.filters import dict_filter
+from optimus.helpers.json import dump_json
+from optimus.infer import is_numeric
+from optimus.outliers import stats
+from optimus.outliers.abstract_outliers_bounds import AbstractOutlierBounds
 
 
-class ZScore(AbstractOutlierThreshold):
+class ZScore(AbstractOutlierBounds):
     """
     Handle outliers using z Score
     """
@@ -22,18 +25,36 @@ class ZScore(AbstractOutlierThreshold):
         self.df = df
         self.threshold = threshold
         self.col_name = one_list_to_val(parse_columns(df, col_name))
-        self.tmp_col = name_col(col_name, "z_score")
-        self.z_score = self.df[self.col_name].cols.z_score()
-        # print("self.df_score",self.df_score)
-        # print("self.df",self.df)
-        super().__init__()
+        self.lower_bound, self.upper_bound, self.mean, self.std = dict_filter(
+            self.whiskers(), ["lower_bound", "upper_bound", "mean", "std"]
+        )
+        super().__init__(df, col_name, self.lower_bound, self.upper_bound)
 
-    def info(self, output="dict"):
-        self.tmp_col = name_col(self.col_name, "z_score")
+    def whiskers(self):
+        """
+        Get the values whose z score is the threshold. They are computed once
+        :return:
+        """
+        if self._whiskers is None:
+            self._whiskers = stats.bounds(self.df, [self.col_name], ["z_score"], self.threshold)["z_score"][
+                self.col_name]
 
-        # df = self.z_score()
-        df = self.df
-        max_z_score = df.cols.max()
+        return self._whiskers
 
-        return {"count_outliers": self.count(), "count_non_outliers": self.non_outliers_count(),
-                "max_z_score": max_z_score}
+    def info(self, output: str = "dict"):
+        """
+        Get the bounds, the outliers and non outliers count and the max z score
+        :return:
+        """
+        summary = self.summary()
+        whiskers = self.whiskers()
+        max_z_score = max(abs(whiskers["max"] - self.mean), abs(whiskers["min"] - self.mean)) / self.std
+
+        result = {"count_outliers": summary["count_outliers"], "count_non_outliers": summary["count_non_outliers"],
+                  "lower_bound": self.lower_bound, "lower_bound_count": summary["lower_bound_count"],
+                  "upper_bound": self.upper_bound, "upper_bound_count": summary["upper_bound_count"],
+                  "max_z_score": max_z_score}
+
+        if output == "json":
+            result = dump_json(result)
+        return result
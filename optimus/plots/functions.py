@@ -1,6 +1,7 @@
+import numpy as np
 import seaborn as sns
-import statsmodels.api as sm
 from matplotlib import pyplot as plt
+from scipy import stats as scipy_stats
 from numpy.core._multiarray_umath import array
 
 from optimus.infer import is_dict, is_list
@@ -47,13 +48,13 @@ def plot_boxplot(column_data=None, output=None, path=None):
         if not is_dict(stats):
             continue
         fig, axes = plt.subplots(1, 1)
-        stats["whislo"] = stats.pop("whisker_low")
-        stats["whishi"] = stats.pop("whisker_high")
-        stats["med"] = stats.pop("median")
+        # Copy the stats so the ones passed can be rendered again
+        stats = {**stats, "whislo": stats["whisker_low"], "whishi": stats["whisker_high"], "med": stats["median"]}
+        for key in ["whisker_low", "whisker_high", "median"]:
+            stats.pop(key)
         bp = axes.bxp([stats], patch_artist=True)
 
         axes.set_title(col_name)
-        plt.figure(figsize=(12, 5))
 
         # 'fliers', 'means', 'medians', 'caps'
         for element in ['boxes', 'whiskers']:
@@ -237,22 +238,37 @@ def plot_missing_values(column_data=None, output=None, path=None):
         plt.subplots_adjust(left=0.05, right=0.99, top=0.9, bottom=0.3)
 
 
-def plot_qqplot(col_name, sample_data, output="plot", path=None):
+def plot_qqplot(column_data, output="plot", path=None):
     """
-    Plot a qqplot
-    :param col_name:
-    :param sample_data:
+    Plot a qqplot from the quantiles of a column, against the quantiles of a normal distribution
+    :param column_data: dict of {col_name: {probability: quantile}}
     :param output:
     :param path:
     :return:
     """
-    fig = plt.figure(figsize=(12, 5))
+    for col_name, quantiles in column_data.items():
+        if not is_dict(quantiles):
+            continue
 
-    sm.qqplot(sample_data.toPandas()[col_name], line='q', color='C0', alpha=0.3)
+        probabilities = np.array(list(quantiles.keys()), dtype="float64")
+        sample = np.array(list(quantiles.values()), dtype="float64")
+        theoretical = scipy_stats.norm.ppf(probabilities)
 
-    plt.title("qqplot '" + col_name + "' ")
+        fig = plt.figure(figsize=(12, 5))
+        plt.scatter(theoretical, sample, color='C0', alpha=0.3)
 
-    if output == "base64":
-        return output_base64(fig)
-    elif output == "image":
-        output_image(plt, path)
+        # Line through the first and third quartiles
+        q = np.interp([0.25, 0.75], probabilities, sample)
+        slope = (q[1] - q[0]) / (scipy_stats.norm.ppf(0.75) - scipy_stats.norm.ppf(0.25))
+        intercept = q[0] - slope * scipy_stats.norm.ppf(0.25)
+        plt.plot(theoretical, intercept + slope * theoretical, color='C1')
+
+        plt.xlabel("Theoretical Quantiles")
+        plt.ylabel("Sample Quantiles")
+        plt.title("qqplot '" + col_name + "' ")
+
+        if output == "base64":
+            return output_base64(fig)
+        elif output == "image":
+            output_image(plt, path)
+            print_html("<img src='" + path + "'>")
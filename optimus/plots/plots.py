@@ -82,9 +82,9 @@ class Plot:
 
     def qqplot(self, columns, n=100, output_format="plot", output_path=None):
         """
-        QQ plot
+        QQ plot of the quantiles of the columns, all computed together instead of sampling the rows
         :param columns:
-        :param n: Sample size
+        :param n: Number of quantiles
         :param output_format: Output format
         :param output_path: Path to the output file
         :return:
@@ -95,6 +95,7 @@ class Plot:
             df, cols_args=columns, filter_by_column_types=df.constants.NUMERIC_TYPES)
 
         if columns is not None:
-            sample_data = df.sample(n=n, random=True)
+            probabilities = [(i + 0.5) / n for i in range(n)]
+            data = df.cols.percentile(columns, probabilities, tidy=False)["percentile"]
             for col_name in columns:
-                plot_qqplot(col_name, sample_data, output=output_format, path=output_path)
+                plot_qqplot({col_name: data[col_name]}, output=output_format, path=output_path)
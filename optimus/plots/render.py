@@ -0,0 +1,77 @@
+import hashlib
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+from optimus.engines.pandas.parallel import _get_executor, _shutdown_executor
+from optimus.helpers.decorators import UniquesCache
+from optimus.plots.functions import plot_boxplot, plot_correlation, plot_frequency, plot_heatmap, plot_hist, \
+    plot_qqplot
+
+RENDER_MIN_IMAGES = 8
+"""Batches with less images than this are rendered in the current process, starting the pool would take longer"""
+RENDER_WORKERS = None
+"""Number of processes used, defaults to the number of CPUs"""
+IMAGES_CACHE_SIZE = 1000
+"""Rendered images kept in the cache"""
+
+PLOTS = {"hist": plot_hist, "frequency": plot_frequency, "box": plot_boxplot, "heatmap": plot_heatmap,
+         "correlation": plot_correlation, "qqplot": plot_qqplot}
+
+images_cache = UniquesCache(IMAGES_CACHE_SIZE)
+
+_MISSING = object()
+
+
+def image_key(plot, data, kwargs=None):
+    """
+    Hash of the plot name, the stats and the arguments used to render an image.
+    """
+    value = json.dumps([plot, data, kwargs or {}], sort_keys=True, default=str)
+    return hashlib.sha1(value.encode("utf8")).hexdigest()
+
+
+def _render(plot, data, kwargs):
+    return PLOTS[plot](data, output="base64", **kwargs)
+
+
+def render_base64(jobs, workers=None):
+    """
+    Render a batch of plots as base64 images. Images are rendered only from the aggregated stats passed, in a
+    pool of processes when the batch is large, and cached by the hash of their stats so the same stats are not
+    rendered again.
+    :param jobs: dict of {key: (plot name, stats, kwargs)}, plot names are the keys of PLOTS
+    :param workers: Number of processes, defaults to RENDER_WORKERS or the number of CPUs
+    :return: dict of {key: base64 image}
+    """
+    result = {}
+    pending = {}
+    for key, (plot, data, kwargs) in jobs.items():
+        hashed = image_key(plot, data, kwargs)
+        image = images_cache.get(hashed, _MISSING)
+        if image is _MISSING:
+            pending.setdefault(hashed, []).append(key)
+        else:
+            result[key] = image
+
+    hashes = list(pending)
+    args = [jobs[pending[hashed][0]] for hashed in hashes]
+    workers = workers or RENDER_WORKERS or os.cpu_count() or 1
+
+    images = None
+    if workers > 1 and len(args) >= RENDER_MIN_IMAGES:
+        try:
+            images = list(_get_executor(workers).map(_render, *zip(*args)))
+        except BrokenProcessPool:
+            # a worker died, the pool can not be used anymore
+            _shutdown_executor()
+
+    if images is None:
+        images = [_render(*arg) for arg in args]
+
+    for hashed, image in zip(hashes, images):
+        images_cache.set(hashed, image)
+        for key in pending[hashed]:
+            result[key] = image
+
+    return result
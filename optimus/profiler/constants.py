@@ -1 +1,2 @@
 MAX_BUCKETS = 32
+FLIERS_LIMIT = 1000
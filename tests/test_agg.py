@@ -0,0 +1,39 @@
+from optimus.tests.base import TestBase
+
+
+class TestAggPandas(TestBase):
+    dict = {"a": [1, 2.5, 3, 4, 10], "b": [3, 3, 3, 1, 2], "c": ["x", "y", "x", "w", "z"]}
+
+    def test_agg(self):
+        result = self.df.agg({"a": ["min", "max", "mean", "std", "var"], "b": ["mean", "sum", "std"],
+                              "c": "count_uniques"})
+        self.assertEqual(list(result.keys()), ["a_min", "a_max", "a_mean", "a_std", "a_var", "b_mean", "b_sum",
+                                               "b_std", "c_count_uniques"])
+        self.assertEqual(result["a_min"], 1.0)
+        self.assertEqual(result["a_max"], 10.0)
+        self.assertEqual(result["b_sum"], 12.0)
+        self.assertEqual(result["c_count_uniques"], 4)
+        self.assertAlmostEqual(result["a_mean"], 4.1)
+        self.assertAlmostEqual(result["a_var"], self.df.cols.var("a"), places=5)
+        self.assertAlmostEqual(result["a_std"], self.df.cols.std("a"), places=5)
+        self.assertAlmostEqual(result["b_mean"], 2.4)
+        self.assertAlmostEqual(result["b_std"], self.df.cols.std("b"), places=5)
+
+    def test_agg_large_values(self):
+        df = self.create_dataframe({"a": [1e9 + 0.1, 1e9 + 0.2, 1e9 + 0.3, 1e9 + 0.4]}, force_data_types=True)
+        result = df.agg({"a": ["mean", "var", "std"]})
+        self.assertAlmostEqual(result["a_mean"], 1e9 + 0.25, places=5)
+        self.assertAlmostEqual(result["a_var"], 0.0166667, places=5)
+        self.assertAlmostEqual(result["a_std"], 0.1290994, places=5)
+
+    def test_agg_dataframe(self):
+        df = self.df.agg({"a": ["min", "mean"]}, output="dataframe")
+        self.assertEqual(df.cols.names(), ["a_min", "a_mean"])
+
+
+class TestAggDask(TestAggPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestAggPartitionDask(TestAggPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
@@ -0,0 +1,67 @@
+from unittest import mock
+
+import pandas as pd
+
+from optimus.tests.base import TestBase
+
+
+class TestBatchPandas(TestBase):
+    dict = {"name": [" Foo ", "BAR", "baz "], "last": ["Qux", " quux", "CORGE "],
+            "price": [1.55, 2.25, 3.0], "tax": [0.123, 0.456, 0.789]}
+
+    def test_batch_string_columns(self):
+        df = self.df.cols.trim(["name", "last"]).cols.lower(["name", "last"], output_cols=["name_l", "last_l"])
+        expected = self.create_dataframe(data={"name": ["Foo", "BAR", "baz"], "name_l": ["foo", "bar", "baz"],
+                                               "last": ["Qux", "quux", "CORGE"], "last_l": ["qux", "quux", "corge"],
+                                               "price": [1.55, 2.25, 3.0], "tax": [0.123, 0.456, 0.789]})
+        self.assertTrue(df.equals(expected, decimal=True, assertion=True))
+
+    def test_batch_mixed_data_types(self):
+        df = self.df.cols.round(["price", "tax"], 1).cols.upper("*")
+        expected = self.create_dataframe(data={"name": [" FOO ", "BAR", "BAZ "], "last": ["QUX", " QUUX", "CORGE "],
+                                               "price": ["1.6", "2.2", "3.0"], "tax": ["0.1", "0.5", "0.8"]})
+        self.assertTrue(df.equals(expected, decimal=True, assertion=True))
+
+    def test_batch_meta_actions(self):
+        df = self.df.cols.upper(["name", "last"])
+        actions = [action for action in df.meta["transformations"]["actions"] if action["name"] == "upper"]
+
+        self.assertEqual([action["columns"] for action in actions], ["name", "last"])
+
+    def test_batch_category_columns(self):
+        df = self.create_dataframe({"name": ["foo", "bar"] * 10, "last": ["qux", "quux"] * 10})
+        df = df.optimize(categorical_threshold=10)
+        result = df.cols.apply(["name", "last"], lambda series: series, batch=True).data
+
+        # different categories would be joined as object
+        self.assertEqual([str(result[col].dtype) for col in ["name", "last"]], ["category", "category"])
+        self.assertEqual(df.functions.compute(result["last"]).tolist(), ["qux", "quux"] * 10)
+
+
+class TestBatchDask(TestBatchPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestBatchPartitionDask(TestBatchPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
+
+
+class TestBatchWritePandas(TestBase):
+    dict = {f"c{i}": ["Foo", "BAR", "baz"] for i in range(50)}
+
+    def test_one_call_per_block(self):
+        calls = []
+
+        def lower(series):
+            calls.append(len(series))
+            return series.str.lower()
+
+        setitem = pd.DataFrame.__setitem__
+        with mock.patch.object(pd.DataFrame, "__setitem__", autospec=True, side_effect=setitem) as patched:
+            df = self.df.cols.apply("*", lower, batch=True)
+
+        # the function runs once over the stacked columns and the result is not written column by column
+        self.assertEqual(calls, [150])
+        self.assertLess(patched.call_count, 5)
+        self.assertEqual(df.cols.names(), self.df.cols.names())
+        self.assertEqual(df.to_dict(n=1)["c49"], ["foo"])
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from optimus.benchmarks import scenarios
+from optimus.benchmarks.__main__ import main
+from optimus.benchmarks.benchmark import Benchmark, compare
+from optimus.helpers.decorators import uniques_cache
+from optimus.tests.base import TestBase
+
+
+def _results(times):
+    return {"results": {engine: {"tall": {scenario: {"min": time, "mean": time, "repeat": 1}
+                                          for scenario, time in scenarios_times.items()}}
+                        for engine, scenarios_times in times.items()}}
+
+
+class TestBenchmarksPandas(TestBase):
+    dict = {"name": ["Foo", "bar", "Baz"], "price": [3.0, 1.55, 2.25]}
+
+    def test_run(self):
+        path = tempfile.mkdtemp()
+        config = {key: value for key, value in self.config.items() if key in ["engine", "n_partitions"]}
+        results = Benchmark([config], "tall", ["load.csv", "rows.sort"], rows=100, repeat=1, path=path).run()
+
+        name = config["engine"] if "n_partitions" not in config else f"{config['engine']}_{config['n_partitions']}"
+        for scenario in ["load.csv", "rows.sort"]:
+            self.assertIn("min", results["results"][name]["tall"][scenario])
+
+    def test_cold_repeats(self):
+        frames = []
+        cached = []
+
+        def scenario(op, df, paths):
+            frames.append(df)
+            cached.append(len(uniques_cache.data))
+            df.cols.infer_type("*")
+            uniques_cache.set(("benchmark", str, len(frames)), True)
+
+        result = Benchmark(repeat=3)._time(scenario, self.op, lambda: self.create_dataframe(self.dict), {})
+
+        self.assertEqual(result["repeat"], 3)
+        self.assertEqual(len({id(df) for df in frames}), 3)
+        self.assertEqual(cached, [0, 0, 0])
+
+    def test_load_csv_kwargs(self):
+        path = os.path.join(tempfile.mkdtemp(), "data.csv")
+        pd.DataFrame(self.dict).to_csv(path, index=False)
+        received = {}
+
+        class Load:
+            def csv(_self, filepath, **kwargs):
+                received.update(kwargs)
+                return self.op.load.csv(filepath, **kwargs)
+
+        class Op:
+            load = Load()
+
+        kwargs = {"n_partitions": self.config["n_partitions"]} if "n_partitions" in self.config else {}
+        scenarios.load_csv(Op(), None, {"csv": path, "load_kwargs": kwargs})
+        self.assertEqual(received, kwargs)
+
+    def test_compare(self):
+        baseline = _results({"pandas": {"profile": 1.0, "hist": 1.0, "frequency": 0}})
+        current = _results({"pandas": {"profile": 1.5, "hist": 1.1, "frequency": 1.0}, "dask_4": {"hist": 1.0}})
+
+        regressions = compare(baseline, current, threshold=1.2)
+
+        self.assertEqual([(r["engine"], r["scenario"]) for r in regressions], [("pandas", "profile")])
+        self.assertAlmostEqual(regressions[0]["ratio"], 1.5)
+
+    def test_compare_exit_code(self):
+        path = tempfile.mkdtemp()
+        files = {}
+        for name, time in [("baseline", 1.0), ("same", 1.1), ("slower", 2.0)]:
+            files[name] = os.path.join(path, f"{name}.json")
+            with open(files[name], "w") as f:
+                json.dump(_results({"pandas": {"profile": time}}), f)
+
+        self.assertEqual(main(["compare", files["baseline"], files["same"]]), 0)
+        self.assertEqual(main(["compare", files["baseline"], files["slower"]]), 1)
+        self.assertEqual(main(["compare", files["baseline"], files["same"], "--threshold", "1.05"]), 1)
+
+
+class TestBenchmarksDask(TestBenchmarksPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestBenchmarksPartitionDask(TestBenchmarksPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
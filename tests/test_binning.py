@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from optimus.tests.base import TestBase
+
+
+class TestBinningPandas(TestBase):
+    dict = {"x": [1.0, 2.5, 3.0, None, 7.5, 9.0, 2.0, 4.0, 6.0, 10.0],
+            "y": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3],
+            "a": ["p", "q", "p", "r", None, "q", "p", "q", "r", "p"],
+            "b": ["u", "v", "v", "u", "u", None, "u", "v", "v", "u"]}
+
+    def test_heatmap(self):
+        result = self.df.cols.heatmap("x", "y", bins_x=4, bins_y=3)
+
+        pdf = pd.DataFrame(self.dict)[["x", "y"]].dropna()
+        values, x_edges, y_edges = np.histogram2d(pdf["x"], pdf["y"], bins=(4, 3))
+        self.assertEqual(result["x"], {"name": "x", "edges": [x_edges[0], x_edges[-1]]})
+        self.assertEqual(result["y"], {"name": "y", "edges": [y_edges[0], y_edges[-1]]})
+        self.assertEqual(result["values"], values.T.tolist())
+
+    def test_heatmap_constant(self):
+        df = self.create_dataframe({"x": [2.0] * 6, "y": [None] * 6})
+        result = df.cols.heatmap("x", "x", bins_x=2, bins_y=2)
+        self.assertEqual(result["x"]["edges"], [1.5, 2.5])
+        self.assertEqual(result["values"], np.histogram2d([2.0] * 6, [2.0] * 6, bins=2)[0].T.tolist())
+
+        result = df.cols.heatmap("x", "y", bins_x=2, bins_y=2)
+        self.assertEqual(result["y"]["edges"], [0.0, 1.0])
+        self.assertEqual(result["values"], [[0.0, 0.0], [0.0, 0.0]])
+
+    def test_cross_tab(self):
+        pdf = pd.DataFrame(self.dict)
+        expected = pd.crosstab(pdf["a"], pdf["b"])
+
+        self.assertEqual(self.df.cols.cross_tab("a", "b"), expected.to_dict())
+
+        result = self.df.cols.cross_tab("a", "b", output="dataframe").to_pandas()
+        expected.columns = map(str, expected.columns)
+        self.assertTrue(result.equals(expected.reset_index()))
+
+
+class TestBinningDask(TestBinningPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestBinningPartitionDask(TestBinningPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
@@ -0,0 +1,40 @@
+from unittest import mock
+
+from optimus.tests.base import TestBase
+
+
+class TestBoxplotPandas(TestBase):
+    dict = {"a": [1, 2, 3, 4, 5, 6, 7, 8, -50, 100, 200, 9],
+            "b": [1.5, 2.5, 2.0, 3.0, 2.5, 40.0, 2.0, 1.0, 3.5, 2.0, 2.5, None],
+            "c": ["x", "y", "z", "x", "y", "z", "x", "y", "z", "x", "y", "z"]}
+
+    def test_boxplot(self):
+        result = self.df.cols.boxplot()
+
+        self.assertEqual(result["a"]["fliers"], [-50, 100, 200])
+        self.assertEqual(result["b"]["fliers"], [40.0])
+        self.assertEqual(result["a"]["mean"], self.df.cols.mean("a"))
+        self.assertEqual(result["a"]["label"], "a")
+        self.assertEqual(result["a"]["whisker_high"], result["a"]["q3"] + (result["a"]["q3"] - result["a"]["q1"]) * 1.5)
+        self.assertEqual(set(result), {"a", "b", "c"})
+
+    def test_fliers_limit(self):
+        result = self.df.cols.boxplot(["a", "b"], fliers_limit=2)
+        self.assertEqual(result["a"]["fliers"], [-50, 100])
+        self.assertEqual(result["b"]["fliers"], [40.0])
+
+    def test_batched(self):
+        cols = type(self.df.cols)
+        with mock.patch.object(cols, "mean", autospec=True, side_effect=cols.mean) as mean, \
+                mock.patch.object(cols, "percentile", autospec=True, side_effect=cols.percentile) as percentile:
+            self.df.cols.boxplot(["a", "b", "c"])
+        self.assertEqual(mean.call_count, 1)
+        self.assertEqual(percentile.call_count, 1)
+
+
+class TestBoxplotDask(TestBoxplotPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestBoxplotPartitionDask(TestBoxplotPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
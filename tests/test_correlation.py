@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from optimus.engines.base import correlation
+from optimus.tests.base import TestBase
+
+
+class TestCorrelationPandas(TestBase):
+    dict = {"a": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12],
+            "b": [2.5, 1.0, None, 4.0, 3.5, 8.0, 7.5, None, 9.0, 12.0, 10.5, 11.0],
+            "c": [5, 3, 3, 1, 2, 2, 8, 9, 1, 4, 4, 6],
+            "d": ["x", "y", "z", "x", "y", "z", "x", "y", "z", "x", "y", "z"],
+            "e": [1e9 + 0.1, 1e9 + 0.3, 1e9 + 0.2, 1e9 + 0.5, 1e9 + 0.4, 1e9 + 0.9, 1e9 + 0.6, 1e9 + 0.8,
+                  1e9 + 0.7, 1e9 + 1.2, 1e9 + 1.0, 1e9 + 1.1]}
+
+    def assertMatrixEqual(self, result, expected):
+        result = pd.DataFrame(result)
+        self.assertEqual(list(result.columns), list(expected.columns))
+        np.testing.assert_allclose(result.loc[expected.index, expected.columns].to_numpy(), expected.to_numpy(),
+                                   atol=1e-6)
+
+    def test_pearson(self):
+        expected = pd.DataFrame(self.dict).drop(columns="d").corr()
+        self.assertMatrixEqual(self.df.cols.correlation("*"), expected)
+
+    def test_spearman(self):
+        expected = pd.DataFrame(self.dict)[["a", "c", "e"]].corr("spearman")
+        self.assertMatrixEqual(self.df.cols.correlation(["a", "c", "e"], "spearman"), expected)
+
+    def test_kendall(self):
+        expected = pd.DataFrame(self.dict).drop(columns="d").corr("kendall")
+        self.assertMatrixEqual(self.df.cols.correlation("*", "kendall"), expected)
+
+    def test_kendall_repeated_rows(self):
+        # few distinct rows repeated many times, the sample has to keep their proportions
+        rows = [(0, 0)] * 400 + [(1, 2)] * 300 + [(2, 1)] * 200 + [(2, 2)] * 100 + [(0, 1)] * 100
+        pdf = pd.DataFrame(rows, columns=["x", "y"])
+        df = self.create_dataframe(pdf.to_dict(orient="list"))
+
+        sample_rows, correlation.KENDALL_SAMPLE_ROWS = correlation.KENDALL_SAMPLE_ROWS, 300
+        try:
+            result = df.functions.compute(correlation.matrix(df, ["x", "y"], "kendall"))
+        finally:
+            correlation.KENDALL_SAMPLE_ROWS = sample_rows
+        self.assertAlmostEqual(result.loc["x", "y"], pdf["x"].corr(pdf["y"], "kendall"), delta=0.1)
+
+    def test_pair(self):
+        result = self.df.cols.correlation(["a", "b"])
+        self.assertAlmostEqual(result, pd.DataFrame(self.dict)["a"].corr(pd.DataFrame(self.dict)["b"]))
+
+
+class TestCorrelationDask(TestCorrelationPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestCorrelationPartitionDask(TestCorrelationPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
+
+    def test_approximate(self):
+        size, correlation.SKETCH_SIZE = correlation.SKETCH_SIZE, 50
+        pairs, correlation.KENDALL_PAIRS = correlation.KENDALL_PAIRS, 5000
+        try:
+            rng = np.random.default_rng(0)
+            x = rng.normal(size=1000)
+            pdf = pd.DataFrame({"x": x, "y": x + rng.normal(size=1000)})
+            df = self.create_dataframe(pdf.to_dict(orient="list"))
+
+            for method in ["spearman", "kendall"]:
+                self.assertAlmostEqual(df.cols.correlation(["x", "y"], method), pdf["x"].corr(pdf["y"], method),
+                                       delta=0.03)
+        finally:
+            correlation.SKETCH_SIZE, correlation.KENDALL_PAIRS = size, pairs
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from optimus.engines.base.dask import duplicated as dask_duplicated
+from optimus.tests.base import TestBase
+
+rng = np.random.default_rng(0)
+
+
+class TestDuplicatedPandas(TestBase):
+    dict = {"a": rng.integers(0, 20, 300).tolist(), "b": rng.choice(["x", "y", "z"], 300).tolist()}
+
+    def setUp(self):
+        self.pdf = pd.DataFrame(self.dict)
+
+    def tearDown(self):
+        dask_duplicated.BLOOM_FILTER_BITS = None
+
+    def assert_duplicated(self, cols, keep):
+        mask = self.df.mask.duplicated(cols, keep=keep).to_pandas().iloc[:, 0]
+        expected = self.pdf.duplicated(subset=None if cols == "*" else cols, keep=keep)
+        self.assertEqual(mask.tolist(), expected.tolist())
+
+    def test_duplicated(self):
+        for cols in ["*", ["a"], ["a", "b"]]:
+            for keep in ["first", "last", False]:
+                self.assert_duplicated(cols, keep)
+
+    def test_duplicated_bloom_filter(self):
+        dask_duplicated.BLOOM_FILTER_BITS = 2 ** 10
+        for keep in ["first", "last", False]:
+            self.assert_duplicated(["a", "b"], keep)
+        dask_duplicated.BLOOM_FILTER_BITS = 16
+        self.assert_duplicated(["a"], "first")
+
+    def test_drop_duplicated(self):
+        for how in ["any", "all"]:
+            for keep in ["first", "last"]:
+                result = self.df.rows.drop_duplicated(["a", "b"], keep=keep, how=how).to_pandas()
+                expected = self.pdf.drop_duplicates(["a", "b"], keep=keep)
+                self.assertEqual(result.values.tolist(), expected.values.tolist())
+
+
+class TestDuplicatedDask(TestDuplicatedPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestDuplicatedPartitionDask(TestDuplicatedPandas):
+    config = {'engine': 'dask', 'n_partitions': 4}
@@ -0,0 +1,67 @@
+from unittest import mock
+
+from optimus.tests.base import TestBase
+
+
+class TestInferredTypesPandas(TestBase):
+    dict = {"a": [1, 2, 3, 4], "b": [1.5, 2.5, 3.5, 4.5], "c": ["x", "y", "z", "x"],
+            "d": ["2020-01-13", "2020-02-14", "2020-03-15", "2020-04-16"]}
+
+    def setUp(self):
+        # a new dataframe for every test, so nothing is cached
+        self.df = self.create_dataframe(self.dict, force_data_types=True)
+
+    def infer_calls(self):
+        cols = type(self.df.cols)
+        return mock.patch.object(cols, "_infer_type", autospec=True, side_effect=cols._infer_type)
+
+    def test_operation(self):
+        with self.infer_calls() as infer:
+            self.assertEqual((self.df["a"] + self.df["b"]).to_dict(), {"a_b": [2.5, 4.5, 6.5, 8.5]})
+            self.assertEqual(infer.call_count, 2)
+            self.assertEqual((self.df["b"] * self.df["a"]).to_dict(), {"b_a": [1.5, 5.0, 10.5, 18.0]})
+            self.assertEqual(infer.call_count, 2)
+
+    def test_derived(self):
+        types = self.df.cols.infer_type(tidy=False)["infer_type"]
+
+        with self.infer_calls() as infer:
+            df = self.df.cols.rename("a", "z")
+            self.assertEqual(df.cols.infer_type("z"), types["a"])
+            df = self.df.rows.select(self.df["a"] > 1)
+            self.assertEqual(df.cols.infer_type(tidy=False)["infer_type"], types)
+            df = self.df.cols.select(["c", "b"])
+            self.assertEqual(df.cols.infer_type(tidy=False)["infer_type"], {"c": types["c"], "b": types["b"]})
+            self.assertEqual(infer.call_count, 0)
+
+            # transformed columns are inferred again
+            df = self.df.cols.to_string("a")
+            self.assertEqual(df.cols.infer_type("a")["data_type"], "int")
+            self.assertEqual(infer.call_count, 1)
+            self.assertEqual(infer.call_args[0][1], ["a"])
+
+    def test_meta(self):
+        df = self.df.cols.rename("a", "z")
+        df.cols.infer_type()
+
+        with self.infer_calls() as infer:
+            # a new dataframe with the same data and meta does not have the cache
+            df = df.new(df.data, meta=df.meta).cols.rename("z", "y").rows.sort("b")
+            self.assertEqual(df.cols.infer_type("y")["data_type"], "int")
+            self.assertEqual(infer.call_count, 0)
+
+    def test_date_formats(self):
+        self.assertEqual(self.df.cols.infer_date_formats("d"), "%Y-%m-%d")
+
+        with mock.patch.object(type(self.df.cols), "date_formats") as date_formats:
+            self.assertEqual(self.df["d"].cols.infer_date_formats("d"), "%Y-%m-%d")
+            self.assertEqual(self.df.cols.rename("d", "e").cols.infer_date_formats("e"), "%Y-%m-%d")
+            date_formats.assert_not_called()
+
+
+class TestInferredTypesDask(TestInferredTypesPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestInferredTypesPartitionDask(TestInferredTypesPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
@@ -0,0 +1,74 @@
+from optimus.tests.base import TestBase
+
+
+class TestLazyPandas(TestBase):
+    dict = {"name": [" Foo ", "BAR", "baz "], "price": [1.55, 2.25, 3.0]}
+
+    def test_lazy_fused_chain(self):
+        df = self.df
+
+        lazy = df.lazy().cols.trim("name").cols.lower("name").cols.upper("name", output_cols="name_up")
+        eager = df.cols.trim("name").cols.lower("name").cols.upper("name", output_cols="name_up")
+
+        self.assertTrue(lazy.plan.pending)
+        self.assertEqual(lazy.to_dict(n="all"), eager.to_dict(n="all"))
+        self.assertFalse(lazy.plan.pending)
+
+    def test_lazy_names(self):
+        df = self.df.lazy().cols.round("price", 1, output_cols="price_round")
+
+        self.assertEqual(df.cols.names(), ["name", "price", "price_round"])
+
+    def test_lazy_shared_prefix(self):
+        calls = []
+
+        def func(series):
+            calls.append(len(series))
+            return series.str.strip()
+
+        lazy = self.df.lazy().cols.apply("name", func).cols.lower("name", output_cols="name_low") \
+            .cols.upper("name", output_cols="name_up")
+
+        self.assertEqual(lazy.plan.chains, {"name": ["func"], "name_low": ["func", "lower"],
+                                            "name_up": ["func", "upper"]})
+        calls.clear()
+        result = lazy.to_dict(n="all")
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(result, {"name": ["Foo", "BAR", "baz"], "name_low": ["foo", "bar", "baz"],
+                                  "name_up": ["FOO", "BAR", "BAZ"],  "price": [1.55, 2.25, 3.0]})
+
+    def test_lazy_steps_do_not_execute(self):
+        lazy = self.df.lazy()
+        data = lazy._data
+
+        for _ in range(5):
+            lazy = lazy.cols.lower("name").cols.upper("name")
+
+        self.assertIs(lazy._data, data)
+        self.assertEqual(len(lazy.plan.chains["name"]), 10)
+
+    def test_lazy_meta(self):
+        df = self.df
+
+        lazy = df.lazy().cols.trim("name").cols.upper("name", output_cols="name_up").cols.round("price", 1)
+        eager = df.cols.trim("name").cols.upper("name", output_cols="name_up").cols.round("price", 1)
+
+        self.assertEqual(lazy.meta["transformations"], eager.meta["transformations"])
+
+    def test_eager_data(self):
+        # without a plan the data is a plain attribute of the instance
+        self.assertIs(self.df.__dict__["data"], self.df.data)
+
+        lazy = self.df.lazy()
+        self.assertNotIn("data", lazy.__dict__)
+        eager = lazy.cols.upper("name").lazy(False)
+        self.assertIn("data", eager.__dict__)
+        self.assertEqual(eager.to_dict(n="all")["name"], [" FOO ", "BAR", "BAZ "])
+
+
+class TestLazyDask(TestLazyPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestLazyPartitionDask(TestLazyPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
@@ -0,0 +1,58 @@
+import numpy as np
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.linear_model import SGDRegressor
+
+from optimus.engines.base.ml import incremental
+from optimus.tests.base import TestBase
+
+rng = np.random.default_rng(0)
+x = rng.uniform(-5, 5, 600)
+z = rng.uniform(-5, 5, 600)
+
+
+class TestIncrementalPandas(TestBase):
+    dict = {"x": x.tolist(), "z": z.tolist(), "y": (2 * x - z + 1).tolist(),
+            "label": (x + z > 0).astype(int).tolist(),
+            "cluster": np.where(np.arange(600) % 2, 10.0, -10.0) + rng.normal(0, 0.5, 600)}
+
+    def test_split(self):
+        pdf = self.df.to_pandas()
+        train = incremental._values(pdf, ["x"], ["y"], 0.25, 0)
+        test = incremental._values(pdf, ["x"], ["y"], 0.25, 0, test=True)
+        self.assertEqual(len(train[0]) + len(test[0]), 600)
+        self.assertAlmostEqual(len(test[0]) / 600, 0.25, delta=0.05)
+        self.assertFalse(set(train[0].ravel()) & set(test[0].ravel()))
+
+    def test_fit(self):
+        model, score = incremental.fit(self.df, ["x", "z"], ["y"], SGDRegressor(random_state=0), epochs=5)
+        np.testing.assert_allclose(model.predict([[1.0, 2.0], [3.0, 0.0]]), [1.0, 7.0], atol=0.1)
+        self.assertGreater(score["r2"], 0.99)
+        self.assertLess(-score["neg_mean_squared_error"], 0.01)
+
+    def test_fit_unsupervised(self):
+        model, score = incremental.fit(self.df, ["cluster"], [], MiniBatchKMeans(2, n_init=3, random_state=0),
+                                       scale=False)
+        np.testing.assert_allclose(sorted(model.cluster_centers_.ravel()), [-10, 10], atol=0.5)
+        self.assertGreater(score["inertia"], 0)
+
+
+class TestIncrementalDask(TestIncrementalPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestIncrementalPartitionDask(TestIncrementalPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
+
+    def test_linear_regression(self):
+        model = self.df.ml.linear_regression(["x", "z"], "y")
+        self.assertAlmostEqual(model.predict([[1.0, 2.0]])[0], 1.0, delta=0.1)
+        self.assertGreater(model.score["r2"], 0.99)
+
+    def test_logistic_regression(self):
+        model = self.df.ml.logistic_regression(["x", "z"], "label", test_size=0.3)
+        self.assertEqual(model.predict([[3.0, 2.0], [-3.0, -1.0]]), [1.0, 0.0])
+        self.assertGreater(model.evaluation["accuracy"], 0.9)
+
+    def test_k_means(self):
+        model = self.df.ml.k_means("cluster", 2)
+        self.assertEqual(len(set(model.predict([[-9.0], [11.0]]))), 2)
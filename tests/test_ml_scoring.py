@@ -0,0 +1,64 @@
+import numpy as np
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from optimus.engines.base.ml import scoring
+from optimus.tests.base import TestBase
+
+x = np.arange(20, dtype="float64")
+z = np.tile([1.0, -1.0], 10)
+
+
+class TestScoringPandas(TestBase):
+    dict = {"x": x.tolist(), "z": z.tolist(), "name": [str(i) for i in range(20)],
+            "label": (x > 9.5).astype(int).tolist()}
+
+    def setUp(self):
+        super().setUp()
+        from optimus.engines.pandas.ml.models import Model
+        X = np.column_stack([x, z])
+        self.regression = Model(LinearRegression().fit(X, 2 * x + z), features=["x", "z"])
+        self.classifier = LogisticRegression().fit(X, (x > 9.5).astype(int))
+
+    def test_predict_batch(self):
+        df = self.regression.predict_batch(self.df, chunk_size=3)
+        self.assertEqual(df.cols.names(), ["x", "z", "name", "label", "prediction"])
+        np.testing.assert_allclose(df.to_pandas()["prediction"], 2 * x + z, atol=1e-9)
+        self.assertEqual(df.to_pandas()["name"].tolist(), self.dict["name"])
+
+    def test_predict_proba(self):
+        model = type(self.regression)(self.classifier)
+        df = model.predict_batch(self.df, ["x", "z"], "proba", method="predict_proba", chunk_size=7)
+        pdf = df.to_pandas()
+        np.testing.assert_allclose(pdf[["proba_0", "proba_1"]].to_numpy(),
+                                   self.classifier.predict_proba(np.column_stack([x, z])))
+
+    def test_fitted_features(self):
+        # models fitted by df.ml remember their features, the target is not used to predict
+        model = self.df.ml.logistic_regression(["x", "z"], "label", test_size=0.3)
+        self.assertEqual(model.features, ["x", "z"])
+        pdf = model.predict_batch(self.df).to_pandas()
+        self.assertEqual(pdf["prediction"].tolist(), [float(v) for v in model.predict(pdf[["x", "z"]].to_numpy())])
+
+    def test_unknown_features(self):
+        model = type(self.regression)(self.regression.model)
+        with self.assertRaises(ValueError):
+            model.predict_batch(self.df)
+
+    def test_missing_features(self):
+        df = self.create_dataframe({"x": [1.0, None, "3"], "z": [1.0, -1.0, 1.0]})
+        pdf = self.regression.predict_batch(df, output_col="y").to_pandas()
+        np.testing.assert_allclose(pdf["y"], [3.0, np.nan, 7.0], atol=1e-9)
+
+    def test_chunks(self):
+        pdf = self.df.to_pandas()
+        result = scoring._predict(pdf, self.regression.model, ["x", "z"], "predict", {"prediction": "float64"}, 6)
+        np.testing.assert_allclose(result["prediction"], 2 * x + z, atol=1e-9)
+        self.assertNotIn("prediction", pdf)
+
+
+class TestScoringDask(TestScoringPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestScoringPartitionDask(TestScoringPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
@@ -0,0 +1,68 @@
+import io
+from contextlib import redirect_stdout
+
+import numpy as np
+import pandas as pd
+
+from optimus.helpers.functions import is_pyarrow_installed
+from optimus.tests.base import TestBase
+
+
+class TestOptimizePandas(TestBase):
+    dict = {"small": [1, 2, 3, 250] * 25,
+            "negative": [-1, 2, -300, 4] * 25,
+            "text_numbers": ["1", "2", None, "40000"] * 25,
+            "decimals": [0.5, 1.25, None, 2.0] * 25,
+            "precise": [0.1, 0.2, 0.3, 0.4] * 25,
+            "category": ["a", "b", "c", None] * 25,
+            "text": [f"value {i}" for i in range(100)],
+            "mixed": [1, "a", [1], None] * 25}
+
+    def test_optimize(self):
+        df = self.df.optimize(categorical_threshold=10)
+        dtypes = {col: str(dtype) for col, dtype in df.data.dtypes.items()}
+
+        self.assertEqual(dtypes["small"], "uint8")
+        self.assertEqual(dtypes["negative"], "int16")
+        self.assertEqual(dtypes["text_numbers"], "UInt16")
+        self.assertEqual(dtypes["decimals"], "float32")
+        self.assertEqual(dtypes["precise"], "float64")
+        self.assertEqual(dtypes["category"], "category")
+        self.assertEqual(dtypes["mixed"], "object")
+        if is_pyarrow_installed():
+            self.assertEqual(dtypes["text"], "string")
+
+        result = df.to_pandas()
+        self.assertEqual(result["text_numbers"].tolist()[:4], [1, 2, pd.NA, 40000])
+        self.assertEqual(result["category"].tolist()[:4], ["a", "b", "c", np.nan])
+        self.assertEqual(result["text"].tolist(), self.dict["text"])
+
+    def test_optimize_report(self):
+        df = self.df.optimize(categorical_threshold=10)
+        report = df.meta["optimize"]
+
+        self.assertEqual(report["small"]["from"], "int64")
+        self.assertEqual(report["small"]["to"], "uint8")
+        self.assertEqual(report["small"]["saved"], 700)
+        self.assertNotIn("precise", report)
+        for col_report in report.values():
+            self.assertGreater(col_report["saved"], 0)
+
+    def test_optimize_categorical(self):
+        df = self.df.optimize(categorical=False)
+        self.assertNotEqual(str(df.data.dtypes["category"]), "category")
+
+    def test_optimize_verbose(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.df.optimize(categorical_threshold=10, verbose=True)
+        self.assertIn("small: int64 -> uint8", output.getvalue())
+        self.assertIn("Memory usage before optimization", output.getvalue())
+
+
+class TestOptimizeDask(TestOptimizePandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestOptimizePartitionDask(TestOptimizePandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
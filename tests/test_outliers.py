@@ -0,0 +1,98 @@
+import json
+from unittest import mock
+
+import numpy as np
+
+from optimus.outliers import stats
+from optimus.tests.base import TestBase
+
+rng = np.random.default_rng(0)
+
+
+class TestOutliersPandas(TestBase):
+    dict = {"a": [*rng.normal(0, 10, 200).round(2).tolist(), 150.0, -120.0, None],
+            "b": [*rng.integers(0, 20, 200).tolist(), 90, 1, 2]}
+
+    def expected_counts(self, col_name, lower_bound, upper_bound):
+        values = np.array([value for value in self.dict[col_name] if value is not None], dtype=float)
+        lower, upper = int((values < lower_bound).sum()), int((values > upper_bound).sum())
+        return {"count_outliers": lower + upper, "count_non_outliers": len(values) - lower - upper,
+                "lower_bound_count": lower, "upper_bound_count": upper}
+
+    def test_tukey(self):
+        tukey = self.df.outliers.tukey("a")
+
+        with mock.patch.object(stats, "bounds") as bounds:
+            info = tukey.info()
+            self.assertEqual(tukey.count(), info["count_outliers"])
+            self.assertEqual(tukey.non_outliers_count(), info["count_non_outliers"])
+            bounds.assert_not_called()
+
+        self.assertEqual({key: info[key] for key in ["count_outliers", "count_non_outliers", "lower_bound_count",
+                                                     "upper_bound_count"]},
+                         self.expected_counts("a", info["lower_bound"], info["upper_bound"]))
+        self.assertEqual(info["iqr"], info["q3"] - info["q1"])
+        self.assertEqual(info["lower_bound"], info["q1"] - info["iqr"] * 1.5)
+
+        hist = json.loads(tukey.hist())
+        self.assertEqual(list(hist), ["lower_bound", "non_outliers", "upper_bound"])
+        self.assertEqual(sum(bin["count"] for bin in hist["non_outliers"]), info["count_non_outliers"])
+        self.assertEqual(sum(bin["count"] for bin in hist["upper_bound"]), info["upper_bound_count"])
+
+    def test_mad(self):
+        info = self.df.outliers.mad("b", 3).info()
+        self.assertEqual({key: info[key] for key in ["count_outliers", "count_non_outliers", "lower_bound_count",
+                                                     "upper_bound_count"]},
+                         self.expected_counts("b", info["lower_bound"], info["upper_bound"]))
+
+    def test_z_score(self):
+        z_score = self.df.outliers.z_score("a", 2)
+
+        with mock.patch.object(stats, "bounds") as bounds:
+            info = z_score.info()
+            self.assertEqual(z_score.count(), info["count_outliers"])
+            bounds.assert_not_called()
+
+        self.assertEqual({key: info[key] for key in ["count_outliers", "count_non_outliers", "lower_bound_count",
+                                                     "upper_bound_count"]},
+                         self.expected_counts("a", info["lower_bound"], info["upper_bound"]))
+        values = np.array([value for value in self.dict["a"] if value is not None], dtype=float)
+        scores = np.abs(values - values.mean()) / values.std(ddof=1)
+        self.assertEqual(info["count_outliers"], int((scores > 2).sum()))
+        self.assertAlmostEqual(info["max_z_score"], scores.max(), places=5)
+
+    def test_modified_z_score(self):
+        modified_z_score = self.df.outliers.modified_z_score("b", 3.5)
+        info = modified_z_score.info()
+
+        self.assertEqual({key: info[key] for key in ["count_outliers", "count_non_outliers", "lower_bound_count",
+                                                     "upper_bound_count"]},
+                         self.expected_counts("b", info["lower_bound"], info["upper_bound"]))
+        self.assertAlmostEqual(info["upper_bound"], modified_z_score.median + 3.5 * modified_z_score.mad / 0.6745)
+        self.assertEqual(modified_z_score.select().rows.count(), info["count_outliers"])
+
+    def test_summary(self):
+        result = self.df.outliers.summary(["a", "b"], stats.METHODS, threshold={"z_score": 2})
+
+        self.assertEqual(list(result), stats.METHODS)
+        for method, cols in result.items():
+            for col_name, info in cols.items():
+                self.assertEqual({key: info[key] for key in ["count_outliers", "count_non_outliers",
+                                                             "lower_bound_count", "upper_bound_count"]},
+                                 self.expected_counts(col_name, info["lower_bound"], info["upper_bound"]))
+
+        z_score = result["z_score"]["a"]
+        self.assertAlmostEqual(z_score["upper_bound"], z_score["mean"] + 2 * z_score["std"])
+        mad = result["modified_z_score"]["b"]
+        self.assertAlmostEqual(mad["upper_bound"], mad["median"] + 3.5 * mad["mad"] / 0.6745)
+
+        with self.assertRaises(ValueError):
+            self.df.outliers.summary("a", "iqr")
+
+
+class TestOutliersDask(TestOutliersPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestOutliersPartitionDask(TestOutliersPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
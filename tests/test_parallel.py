@@ -0,0 +1,81 @@
+from unittest import mock
+
+import pandas as pd
+
+from optimus.engines.pandas import parallel
+from optimus.tests.base import TestBase
+
+
+def _upper(series):
+    return series.str.upper()
+
+
+class TestParallelPandas(TestBase):
+    dict = {"name": ["Optimus", "Bumblebee", "Eject", "Ratchet", "Megatron", "Jazz"] * 50,
+            "other": ["Prime", "Bumble", "Ejected", "Metroplex", "Megatron", "Jazzy"] * 50}
+
+    @classmethod
+    def post_create(cls):
+        parallel.PARALLEL_WORKERS = 2
+        parallel.PARALLEL_MIN_ROWS = 10
+
+    @classmethod
+    def tearDownClass(cls):
+        parallel.PARALLEL_WORKERS = None
+        parallel.PARALLEL_MIN_ROWS = 50000
+
+    def test_parallel_mode(self):
+        df = self.create_dataframe({"name": [f"name {i}" for i in range(100)]})
+        with mock.patch.object(parallel, "_get_executor", wraps=parallel._get_executor) as get_executor:
+            result = df.cols.apply("name", _upper, output_cols="upper", mode="parallel")
+            expected = df.cols.apply("name", _upper, output_cols="upper", mode="vectorized")
+            self.assertTrue(result.equals(expected, decimal=True, assertion=True))
+        # distributed engines apply the function to every partition instead
+        self.assertEqual(get_executor.called, self.config["engine"] == "pandas")
+
+    def test_date_formats(self):
+        df = self.create_dataframe({"date": ["2021-01-31", "2021-02-28", "31/01/2021", "28/02/2021"] * 5})
+        result = df.cols.date_formats("date", output_cols="format")
+        self.assertEqual(result.cols.select("format").to_dict(n=4)["format"],
+                         ["%Y-%m-%d", "%Y-%m-%d", "%d/%m/%Y", "%d/%m/%Y"])
+
+
+class TestParallelExecutorPandas(TestParallelPandas):
+
+    def test_not_picklable(self):
+        df = self.df.cols.apply("name", lambda series: series.str.upper(), output_cols="upper", mode="parallel")
+        self.assertEqual(df.cols.select("upper").to_dict(n=2)["upper"], ["OPTIMUS", "BUMBLEBEE"])
+
+    def test_workers_change(self):
+        series = self.df.data["name"]
+        parallel.apply_parallel(series, self.df.functions.soundex, workers=2)
+        self.assertEqual(parallel._executor_workers, 2)
+        parallel.apply_parallel(series, self.df.functions.soundex, workers=3)
+        self.assertEqual(parallel._executor_workers, 3)
+
+    def test_distinct_values(self):
+        calls = []
+
+        def upper(series):
+            calls.append(len(series))
+            return series.str.upper()
+
+        series = pd.Series(["a", "b", "c"] * 1000)
+        result = parallel.apply_parallel(series, upper)
+        self.assertEqual(calls, [3])
+        self.assertEqual(result.tolist(), ["A", "B", "C"] * 1000)
+
+
+class TestParallelLevenshteinPandas(TestParallelPandas):
+
+    def test_parallel_levenshtein(self):
+        df = self.df.cols.levenshtein("other", "name", output_cols="distance")
+        self.assertEqual(df.cols.select("distance").to_dict(n=6)["distance"], [5, 3, 2, 7, 0, 1])
+
+
+class TestParallelDask(TestParallelPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestParallelPartitionDask(TestParallelPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
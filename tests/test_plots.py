@@ -0,0 +1,68 @@
+from unittest import mock
+
+from optimus.plots import render
+from optimus.plots.functions import plot_boxplot
+from optimus.tests.base import TestBase
+
+
+class TestPlotsPandas(TestBase):
+    dict = {"a": [1.0, 2.5, 3.0, 4.0, 7.5, 9.0, 2.0, None, 6.0, 10.0],
+            "b": [3, 1, 4, 1, 5, 9, 2, 6, 5, 3],
+            "c": ["p", "q", "p", "r", None, "q", "p", "q", "r", "p"]}
+
+    def setUp(self):
+        super().setUp()
+        render.images_cache.clear()
+
+    def test_render_cache(self):
+        hist = self.df.cols.hist(["a", "b"], 4)["hist"]
+        jobs = {"a": ("hist", {"a": hist["a"]}, {}), "b": ("hist", {"b": hist["b"]}, {}),
+                "copy": ("hist", {"a": hist["a"]}, {})}
+
+        with mock.patch.object(render, "_render", side_effect=render._render) as _render:
+            images = render.render_base64(jobs, workers=1)
+            self.assertEqual(_render.call_count, 2)
+            self.assertEqual(render.render_base64(jobs, workers=1), images)
+            self.assertEqual(_render.call_count, 2)
+
+        self.assertEqual(images["a"], images["copy"])
+        self.assertNotEqual(images["a"], images["b"])
+        self.assertTrue(images["a"].startswith("iVBOR"))
+
+    def test_render_parallel(self):
+        frequency = self.df.cols.frequency("c", 3, tidy=False)["frequency"]
+        jobs = {i: ("hist", {"a": [{"lower": 0, "upper": 1, "count": i}]}, {}) for i in range(10)}
+        jobs["frequency"] = ("frequency", {"c": frequency["c"]}, {})
+
+        with mock.patch.object(render, "RENDER_MIN_IMAGES", 4):
+            images = render.render_base64(jobs, workers=2)
+
+        self.assertEqual(set(images), set(jobs))
+        self.assertTrue(all(image.startswith("iVBOR") for image in images.values()))
+        render.images_cache.clear()
+        self.assertEqual(render.render_base64({0: jobs[0]}, workers=1)[0], images[0])
+
+    def test_boxplot_stats(self):
+        stats = self.df.cols.boxplot("a")
+        plot_boxplot(stats, output="base64")
+        self.assertIn("whisker_low", stats["a"])
+        self.assertEqual(stats, self.df.cols.boxplot("a"))
+
+    def test_qqplot(self):
+        with mock.patch("optimus.plots.plots.plot_qqplot") as plot_qqplot:
+            self.df.plot.qqplot(["a", "b"], n=4)
+        self.assertEqual(plot_qqplot.call_count, 2)
+        data = plot_qqplot.call_args_list[0][0][0]
+        self.assertEqual(list(data["a"]), [0.125, 0.375, 0.625, 0.875])
+        self.assertEqual(list(data["a"].values()), sorted(data["a"].values()))
+
+        image = render.render_base64({"a": ("qqplot", data, {})})["a"]
+        self.assertTrue(image.startswith("iVBOR"))
+
+
+class TestPlotsDask(TestPlotsPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestPlotsPartitionDask(TestPlotsPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
@@ -0,0 +1,71 @@
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+from optimus.engines.base.dask import sort as dask_sort
+from optimus.tests.base import TestBase
+
+rng = np.random.default_rng(0)
+
+
+class TestPreviewPandas(TestBase):
+    dict = {"a": rng.integers(0, 1000, 100).tolist(), "b": rng.choice(["x", "y", "z"], 100).tolist()}
+
+    def setUp(self):
+        self.pdf = pd.DataFrame(self.dict)
+
+    def test_iloc(self):
+        for lower_bound, upper_bound in [(0, 10), (20, 60), (90, 120)]:
+            result = self.df.iloc(lower_bound, upper_bound).to_pandas()
+            self.assertEqual(result.values.tolist(), self.pdf[lower_bound:upper_bound].values.tolist())
+
+    def test_limit(self):
+        for count in [5, 40, 150]:
+            result = self.df.rows.limit(count).to_pandas()
+            self.assertEqual(result.values.tolist(), self.pdf.head(count).values.tolist())
+
+    def test_to_dict_window_cache(self):
+        df = self.df
+        self.assertEqual(df.to_dict("b", n=5), {"b": self.dict["b"][:5]})
+        window = df.cache["window"]
+        self.assertEqual(df.to_dict(n=5), {"a": self.dict["a"][:5], "b": self.dict["b"][:5]})
+        self.assertIs(df.cache["window"], window)
+
+        df.data = df.data
+        self.assertNotIn("window", df.cache)
+
+    def test_sort_limit_top(self):
+        for cols, ascending in [(["a"], [True]), (["a"], [False]), (["b", "a"], [False, False]),
+                                (["b", "a"], [True, False])]:
+            df = self.df.rows.sort(list(zip(cols, ["asc" if a else "desc" for a in ascending])))
+            result = df.rows.limit(12).to_pandas()
+            expected = self.pdf.sort_values(cols, ascending=ascending).head(12)
+            self.assertEqual(result[cols].values.tolist(), expected[cols].values.tolist())
+
+
+class TestPreviewDask(TestPreviewPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestPreviewPartitionDask(TestPreviewPandas):
+    config = {'engine': 'dask', 'n_partitions': 4}
+
+    def test_limit_stops_scanning(self):
+        @dask.delayed
+        def fail():
+            raise ValueError("this partition should not be computed")
+
+        meta = self.pdf[:0]
+        # partitions are computed in batches of 1, 2, 4...
+        partitions = [dask.delayed(self.pdf[:30]), dask.delayed(self.pdf[30:60]), dask.delayed(self.pdf[60:]),
+                      fail()]
+        df = self.df.new(dd.from_delayed(partitions, meta=meta, verify_meta=False))
+
+        self.assertEqual(df.rows.limit(80).to_pandas().values.tolist(), self.pdf.head(80).values.tolist())
+        self.assertEqual(df.to_dict(n=10), self.pdf.head(10).to_dict("list"))
+
+    def test_top_uses_nlargest(self):
+        top = dask_sort._top(self.pdf, ["a"], [False], {"a": "float"}, 5)
+        self.assertEqual(top["a"].tolist(), self.pdf["a"].nlargest(5).tolist())
+        self.assertEqual(top.index.tolist(), self.pdf["a"].nlargest(5).index.tolist())
@@ -0,0 +1,35 @@
+from optimus.tests.base import TestBase
+
+
+class TestQualityPandas(TestBase):
+    dict = {"id": [1, 2, 3, 4, 5, 6], "code": ["a", "b", None, "c", None, "d"],
+            "email": ["a@b.com", "x", "c@d.com", "y", "z", "e@f.com"], "price": [1.5, 2.5, 3.0, 4.0, 5.5, 6.5]}
+    types = {"id": "int", "code": "str", "email": "email", "price": "unknown"}
+    expected = {"id": {"match": 6, "missing": 0, "mismatch": 0, "inferred_data_type": "int"},
+                "code": {"match": 4, "missing": 2, "mismatch": 0, "inferred_data_type": "str"},
+                "email": {"match": 3, "missing": 0, "mismatch": 3, "inferred_data_type": "email"},
+                "price": {"match": 0, "missing": 0, "mismatch": 6, "inferred_data_type": "unknown"}}
+
+    def test_quality(self):
+        self.assertEqual(self.df.cols.quality(self.types, flush=True), self.expected)
+
+    def test_quality_delayed(self):
+        result = self.df.cols.quality(self.types, flush=True, compute=False)
+        self.assertEqual(self.df.functions.compute(result), self.expected)
+
+
+    def test_quality_delayed_does_not_mark_stats(self):
+        df = self.create_dataframe(self.dict, force_data_types=True)
+        # saves the stats in the meta data
+        df.cols.quality(self.types, flush=True)
+        df = df.cols.fill_na("code", "z")
+        df.cols.quality(self.types, compute=False)
+        self.assertEqual(df.cols.quality(self.types)["code"]["missing"], 0)
+
+
+class TestQualityDask(TestQualityPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestQualityPartitionDask(TestQualityPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
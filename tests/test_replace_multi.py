@@ -0,0 +1,28 @@
+from optimus.tests.base import TestBase
+
+
+class TestReplaceMultiPandas(TestBase):
+    dict = {"text": ["the cat and THE dog", "a catalog of cats", "an apple"]}
+
+    def test_replace_many_words(self):
+        df = self.df.cols.replace("text", ["the", "a", "an", "cat", "cats"], "_", "words")
+        expected = self.create_dataframe(data={"text": ["_ _ and THE dog", "_ catalog of _", "_ apple"]})
+        self.assertTrue(df.equals(expected, decimal=True, assertion=True))
+
+    def test_replace_many_words_ignore_case(self):
+        df = self.df.cols.replace("text", ["the", "dog"], "", "words", ignore_case=True)
+        expected = self.create_dataframe(data={"text": [" cat and  ", "a catalog of cats", "an apple"]})
+        self.assertTrue(df.equals(expected, decimal=True, assertion=True))
+
+    def test_replace_overlapping_chars(self):
+        df = self.df.cols.replace("text", ["cat", "catalog", "a"], "-", "chars")
+        expected = self.create_dataframe(data={"text": ["the - -nd THE dog", "- - of -s", "-n -pple"]})
+        self.assertTrue(df.equals(expected, decimal=True, assertion=True))
+
+
+class TestReplaceMultiDask(TestReplaceMultiPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestReplaceMultiPartitionDask(TestReplaceMultiPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
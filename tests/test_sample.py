@@ -0,0 +1,87 @@
+import pandas as pd
+
+from optimus.engines.base import sample
+from optimus.tests.base import TestBase
+
+
+class TestSamplePandas(TestBase):
+    dict = {"a": list(range(300)), "b": [str(i % 7) for i in range(300)]}
+
+    def setUp(self):
+        self.pdf = pd.DataFrame(self.dict)
+
+    def expected(self, n, seed):
+        keys = sample._keys(self.pdf, seed)
+        return self.pdf.iloc[keys.argsort(kind="stable")[:n]].reset_index(drop=True)
+
+    def test_sample(self):
+        result = self.df.sample(10).to_pandas()
+        self.assertTrue(result.equals(self.expected(10, 0)))
+
+        result = self.df.sample(10, random=7).to_pandas()
+        self.assertTrue(result.equals(self.expected(10, 7)))
+        self.assertTrue(result.equals(self.df.sample(10, random=7).to_pandas()))
+
+    def test_sample_all(self):
+        result = self.df.sample(500).to_pandas()
+        self.assertEqual(sorted(result["a"].tolist()), self.dict["a"])
+
+    def test_sample_block(self):
+        sample.BLOCK_SAMPLE_ROWS, rows = 1, sample.BLOCK_SAMPLE_ROWS
+        try:
+            result = self.df.sample(10, method="block").to_pandas()
+        finally:
+            sample.BLOCK_SAMPLE_ROWS = rows
+        self.assertEqual(len(result), 10)
+        self.assertEqual(len(set(result["a"])), 10)
+        self.assertTrue(result.equals(self.df.sample(10, method="block").to_pandas()))
+
+    def test_sample_errors(self):
+        with self.assertRaises(TypeError):
+            self.df.sample("10")
+        with self.assertRaises(ValueError):
+            self.df.sample(10, method="first")
+
+    def test_stratified_sample(self):
+        result = self.df.stratified_sample("b", 3).to_pandas()
+        self.assertEqual(result["b"].value_counts().tolist(), [3] * 7)
+        self.assertTrue(result.equals(self.df.stratified_sample("b", 3).to_pandas()))
+
+        keys = pd.Series(sample._keys(self.pdf, 1))
+        expected = self.pdf.assign(key=keys).sort_values(["b", "key"]).groupby("b").head(3)
+        self.assertEqual(result["a"].tolist(), expected["a"].tolist())
+
+    def test_infer_type(self):
+        result = self.df.cols.infer_type(sample_count=50)
+        self.assertEqual(result["a"]["data_type"], "int")
+
+    def test_nested_values(self):
+        df = self.create_dataframe({"a": [[1, 2], [3], []] * 10, "b": [{"x": 1}, {"y": 2}, {}] * 10})
+        self.assertEqual(len(df.sample(5).to_pandas()), 5)
+        result = df.cols.infer_type()
+        self.assertEqual((result["a"]["data_type"], result["b"]["data_type"]), ("list", "dict"))
+
+    def test_duplicated_values(self):
+        df = self.create_dataframe({"a": [1] * 101 + list(range(2, 101))})
+        for seed in range(5):
+            result = df.sample(10, random=seed).to_pandas()
+            # a sample of identical rows does not take all of them or none of them
+            self.assertTrue(0 < (result["a"] == 1).sum() < 10)
+
+        counts = [(df.sample(20, random=seed).to_pandas()["a"] == 1).sum() for seed in range(30)]
+        self.assertAlmostEqual(sum(counts) / len(counts), 20 * 101 / 200, delta=2)
+
+    def test_repeated_index(self):
+        # partitions read from files number their rows from 0 and their divisions are unknown
+        pdf = pd.DataFrame({"a": range(40)}, index=list(range(20)) * 2)
+        keys = [sample._keys(pdf.iloc[:20], 0), sample._keys(pdf.iloc[20:], 0, partition=1)]
+        self.assertFalse(set(keys[0]) & set(keys[1]))
+        self.assertEqual(len(set(sample._keys(pdf, 0))), 40)
+
+
+class TestSampleDask(TestSamplePandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestSamplePartitionDask(TestSamplePandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+
+from optimus.tests.base import TestBase
+
+rng = np.random.default_rng(0)
+
+
+class TestSortPandas(TestBase):
+    dict = {"a": rng.integers(0, 50, 300).tolist(), "b": rng.choice(["x", "y", "z"], 300).tolist(),
+            "c": rng.normal(0, 100, 300).round(2).tolist()}
+
+    def setUp(self):
+        self.pdf = pd.DataFrame(self.dict)
+
+    def assert_sorted(self, df, cols, ascending):
+        result = df.to_pandas()
+        expected = self.pdf.sort_values(cols, ascending=ascending)
+        self.assertEqual(result.columns.tolist(), self.pdf.columns.tolist())
+        self.assertEqual(result[cols].values.tolist(), expected[cols].values.tolist())
+        self.assertEqual(sorted(map(tuple, result.values.tolist())), sorted(map(tuple, self.pdf.values.tolist())))
+
+    def test_sort(self):
+        for order in ["asc", "desc"]:
+            self.assert_sorted(self.df.rows.sort("c", order), ["c"], order == "asc")
+
+    def test_sort_multiple(self):
+        df = self.df.rows.sort([("b", "asc"), ("a", "desc"), ("c", "asc")])
+        self.assert_sorted(df, ["b", "a", "c"], [True, False, True])
+
+        df = self.df.rows.sort([("a", "desc"), ("b", "asc")], cast=False)
+        self.assert_sorted(df, ["a", "b"], [False, True])
+
+    def test_sort_cast(self):
+        # mixed values are compared as strings, the column is not modified
+        df = self.create_dataframe({"n": [10, "9", None, 100, "b"]})
+        self.assertEqual(df.rows.sort("n", "asc").to_pandas()["n"].tolist(), [10, 100, "9", "b", None])
+        self.assertEqual(df.rows.sort("n", "desc").to_pandas()["n"].tolist(), ["b", "9", 100, 10, None])
+
+    def test_sort_limit(self):
+        df = self.df.rows.sort([("a", "desc"), ("c", "asc")])
+        result = df.rows.limit(15).to_pandas()
+        expected = self.pdf.sort_values(["a", "c"], ascending=[False, True]).head(15)
+        self.assertEqual(result.values.tolist(), expected.values.tolist())
+
+        # the rows of a modified dataframe are not taken from the sort
+        result = df.cols.upper("b").rows.limit(15).to_pandas()
+        self.assertEqual(result["b"].tolist(), expected["b"].str.upper().tolist())
+
+
+class TestSortDask(TestSortPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestSortPartitionDask(TestSortPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
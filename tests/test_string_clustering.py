@@ -0,0 +1,87 @@
+from unittest import mock
+
+import pandas as pd
+
+from optimus.helpers import decorators
+from optimus.tests.base import TestBase
+
+
+class TestStringClusteringPandas(TestBase):
+    dict = {"a": ["  Hello World!", "world  hello", "HÉLLO, wörld", None, "b a b", "world  hello", 12]}
+
+    def test_fingerprint(self):
+        result = self.df.cols.fingerprint("a").to_dict()["a"]
+        self.assertTrue(pd.isna(result.pop(3)))
+        self.assertEqual(result, ["hello world", "hello world", "hello world", "a b", "hello world", "12"])
+
+    def test_ngram_fingerprint(self):
+        result = self.df.cols.ngram_fingerprint("a", output_cols="b").to_dict()["b"]
+        self.assertTrue(pd.isna(result.pop(3)))
+        self.assertEqual(result, ["elheldllloorowrlwo", "dhelheldllloorrlwo", "elheldllloorowrlwo", "abba",
+                                  "dhelheldllloorrlwo", "12"])
+        self.assertEqual(self.df.cols.ngram_fingerprint("a", 3).to_dict()["a"][4], "bab")
+
+    def test_unicode_keys(self):
+        df = self.create_dataframe({"a": ["«Hello»\u00a0world—", "\tworld\nhello ", "¿hello… “world”?"]})
+        self.assertEqual(df.cols.fingerprint("a").to_dict()["a"], ["hello world"] * 3)
+        self.assertEqual(df.cols.ngram_fingerprint("a").to_dict()["a"], ["elheldllloorowrlwo",
+                                                                         "dhelheldllloorrlwo",
+                                                                         "elheldllloorowrlwo"])
+
+    def test_ngrams(self):
+        df = self.create_dataframe({"a": ["b a b", "ab"]})
+        self.assertEqual(df.cols.ngrams("a", 4, output_cols="b").to_dict()["b"], [["b a ", " a b"], []])
+
+    def test_string_clustering(self):
+        result = self.df.string_clustering("a").to_dict(verbose=True)["a"]
+        self.assertEqual(list(result), ["hello world", "12", "a b"])
+        self.assertEqual(result["hello world"], {"suggestion": "world  hello", "total_count": 4,
+                                                 "suggestions": ["world  hello", "  Hello World!", "HÉLLO, wörld"],
+                                                 "suggestions_size": 3})
+
+    def test_limit(self):
+        clusters = self.df.string_clustering("a", limit=2)
+        self.assertEqual(list(clusters.to_dict(verbose=True)["a"]), ["hello world", "12"])
+        self.assertEqual(clusters.clusters["a"]["value"].tolist(),
+                         ["world  hello", "  Hello World!", "HÉLLO, wörld", "12"])
+
+        clusters = self.df.string_clustering("a", limit=None)
+        self.assertEqual(len(clusters.to_dict(verbose=True)["a"]), 3)
+
+    def test_suggestions(self):
+        clusters = self.df.string_clustering("a")
+        clusters.set_suggestion("hello world", "Hello world")
+        clusters.set_suggestion(2, "a-b")
+        self.assertEqual(clusters.to_dict(limit_suggestions=2),
+                         {"a": {"Hello world": ["world  hello", "  Hello World!"], "12": ["12"], "a-b": ["b a b"]}})
+        with self.assertRaises(ValueError):
+            clusters.set_suggestion("x", "y")
+
+        result = self.df.cols.replace(clusters).to_dict()["a"]
+        self.assertEqual(result[:3], ["Hello world"] * 3)
+        self.assertEqual(result[4], "a-b")
+
+    def test_levenshtein(self):
+        df = self.create_dataframe({"a": ["cat", "cut", "dog"]})
+        result = df.string_clustering("a", "levenshtein").to_dict(verbose=True)["a"]
+        self.assertEqual(result["cat"]["suggestions"], ["cat", "cut"])
+        self.assertEqual(result["dog"]["total_count"], 3)
+
+    def test_distinct_values(self):
+        df = self.create_dataframe({"a": ["Foo  bar", "bar foo", "baz"] * 400})
+        decorators.uniques_cache.clear()
+        with mock.patch.object(df.functions.__class__, "_normalize_key", autospec=True,
+                               side_effect=df.functions.__class__._normalize_key) as normalize:
+            result = df.cols.fingerprint("a").to_dict(n="all")["a"]
+        self.assertEqual(result[:3], ["bar foo", "bar foo", "baz"])
+        self.assertEqual(len(result), 1200)
+        for call in normalize.call_args_list:
+            self.assertLessEqual(len(call.args[1]), 3)
+
+
+class TestStringClusteringDask(TestStringClusteringPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestStringClusteringPartitionDask(TestStringClusteringPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
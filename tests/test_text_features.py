@@ -0,0 +1,61 @@
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from optimus.tests.base import TestBase
+
+
+class TestTextFeaturesPandas(TestBase):
+    dict = {"text": ["the cat sat", "the dog ran far", None, "a cat and a dog", "far far away"] * 4,
+            "other": ["cat", "dog", "bird", "fish", "cat"] * 4}
+
+    def dense(self, df):
+        return df.to_pandas().sparse.to_dense().values
+
+    def test_tf_idf(self):
+        texts = [text or "" for text in self.dict["text"]]
+        vectorizer = TfidfVectorizer()
+        expected = vectorizer.fit_transform(texts).toarray()
+
+        df = self.df.cols.tf_idf("text")
+        self.assertEqual(df.cols.names(), vectorizer.get_feature_names_out().tolist())
+        self.assertTrue(all(str(dtype).startswith("Sparse") for dtype in df.cols.data_type(tidy=False)["data_type"]
+                            .values()))
+        self.assertTrue(np.allclose(self.dense(df), expected))
+
+        matrix = self.df.cols.tf_idf("text", output="matrix")
+        self.assertTrue(sparse.isspmatrix_csr(matrix))
+        self.assertTrue(np.allclose(matrix.toarray(), expected))
+
+    def test_bag_of_words(self):
+        texts = [text for text in self.dict["text"] if text]
+        vectorizer = CountVectorizer(ngram_range=(1, 2))
+        expected = vectorizer.fit_transform(texts).toarray()
+
+        df = self.df.cols.bag_of_words("text", ngram_range=(1, 2))
+        self.assertEqual(df.cols.names(), vectorizer.get_feature_names_out().tolist())
+        self.assertTrue(np.allclose(self.dense(df), expected))
+
+    def test_hashing(self):
+        texts = [text for text in self.dict["text"] if text]
+        expected = CountVectorizer().fit_transform(texts).toarray()
+
+        matrix = self.df.cols.bag_of_words("text", ngram_range=1, hashing=True, n_features=2 ** 10,
+                                           output="matrix")
+        self.assertEqual(matrix.shape, (len(texts), 2 ** 10))
+        self.assertEqual(matrix.sum(), expected.sum())
+
+        df = self.df.cols.bag_of_words("text", ngram_range=1, hashing=True, n_features=2 ** 10)
+        self.assertTrue(np.allclose(self.dense(df), matrix[:, np.unique(matrix.indices)].toarray()))
+        self.assertTrue(all(name.startswith("hash_") for name in df.cols.names()))
+
+        df = self.df.cols.tf_idf(["text", "other"], hashing=True)
+        self.assertTrue(np.allclose(np.linalg.norm(self.dense(df), axis=1), 1))
+
+
+class TestTextFeaturesDask(TestTextFeaturesPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestTextFeaturesPartitionDask(TestTextFeaturesPandas):
+    config = {'engine': 'dask', 'n_partitions': 3}
@@ -0,0 +1,73 @@
+from optimus.tests.base import TestBase
+
+
+class TestTimingsPandas(TestBase):
+    dict = {"name": ["Foo", "bar", "Baz"], "price": [3.0, 1.55, 2.25]}
+
+    def test_timings_events(self):
+        received = []
+        with self.op.timings(received.append) as events:
+            df = self.df.cols.upper("name").rows.sort("price")
+
+        self.assertEqual([event["operation"] for event in events], ["cols.upper", "rows.sort"])
+        self.assertEqual(received, events)
+        # only the operation that created the dataframe is saved in the meta data
+        self.assertEqual(df.meta["timings"]["operation"], "rows.sort")
+        for event in events:
+            self.assertGreaterEqual(event["wall_time"], 0)
+            self.assertGreaterEqual(event["cpu_time"], 0)
+
+    def test_timings_nested(self):
+        outer_received = []
+        with self.op.timings(outer_received.append) as outer:
+            self.df.cols.upper("name")
+            with self.op.timings() as inner:
+                self.df.cols.lower("name")
+            self.assertTrue(self.op.timings.active)
+            self.df.rows.sort("price")
+
+        self.assertFalse(self.op.timings.active)
+        self.assertEqual([event["operation"] for event in inner], ["cols.lower"])
+        self.assertEqual([event["operation"] for event in outer], ["cols.upper", "cols.lower", "rows.sort"])
+        self.assertEqual(outer_received, outer)
+
+    def test_timings_profile(self):
+        # the data type is set so the profile does not need to infer it
+        df = self.df.cols.set_data_type({"price": "float"})
+        with self.op.timings() as events:
+            df.profile("price")
+
+        self.assertEqual([event["operation"] for event in events], ["profile"])
+        self.assertIn("details", events[0])
+
+    def test_timings_memory(self):
+        with self.op.timings() as events:
+            self.df.cols.upper("name")
+        self.assertNotIn("peak_memory", events[0])
+
+        with self.op.timings(memory=True) as events:
+            self.df.cols.upper("name")
+        self.assertGreater(events[0]["peak_memory"], 0)
+
+    def test_timings_attributes(self):
+        # reading attributes of an accessor does not go through the timings
+        cols = self.df.cols
+        self.assertNotIn("__getattribute__", type(cols).__dict__)
+        with self.op.timings() as events:
+            self.assertIs(cols.root, self.df)
+            self.df.rows.count()
+        self.assertEqual([event["operation"] for event in events], ["rows.count"])
+
+    def test_timings_inactive(self):
+        df = self.df.cols.upper("name")
+
+        self.assertFalse(self.op.timings.active)
+        self.assertNotIn("timings", df.meta)
+
+
+class TestTimingsDask(TestTimingsPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestTimingsPartitionDask(TestTimingsPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}
@@ -0,0 +1,98 @@
+import threading
+import warnings
+
+import pandas as pd
+
+from optimus.helpers import decorators
+from optimus.tests.base import TestBase
+
+
+class TestUniquesPandas(TestBase):
+    dict = {"name": ["Optimus", "Bumblebee", "Eject", "Ratchet", "Megatron", "Jazz", None, "Optimus"] * 200,
+            "url": ["https://www.optimus.com/path/file.csv?id=1", "http://docs.bumblebee.com:8080/index.html",
+                    "https://www.optimus.com/path/file.csv?id=1", "ftp://files.eject.org/data.txt"] * 400}
+
+    def tearDown(self):
+        decorators.UNIQUES_MIN_ROWS = 1000
+        decorators.uniques_cache.clear()
+
+    def assert_same_as_direct(self, method, col="name"):
+        df = getattr(self.df.cols, method)(col, output_cols="result")
+        decorators.UNIQUES_MIN_ROWS = float("inf")
+        expected = getattr(self.df.cols, method)(col, output_cols="result")
+        self.assertEqual(df.cols.select("result").to_dict(n="all"), expected.cols.select("result").to_dict(n="all"))
+
+    def test_soundex(self):
+        self.assert_same_as_direct("soundex")
+
+    def test_metaphone(self):
+        self.assert_same_as_direct("metaphone")
+
+    def test_nysiis(self):
+        self.assert_same_as_direct("nysiis")
+
+    def test_domain(self):
+        self.assert_same_as_direct("domain", "url")
+
+    def test_url_path(self):
+        self.assert_same_as_direct("url_path", "url")
+
+    def test_cache(self):
+        df = self.df.cols.soundex("name", output_cols="result")
+        self.assertEqual(df.cols.select("result").to_dict(n=2)["result"], ["O135", "B514"])
+        if self.config["engine"] == "pandas":
+            # dask evaluates the partitions in the workers
+            self.assertEqual(decorators.uniques_cache.get((("BaseFunctions.soundex", (), ()), str, "Optimus")), "O135")
+
+
+    def test_types_not_mixed(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", FutureWarning)
+            ints = pd.Series([1, 2] * 1000, dtype=object)
+            floats = pd.Series([1.0, 2.0] * 1000, dtype=object)
+            mixed = pd.Series([1, 1.0, True, None] * 500, dtype=object)
+            self.assertEqual(decorators.evaluate_on_uniques(ints, lambda s: s.astype(str), "str")[0], "1")
+            self.assertEqual(decorators.evaluate_on_uniques(floats, lambda s: s.astype(str), "str")[0], "1.0")
+            self.assertEqual(decorators.evaluate_on_uniques(mixed, lambda s: s.astype(str), "str")[:4].tolist(),
+                             ["1", "1.0", "True", "None"])
+
+    def test_clustered_values(self):
+        # the first rows are all different but most of the series is one value
+        series = pd.Series([f"value {i}" for i in range(decorators.UNIQUES_SAMPLE_SIZE)] + ["x"] * 40000)
+        calls = []
+
+        def func(values):
+            calls.append(len(values))
+            return values.str.upper()
+
+        result = decorators.evaluate_on_uniques(series, func)
+        self.assertEqual(calls, [decorators.UNIQUES_SAMPLE_SIZE + 1])
+        self.assertEqual(result.iloc[-1], "X")
+
+    def test_cache_threads(self):
+        cache = decorators.UniquesCache(maxsize=10)
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(5000):
+                    cache.set((offset, i), i)
+                    cache.get((offset, i - 1))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(cache.data), 10)
+
+
+class TestUniquesDask(TestUniquesPandas):
+    config = {'engine': 'dask', 'n_partitions': 1}
+
+
+class TestUniquesPartitionDask(TestUniquesPandas):
+    config = {'engine': 'dask', 'n_partitions': 2}